@@ -0,0 +1,401 @@
+"""
+Headless render benchmark.
+
+Runs VocabGameGUI with SDL's dummy video and audio drivers and drives every
+screen through a fixed number of frames, timing update() + draw() per frame.
+Each screen is timed BENCH_RUNS times and the median of each percentile is
+reported, so one noisy pass doesn't decide the result. Reports p50/p95/p99
+frame times and Python allocations per screen, and exits with status 1 when
+a screen's p95 frame time or per-frame allocation peak exceeds its budget in
+BENCH_BUDGETS. The allocation figure is the median frame's peak, so
+occasional work like the save index poll doesn't fail it.
+
+No Anki or network access is needed: the deck is synthetic, games are
+started as missed-word drills, and saves go to a temporary directory.
+
+Usage:
+    python benchmark.py [--frames N] [--runs N] [--only NAME ...] [--budget NAME=MS ...] [--json PATH]
+
+Budgets are machine-specific; override them with --budget or edit
+BENCH_BUDGETS for the machine the benchmark gates on.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Must be set before pygame creates the window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+from config import *
+
+
+FRAME_DT = 1 / FPS_ACTIVE  # Simulated time per frame, so runs are repeatable
+REVIEW_ITEMS = 500
+
+
+def make_cards(count):
+    """
+    Build a synthetic deck with a spread of card maturities.
+
+    Args:
+        count: Number of cards
+
+    Returns:
+        List of card dicts shaped like AnkiConnect's cardsInfo
+    """
+    kanji = "日本語漢字読書学生先時間電車会社新聞天気勉強料理映画音楽"
+    return [{
+        'cardId': 1000 + i,
+        'question': kanji[i % len(kanji)] + kanji[(i * 7) % len(kanji)],
+        'type': i % 3,
+        'interval': (i * 5) % 60
+    } for i in range(count)]
+
+
+def make_incorrect_answers(count):
+    """
+    Build a review list of missed words.
+
+    Args:
+        count: Number of missed answers
+
+    Returns:
+        List of incorrect answer dicts as recorded by animate_incorrect
+    """
+    words = [card['question'] for card in make_cards(count)]
+    return [{
+        'word': word,
+        'correct_reading': 'にほんご / にっぽんご',
+        'your_answer': 'にほん',
+        'readings': ['にほんご', 'にっぽんご'],
+        'meanings': ['Japanese language', 'Japanese'],
+        'card_id': 1000 + i
+    } for i, word in enumerate(words)]
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a sorted list."""
+    index = min(len(samples) - 1, max(0, int(round(pct / 100 * len(samples))) - 1))
+    return samples[index]
+
+
+class Benchmark:
+    """Drives one game instance through each screen and records frame times."""
+
+    def __init__(self, frames, runs=BENCH_RUNS):
+        """
+        Args:
+            frames: Frames timed per screen in each pass
+            runs: Timed passes per screen
+        """
+        from ui.game_gui import VocabGameGUI
+
+        self.frames = frames
+        self.runs = runs
+        self.game = VocabGameGUI(make_cards(REVIEW_ITEMS), 'Benchmark')
+        self.game.all_cards = list(self.game.cards)
+        self.game.maturity_counts = None
+        self.results = {}
+
+    def run(self, only=None):
+        """
+        Run every scenario in order.
+
+        Args:
+            only: Scenario names to run, or None for all
+
+        Returns:
+            Dict of scenario name -> result dict
+        """
+        game = self.game
+        # Warm the glyph atlas so its build doesn't land in the first screen
+        while game.glyphs.pending:
+            game.glyphs.build_step()
+
+        for name, setup, per_frame in self.scenarios():
+            setup()
+            if only and name not in only:
+                continue
+            self.results[name] = self.measure(per_frame)
+        return self.results
+
+    def scenarios(self):
+        """
+        List the screens to measure.
+
+        Setups run in order even for skipped scenarios, since later screens
+        are reached through earlier ones.
+
+        Returns:
+            List of (name, setup function, per-frame function or None)
+        """
+        game = self.game
+
+        def enter(state):
+            def setup():
+                game.state = state
+            return setup
+
+        def start_drill():
+            game.incorrect_answers = make_incorrect_answers(REVIEW_ITEMS)
+            game.start_retry_drill()
+
+        def hold_countdown(i):
+            # Stay on "3", "2", "1" instead of starting the game
+            game.countdown_start = pygame.time.get_ticks() - (i * 16) % (COUNTDOWN_DURATION * 1000 - 100)
+
+        def start_playing():
+            game.state = STATE_PLAYING
+            game.load_next_word()
+            game.input_text = 'にほ'
+
+        def playing_at(streak):
+            def setup():
+                game.streak = streak
+                game.animate_correct()
+
+            def per_frame(i):
+                if i % 60 == 0:
+                    game.animate_correct()
+                # Keep the particle system at its cap
+                missing = PARTICLE_MAX_COUNT - len(game.particles)
+                if missing > 0:
+                    game.particles.emit_scatter(missing, game.width, game.height, game.correct_color,
+                                                (-150, 150), (-200, -50), (0.5, 1.5), (3, 8))
+            return setup, per_frame
+
+        def redraw(i):
+            # Static screens only redraw on input; measure the redraw
+            game.damage.invalidate()
+
+        def scroll_review(i):
+            game.review_scroll = (i * 30) % (REVIEW_ITEMS * 60)
+            game.damage.invalidate()
+
+        def clear_effects():
+            # Particles keep simulating off the playing screen; the streak
+            # scenarios' leftovers would be measured as this screen's work
+            game.particles.clear()
+            game.screen_shake_intensity = 0
+
+        def pause():
+            clear_effects()
+            game.pause_game()
+
+        def end_game():
+            clear_effects()
+            game.show_final_score()
+
+        scenarios = [
+            ('menu', enter(STATE_MENU), None),
+            ('filter', enter(STATE_FILTER_SELECT), None),
+            ('mode_select', enter(STATE_MODE_SELECT), None),
+            ('countdown', start_drill, hold_countdown),
+            ('playing', start_playing, None),
+        ]
+        for streak in (0, 5, 10, 15):
+            setup, per_frame = playing_at(streak)
+            scenarios.append((f'playing_streak{streak}', setup, per_frame))
+        scenarios += [
+            ('paused', pause, redraw),
+            ('game_over', end_game, redraw),
+            ('review', enter(STATE_REVIEW_INCORRECT), scroll_review),
+        ]
+        return scenarios
+
+    def measure(self, per_frame):
+        """
+        Time frames on the current screen, then trace their allocations.
+
+        Args:
+            per_frame: Function called with the frame index before each frame, or None
+
+        Returns:
+            Dict with p50/p95/p99 in ms (the median over the passes), max
+            in ms (over all passes), the median of each frame's allocation
+            peak in KB and memory blocks retained per frame
+        """
+        game = self.game
+        pygame.event.pump()
+        # Untimed frames first, so one-off cache builds don't count
+        for i in range(BENCH_WARMUP_FRAMES):
+            if per_frame:
+                per_frame(i)
+            game.update(FRAME_DT)
+            game.draw()
+
+        passes = []
+        timed = self.frames * self.runs
+        for i in range(timed):
+            if i % self.frames == 0:
+                times = []
+                passes.append(times)
+            if per_frame:
+                per_frame(i)
+            start = time.perf_counter()
+            game.update(FRAME_DT)
+            game.draw()
+            times.append((time.perf_counter() - start) * 1000)
+        for times in passes:
+            times.sort()
+
+        # Allocations in a separate pass; tracing slows the frames down
+        traced = max(1, self.frames // 5)
+        peaks = []
+        blocks_before = sys.getallocatedblocks()
+        tracemalloc.start()
+        for i in range(traced):
+            if per_frame:
+                per_frame(timed + i)
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            game.update(FRAME_DT)
+            game.draw()
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+        tracemalloc.stop()
+        blocks = (sys.getallocatedblocks() - blocks_before) / traced
+        pygame.event.clear()
+
+        def median_pass(pct):
+            return percentile(sorted(percentile(times, pct) for times in passes), 50)
+
+        return {
+            'p50': median_pass(50),
+            'p95': median_pass(95),
+            'p99': median_pass(99),
+            'max': max(times[-1] for times in passes),
+            'alloc_kb': percentile(sorted(peaks), 50) / 1024,
+            'blocks_per_frame': blocks
+        }
+
+
+class BlitRecorder:
+    """Stands in for a surface and records where sprites are blitted."""
+
+    def __init__(self):
+        self.positions = []
+
+    def blits(self, blit_sequence, doreturn=True):
+        self.positions.extend(dest for _, dest in blit_sequence)
+
+
+def check_particle_interpolation():
+    """
+    Check that particles are drawn between their last two simulated
+    positions, so the fixed-timestep interpolation isn't skewed.
+
+    Returns:
+        List of failure messages
+    """
+    from ui.particles import ParticleSystem, MAX_RADIUS
+
+    particles = ParticleSystem(capacity=1)
+    particles.emit(100, 200, 600, 0, 10.0, 4, (255, 255, 255), gravity=0.0)
+    particles.update(1 / 60)  # x: 100 -> 110
+    failures = []
+    for alpha, expected_x in ((0.0, 100), (0.5, 105), (1.0, 110)):
+        recorder = BlitRecorder()
+        particles.draw(recorder, alpha)
+        left, top = recorder.positions[0]
+        radius = min(4, MAX_RADIUS)
+        if (left + radius, top + radius) != (expected_x, 200):
+            failures.append(f"particles: drawn at x={left + radius} for alpha {alpha}, expected {expected_x}")
+    return failures
+
+
+def check_budgets(results, budgets):
+    """
+    Compare results against budgets.
+
+    Args:
+        results: Dict of scenario name -> result dict
+        budgets: Dict of scenario name -> (p95 ms, allocation KB)
+
+    Returns:
+        List of failure messages
+    """
+    failures = []
+    for name, result in results.items():
+        if name not in budgets:
+            continue
+        ms_budget, kb_budget = budgets[name]
+        if result['p95'] > ms_budget:
+            failures.append(f"{name}: p95 {result['p95']:.2f} ms over budget {ms_budget:.2f} ms")
+        if result['alloc_kb'] > kb_budget:
+            failures.append(f"{name}: {result['alloc_kb']:.0f} KB allocated in a frame, budget {kb_budget} KB")
+    return failures
+
+
+def print_report(results, budgets):
+    """Print a table of results."""
+    print(f"\n{'screen':<18}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}{'budget':>8}"
+          f"{'alloc KB':>10}{'budget':>8}{'blocks/f':>10}")
+    for name, r in results.items():
+        ms_budget, kb_budget = budgets.get(name, (None, None))
+        ms_text = f"{ms_budget:.1f}" if ms_budget is not None else "-"
+        kb_text = f"{kb_budget}" if kb_budget is not None else "-"
+        print(f"{name:<18}{r['p50']:>8.2f}{r['p95']:>8.2f}{r['p99']:>8.2f}{r['max']:>8.2f}{ms_text:>8}"
+              f"{r['alloc_kb']:>10.1f}{kb_text:>8}{r['blocks_per_frame']:>10.1f}")
+
+
+def parse_budget(text):
+    """Parse a NAME=MS budget override."""
+    name, _, ms = text.partition('=')
+    try:
+        return name, float(ms)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=MS, got {text!r}")
+
+
+def main():
+    """Run the benchmark and return the process exit status."""
+    parser = argparse.ArgumentParser(description="Headless frame-time benchmark for every screen.")
+    parser.add_argument('--frames', type=int, default=BENCH_FRAMES, help="frames timed per screen in each pass")
+    parser.add_argument('--runs', type=int, default=BENCH_RUNS, help="timed passes per screen; the median is gated")
+    parser.add_argument('--only', nargs='+', metavar='NAME', help="only measure these screens")
+    parser.add_argument('--budget', nargs='+', type=parse_budget, default=[], metavar='NAME=MS',
+                        help="override a screen's p95 budget")
+    parser.add_argument('--json', metavar='PATH', help="also write results as JSON")
+    args = parser.parse_args()
+
+    budgets = dict(BENCH_BUDGETS)
+    for name, ms in args.budget:
+        budgets[name] = (ms, budgets.get(name, (None, float('inf')))[1])
+
+    # Saves, journals and scores go to a scratch directory
+    workdir = tempfile.mkdtemp(prefix='vocab_bench_')
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        pygame.init()
+        results = Benchmark(args.frames, args.runs).run(args.only)
+        pygame.quit()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_report(results, budgets)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'frames': args.frames, 'runs': args.runs, 'budgets': budgets, 'results': results}, f, indent=2)
+
+    failures = check_particle_interpolation() + check_budgets(results, budgets)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        return 1
+    print("All screens within budget, particle interpolation OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,16 @@ Configuration and constants for the Japanese Vocabulary Game.
 
 # AnkiConnect settings
 ANKI_CONNECT_URL = "http://localhost:8765"
-SAVE_FILE = "vocab_game_save.json"
+SAVE_FILE = "vocab_game_save.json"  # Single-slot save from older versions, migrated into SAVE_DIR
+JOURNAL_FILE = "vocab_game_save.journal"
+DECK_SNAPSHOT_FILE = "vocab_game_deck_snapshot.json"
+SAVE_COMPRESS = True  # gzip save files and the deck snapshot
+JOURNAL_COMPACT_INTERVAL = 50  # Journal entries between checkpoints
+JOURNAL_FSYNC = True  # Flush each journal entry to disk (survives power loss)
+SAVE_DIR = "vocab_game_saves"
+SAVE_INDEX_FILE = "index.json"
+SAVE_SLOT_COUNT = 3
+SAVE_INDEX_POLL_INTERVAL = 2.0  # seconds between save index mtime checks
 SCORES_FILE = "vocab_game_scores.csv"
 
 # Game states
@@ -20,6 +29,24 @@ STATE_PAUSED = 'paused'
 STATE_LEADERBOARD = 'leaderboard'
 STATE_GAME_OVER = 'game_over'
 STATE_REVIEW_INCORRECT = 'review_incorrect'
+# States with no animation; redrawn only when input changes them
+STATIC_STATES = (STATE_LEADERBOARD, STATE_PAUSED, STATE_GAME_OVER, STATE_REVIEW_INCORRECT)
+
+# Frame pacing
+FPS_ACTIVE = 60  # Gameplay and countdown
+FPS_AMBIENT = 30  # Menus and loading screens, which only animate the background
+STATE_FRAME_RATES = {STATE_PLAYING: FPS_ACTIVE, STATE_COUNTDOWN: FPS_ACTIVE}  # Others use FPS_AMBIENT
+IDLE_WAIT_TIMEOUT = 1000  # ms a static screen sleeps waiting for events
+SIMULATION_RATE = 60  # Fixed simulation steps per second (particles, word zoom, shake, streak fire)
+MAX_SIMULATION_STEPS = 12  # Steps run per frame at most; time beyond that after a stall is dropped
+SIMULATION_SEED = None  # Seed for effect randomness; set it for reproducible runs
+
+# Frame profiler (F3 toggles the overlay, F4 exports a trace)
+PROFILER_ENABLED = False  # Record frame phases from startup; showing the overlay starts recording anyway
+PROFILER_HISTORY = 600  # Frames kept in the profiler's ring buffer
+PROFILER_TRACE_FILE = "vocab_game_trace.json"  # Chrome trace event output for F4
+STARTUP_TARGET_MS = 500  # --profile-startup target from process start to the first loading-screen frame
+STARTUP_PROFILE_TOP = 15  # Slowest functions listed by --profile-startup
 
 # Game settings
 DEFAULT_DECK_NAME = "日本語::Mining"
@@ -40,6 +67,8 @@ STREAK_MULTIPLIER_STEP = 0.1
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 650
 WINDOW_TITLE = "Japanese Vocabulary Quiz"
+RENDER_MODE = 'native'  # 'native' lays out at window size; 'scaled' draws at WINDOW_WIDTH x WINDOW_HEIGHT and scales to the window
+RENDER_SCALE_QUALITY = 'smooth'  # 'smooth' (smoothscale) or 'fast' (nearest-neighbour) when scaling to the window
 
 # Colors (RGB)
 COLOR_BG = (44, 62, 80)  # #2C3E50
@@ -54,7 +83,65 @@ COLOR_GOLD = (255, 215, 0)
 COLOR_ORANGE = (255, 140, 0)
 
 # Font settings
-JAPANESE_FONTS = ['msgothic', 'meiryo', 'yugothic', 'msmincho', 'Arial Unicode MS']
+JAPANESE_FONTS = ['msgothic', 'meiryo', 'yugothic', 'msmincho', 'Arial Unicode MS']  # System font names tried after fontconfig and known font files
+FONT_CACHE_FILE = "vocab_game_font_cache.json"  # Resolved Japanese font path, keyed by font directory mtimes
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept by the LRU text cache
+TEXT_LAYOUT_CACHE_SIZE = 64  # Word-wrapped texts kept with their line surfaces
+LAYER_CACHE_SIZE = 32  # Pre-rendered static screen layers (one per screen and hover state)
+REVIEW_ROW_CACHE_SIZE = 64  # Rendered rows kept by the review list
+WORD_BASE_SIZE = 90  # Point size of the quiz word at full zoom
+WORD_ZOOM_QUALITY = 'smooth'  # 'smooth' (smoothscale) or 'fast' (nearest-neighbour)
+WORD_ZOOM_SIZE_STEP = 2  # Zoom sizes are cached in buckets of this many points
+WORD_ZOOM_SPEED = 0.06  # Zoom progress per second while a word waits for an answer
+COUNTDOWN_SIZE = 200  # Point size of the countdown digit at the top of its pulse
+COUNTDOWN_SIZE_STEP = 10  # Pulsing digit sizes are cached in buckets of this many points
+GLYPH_ATLAS_SIZES = (WORD_BASE_SIZE, 56, 36, 32, 24)  # Japanese text sizes pre-built from the deck
+GLYPH_ATLAS_BUILD_BUDGET = 64  # Glyphs rasterized per frame while building the atlas
+GLYPH_TEXT_CACHE_SIZE = 128  # Composed Japanese strings kept by the glyph atlas
+
+# Sound settings
+SOUND_VOLUME = 0.8  # Peak amplitude of synthesized cues, 0.0-1.0
+SOUND_ATTACK = 0.005  # seconds of fade-in on each cue, so it doesn't click
+SOUND_RELEASE = 0.03  # seconds of fade-out on each cue
+STREAK_LADDER_STEPS = 12  # Semitones the streak cue climbs, one per streak past 5
+
+# Particle settings
+PARTICLE_MAX_COUNT = 10000  # Live particle cap; further emits are dropped
+PARTICLE_ALPHA_LEVELS = 16  # Fade steps pre-rendered per particle sprite
+PARTICLE_ROTATION_STEPS = 12  # Rotation steps pre-rendered per star sprite
+AMBIENT_ALPHA_STEP = 4  # Background dot alpha is snapped to multiples of this
+AMBIENT_BAKE_LAYERS = False  # Scroll pre-drawn dot layers instead of twinkling each dot (pays off only for dense fields)
+
+# Effect quality
+QUALITY_PRESET = 'high'  # 'low', 'medium' or 'high'; ceilings for the effect budgets below
+QUALITY_PRESETS = {  # Multipliers for particle burst counts, star bursts, fire spawn chance, background dots, shake
+    'low': {'particles': 0.25, 'stars': 0.0, 'fire': 0.25, 'dots': 0.25, 'shake': 0.5},
+    'medium': {'particles': 0.5, 'stars': 0.5, 'fire': 0.5, 'dots': 0.5, 'shake': 0.75},
+    'high': {'particles': 1.0, 'stars': 1.0, 'fire': 1.0, 'dots': 1.0, 'shake': 1.0},
+}
+GOVERNOR_ENABLED = True  # Scale effects below the preset while gameplay frames run over budget
+GOVERNOR_TARGET_FPS = FPS_ACTIVE  # Frame rate the governor protects
+GOVERNOR_MIN_SCALE = 0.1  # Lowest fraction of the preset's effects the governor scales down to
+GOVERNOR_WINDOW = 30  # Frames observed between adjustments
+
+# Benchmark (benchmark.py) settings
+BENCH_FRAMES = 300  # Frames timed per screen
+BENCH_WARMUP_FRAMES = 10  # Untimed frames run first on each screen
+BENCH_RUNS = 3  # Timed passes per screen; budgets are checked against the median pass
+BENCH_BUDGETS = {  # Per screen: (p95 frame time in ms, Python allocation peak of the median frame in KB)
+    'menu': (4.0, 32),
+    'filter': (4.0, 32),
+    'mode_select': (4.0, 32),
+    'countdown': (4.0, 32),
+    'playing': (6.0, 32),
+    'playing_streak0': (16.0, 2048),  # Particle system at PARTICLE_MAX_COUNT, within a 60 fps frame; p95 measured at 9-14 ms
+    'playing_streak5': (16.0, 2048),
+    'playing_streak10': (16.0, 2048),
+    'playing_streak15': (16.0, 2048),
+    'paused': (4.0, 32),
+    'game_over': (4.0, 32),
+    'review': (4.0, 32),
+}
 
 # Romaji to Hiragana conversion map
 ROMAJI_TO_HIRAGANA = {
@@ -15,6 +15,18 @@ from .filtering import (
     MATURITY_MATURE,
     MATURITY_DISPLAY_NAMES
 )
+from .saving import (
+    build_save_data,
+    write_save,
+    read_save,
+    hydrate_cards,
+    write_deck_snapshot,
+    read_deck_snapshot,
+    SAVE_FORMAT_VERSION
+)
+from .journal import SessionJournal, load_session
+from .session import SessionState, PipelineSnapshot, CardPipeline
+from .save_slots import SaveSlotManager, slot_metadata
 
 __all__ = [
     'save_score_to_csv',
@@ -30,4 +42,18 @@ __all__ = [
     'MATURITY_YOUNG',
     'MATURITY_MATURE',
     'MATURITY_DISPLAY_NAMES',
+    'build_save_data',
+    'write_save',
+    'read_save',
+    'hydrate_cards',
+    'write_deck_snapshot',
+    'read_deck_snapshot',
+    'SAVE_FORMAT_VERSION',
+    'SessionJournal',
+    'load_session',
+    'SessionState',
+    'PipelineSnapshot',
+    'CardPipeline',
+    'SaveSlotManager',
+    'slot_metadata',
 ]
@@ -0,0 +1,230 @@
+"""
+Crash-safe session journal.
+
+Every answer and queue advance is appended to a journal file as a small
+JSON line. Every few records the full session is compacted into a
+checkpoint (the regular save file, written with an atomic rename) and the
+journal is truncated. Resuming reads the checkpoint and replays the tail.
+
+Records carry a sequence number and checkpoints store the last sequence
+number they include, so a crash between writing a checkpoint and
+truncating the journal never applies a delta twice.
+"""
+
+import json
+import os
+import threading
+from queue import Queue
+
+from config import JOURNAL_COMPACT_INTERVAL, JOURNAL_FSYNC
+from game.saving import write_save, read_save
+
+
+class SessionJournal:
+    """Append-only journal of session deltas with periodic checkpoints.
+
+    File writes happen on a background thread, so recording a delta only
+    costs a queue put on the calling thread. Operations run in the order
+    they were queued, including switching to another session's files.
+    """
+
+    def __init__(self, compact_interval=JOURNAL_COMPACT_INTERVAL, fsync=JOURNAL_FSYNC):
+        self.checkpoint_path = None
+        self.journal_path = None
+        self.compact_interval = compact_interval
+        self.fsync = fsync
+        self.seq = 0
+        self.pending = 0  # Records appended since the last checkpoint
+        self.error = None  # Last write failure, if any
+        self._queue = Queue()
+        self._file = None
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+
+    def open(self, checkpoint_path, journal_path, seq=0):
+        """
+        Start journaling a session to the given files.
+
+        Args:
+            checkpoint_path: Save file the journal compacts into
+            journal_path: Journal file path
+            seq: Last sequence number already applied to the session
+        """
+        self.seq = seq
+        self.pending = 0
+        self._queue.put(('open', (checkpoint_path, journal_path), None))
+
+    def record(self, op, **fields):
+        """
+        Append a delta to the journal.
+
+        Args:
+            op: Delta type ('advance' or 'answer')
+            **fields: JSON-serializable delta fields
+
+        Returns:
+            True if the journal is due for compaction
+        """
+        self.seq += 1
+        self.pending += 1
+        entry = {'seq': self.seq, 'op': op}
+        entry.update(fields)
+        self._queue.put(('append', entry, None))
+        return self.pending >= self.compact_interval
+
+    def checkpoint(self, save_data, on_done=None):
+        """
+        Write a full checkpoint and truncate the journal.
+
+        Args:
+            save_data: Save dict from build_save_data, captured at the
+                current sequence number
+            on_done: Optional callable run on the writer thread once the
+                checkpoint is on disk
+        """
+        save_data['journal_seq'] = self.seq
+        self.pending = 0
+        self.error = None
+        self._queue.put(('checkpoint', save_data, on_done))
+
+    def discard(self, on_done=None):
+        """
+        Delete the checkpoint and the journal.
+
+        Args:
+            on_done: Optional callable run on the writer thread afterwards
+        """
+        self.seq = 0
+        self.pending = 0
+        self._queue.put(('discard', None, on_done))
+
+    def flush(self):
+        """Block until all queued writes have reached the disk."""
+        self._queue.join()
+
+    def _writer(self):
+        """Background thread that performs the queued file operations."""
+        while True:
+            action, payload, on_done = self._queue.get()
+            try:
+                if action == 'open':
+                    self._close()
+                    self.checkpoint_path, self.journal_path = payload
+                elif action == 'append':
+                    self._append(payload)
+                elif action == 'checkpoint':
+                    write_save(self.checkpoint_path, payload)
+                    self._truncate()
+                elif action == 'discard':
+                    self._close()
+                    for path in (self.checkpoint_path, self.journal_path):
+                        if path and os.path.isfile(path):
+                            os.remove(path)
+                if on_done:
+                    on_done()
+            except Exception as e:
+                print(f"Journal {action} failed: {e}")
+                self.error = e
+            finally:
+                self._queue.task_done()
+
+    def _append(self, entry):
+        """Append one JSON line to the journal file."""
+        if self._file is None:
+            self._file = open(self.journal_path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def _truncate(self):
+        """Empty the journal file."""
+        self._close()
+        open(self.journal_path, 'w', encoding='utf-8').close()
+
+    def _close(self):
+        """Close the journal file handle if open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_journal(journal_path, after_seq=0):
+    """
+    Read journal records newer than a checkpoint.
+
+    A torn final line left by a crash mid-write is ignored.
+
+    Args:
+        journal_path: Journal file path
+        after_seq: Sequence number included in the checkpoint
+
+    Returns:
+        List of record dicts in order
+    """
+    records = []
+    try:
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if entry.get('seq', 0) > after_seq:
+                    records.append(entry)
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def replay(save_data, records):
+    """
+    Apply journal records to a save dict in place.
+
+    Args:
+        save_data: Save dict read from the checkpoint
+        records: Records from read_journal
+
+    Returns:
+        The updated save dict
+    """
+    for entry in records:
+        if entry['op'] == 'advance':
+            info = entry['info']
+            ready = save_data['ready_cards']
+            card_id = info.get('card_id')
+            if ready and ready[0].get('card_id') == card_id:
+                ready.pop(0)
+            elif card_id in save_data['card_ids']:
+                # Resolved after the checkpoint: drop it and anything skipped before it
+                cut = save_data['card_ids'].index(card_id) + 1
+                save_data['card_ids'] = save_data['card_ids'][cut:]
+            save_data['current_info'] = info
+            save_data['word_text'] = info['word']
+            save_data['elapsed_time'] = 0
+        elif entry['op'] == 'answer':
+            for key in ('score', 'points', 'total', 'streak'):
+                save_data[key] = entry[key]
+            if entry.get('incorrect'):
+                save_data['incorrect_answers'].append(entry['incorrect'])
+        save_data['journal_seq'] = entry['seq']
+    return save_data
+
+
+def load_session(checkpoint_path, journal_path):
+    """
+    Read a checkpoint and replay the journal tail on top of it.
+
+    Args:
+        checkpoint_path: Save file path
+        journal_path: Journal file path
+
+    Returns:
+        Tuple of (save_data, inline_cards) as returned by read_save
+    """
+    save_data, inline_cards = read_save(checkpoint_path)
+    save_data.setdefault('journal_seq', 0)
+    records = read_journal(journal_path, save_data['journal_seq'])
+    if records:
+        print(f"Replaying {len(records)} journal entries")
+    return replay(save_data, records), inline_cards
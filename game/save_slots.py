@@ -0,0 +1,193 @@
+"""
+Multi-slot save management.
+
+Each slot has its own save file and autosave journal inside SAVE_DIR. A
+small index file holds per-slot metadata (deck, mode, score, timestamp)
+so the menu can list resumable sessions from memory. The in-memory copy is
+refreshed on save and delete, and by a cheap mtime check on a slow timer
+to pick up changes made by another running instance.
+"""
+
+import os
+import threading
+import time
+
+from config import (
+    SAVE_DIR, SAVE_INDEX_FILE, SAVE_SLOT_COUNT, SAVE_INDEX_POLL_INTERVAL,
+    SAVE_FILE, JOURNAL_FILE
+)
+from game.saving import write_json_file, read_json_file, read_save
+
+
+def slot_metadata(save_data):
+    """
+    Extract the index metadata for a slot from its save data.
+
+    Args:
+        save_data: Save dict from build_save_data
+
+    Returns:
+        Dict with deck, mode, counters and timestamp
+    """
+    return {
+        'deck_name': save_data['deck_name'],
+        'game_mode': save_data['game_mode'],
+        'score': save_data['score'],
+        'total': save_data['total'],
+        'points': save_data['points'],
+        'timestamp': save_data['timestamp']
+    }
+
+
+class SaveSlotManager:
+    """Named save slots with a cached metadata index.
+
+    Safe to update from the journal writer thread while the game loop reads
+    the cached slot list.
+    """
+
+    def __init__(self, save_dir=SAVE_DIR, slot_count=SAVE_SLOT_COUNT,
+                 poll_interval=SAVE_INDEX_POLL_INTERVAL):
+        self.save_dir = save_dir
+        self.slot_count = slot_count
+        self.poll_interval = poll_interval
+        self.index_path = os.path.join(save_dir, SAVE_INDEX_FILE)
+        self._lock = threading.Lock()
+        self._index = {}
+        self._slots = ()  # Cached (name, metadata) pairs, newest first
+        self._mtime = None
+        self._last_poll = 0
+
+        os.makedirs(save_dir, exist_ok=True)
+        self.reload()
+        self._migrate_legacy_save()
+
+    @property
+    def slot_names(self):
+        """All slot names in display order."""
+        return [f"slot{i + 1}" for i in range(self.slot_count)]
+
+    def save_path(self, name):
+        """Save file path for a slot."""
+        return os.path.join(self.save_dir, f"{name}.json")
+
+    def journal_path(self, name):
+        """Autosave journal path for a slot."""
+        return os.path.join(self.save_dir, f"{name}.journal")
+
+    def list_slots(self):
+        """
+        Get the occupied slots. No file-system access.
+
+        Returns:
+            Tuple of (name, metadata) pairs, most recent first
+        """
+        return self._slots
+
+    def has_slots(self):
+        """Check if any slot holds a resumable session."""
+        return bool(self._slots)
+
+    def is_full(self):
+        """Check if every slot holds a session. No file-system access."""
+        return all(name in self._index for name in self.slot_names)
+
+    def allocate(self):
+        """
+        Pick a slot for a new session. Occupied slots are never reused;
+        the player has to delete one first.
+
+        Returns:
+            The first empty slot, or None if all are occupied
+        """
+        with self._lock:
+            for name in self.slot_names:
+                if name not in self._index:
+                    return name
+            return None
+
+    def record(self, name, metadata):
+        """
+        Store metadata for a slot after its save file was written.
+
+        Args:
+            name: Slot name
+            metadata: Dict from slot_metadata
+        """
+        with self._lock:
+            self._index[name] = metadata
+            self._write_index()
+
+    def remove(self, name):
+        """
+        Delete a slot's files and metadata.
+
+        Args:
+            name: Slot name
+        """
+        for path in (self.save_path(name), self.journal_path(name)):
+            if os.path.isfile(path):
+                os.remove(path)
+        with self._lock:
+            if self._index.pop(name, None) is not None:
+                self._write_index()
+
+    def poll(self):
+        """Reload the index if it changed on disk. Stats at most once per interval."""
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return
+        self._last_poll = now
+        if self._stat_index() != self._mtime:
+            self.reload()
+
+    def reload(self):
+        """Read the index file from disk."""
+        with self._lock:
+            try:
+                index = read_json_file(self.index_path)
+            except (OSError, ValueError):
+                index = {}
+            # Drop entries whose save file has gone missing
+            self._index = {name: meta for name, meta in index.items()
+                           if os.path.isfile(self.save_path(name))}
+            self._mtime = self._stat_index()
+            self._rebuild_cache()
+
+    def _write_index(self):
+        """Persist the index and refresh the cache. Caller holds the lock."""
+        write_json_file(self.index_path, self._index, compress=False)
+        self._mtime = self._stat_index()
+        self._rebuild_cache()
+
+    def _rebuild_cache(self):
+        """Rebuild the sorted slot list. Caller holds the lock."""
+        self._slots = tuple(sorted(self._index.items(),
+                                   key=lambda item: item[1]['timestamp'], reverse=True))
+
+    def _stat_index(self):
+        """Modification time of the index file, or None if missing."""
+        try:
+            return os.stat(self.index_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _migrate_legacy_save(self):
+        """Move a single-file save from older versions into a slot."""
+        if not os.path.isfile(SAVE_FILE):
+            return
+        try:
+            save_data, _ = read_save(SAVE_FILE)
+            name = self.allocate()
+            if name is None:
+                # Tried again on the next launch
+                print(f"Not migrating {SAVE_FILE}: all {len(self.slot_names)} save slots are full")
+                return
+            os.replace(SAVE_FILE, self.save_path(name))
+            if os.path.isfile(JOURNAL_FILE):
+                os.replace(JOURNAL_FILE, self.journal_path(name))
+            save_data.setdefault('timestamp', '')
+            self.record(name, slot_metadata(save_data))
+            print(f"Moved {SAVE_FILE} to save slot {name}")
+        except Exception as e:
+            print(f"Could not migrate {SAVE_FILE}: {e}")
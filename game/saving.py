@@ -0,0 +1,211 @@
+"""
+Save file format and persistence helpers.
+
+Saves are versioned. Version 2 stores card IDs in their remaining shuffle
+order instead of full ``cardsInfo`` dicts; cards are re-hydrated on load from
+the loaded deck or from a slim local snapshot of it.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+
+from config import SAVE_COMPRESS, DECK_SNAPSHOT_FILE
+from utils.text_utils import strip_html
+
+SAVE_FORMAT_VERSION = 2
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+# Card fields needed to play and filter a card
+_SLIM_CARD_FIELDS = ('cardId', 'type', 'interval')
+
+
+def slim_card(card):
+    """
+    Reduce a cardsInfo dict to the fields the game actually uses.
+
+    Args:
+        card: Card info dict from AnkiConnect
+
+    Returns:
+        Dict with card ID, plain-text question, type and interval
+    """
+    slim = {field: card.get(field) for field in _SLIM_CARD_FIELDS}
+    slim['question'] = strip_html(card.get('question', ''))
+    return slim
+
+
+def build_save_data(deck_name, game_mode, remaining_cards, ready_cards, current_info,
+                    score, points, total, streak, incorrect_answers,
+                    elapsed_time=0, word_text='', session_id=None, retry_drill=False):
+    """
+    Build a version 2 save dict.
+
+    Args:
+        deck_name: Name of the Anki deck being played
+        game_mode: Current game mode
+        remaining_cards: Cards not yet resolved, in shuffle order
+        ready_cards: Resolved card infos waiting to be shown
+        current_info: Info of the card currently on screen
+        score, points, total, streak: Session counters
+        incorrect_answers: List of incorrect answer dicts
+        elapsed_time: Seconds spent on the current question
+        word_text: Word currently displayed
+        session_id: Identifier of the live session that was saved
+        retry_drill: Whether the session is a drill of missed words
+
+    Returns:
+        JSON-serializable dict
+    """
+    return {
+        'version': SAVE_FORMAT_VERSION,
+        'session_id': session_id,
+        'deck_name': deck_name,
+        'game_mode': game_mode,
+        'retry_drill': retry_drill,
+        'card_ids': [card['cardId'] for card in remaining_cards],
+        'ready_cards': list(ready_cards),
+        'current_info': current_info,
+        'score': score,
+        'points': points,
+        'total': total,
+        'streak': streak,
+        'incorrect_answers': list(incorrect_answers),
+        'elapsed_time': elapsed_time,
+        'word_text': word_text,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def write_json_file(path, data, compress=SAVE_COMPRESS):
+    """
+    Atomically write compact JSON to a file, optionally gzip-compressed.
+
+    The data is written to a temporary file which then replaces the target,
+    so a crash mid-write never leaves a truncated file behind.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable object
+        compress: Whether to gzip the payload
+    """
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    if compress:
+        payload = gzip.compress(payload, compresslevel=1)
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_json_file(path):
+    """
+    Read a JSON file written by write_json_file (compressed or not).
+
+    Args:
+        path: File path
+
+    Returns:
+        Decoded JSON object
+    """
+    with open(path, 'rb') as f:
+        payload = f.read()
+    if payload[:2] == _GZIP_MAGIC:
+        payload = gzip.decompress(payload)
+    return json.loads(payload.decode('utf-8'))
+
+
+def write_save(path, save_data, compress=SAVE_COMPRESS):
+    """Write a save dict to disk."""
+    write_json_file(path, save_data, compress)
+
+
+def read_save(path):
+    """
+    Read a save file, upgrading legacy saves to the current format.
+
+    Args:
+        path: Save file path
+
+    Returns:
+        Tuple of (save_data, inline_cards). inline_cards holds the full card
+        dicts stored by legacy saves and is empty for current saves.
+    """
+    save_data = read_json_file(path)
+    if save_data.get('version', 1) >= SAVE_FORMAT_VERSION:
+        return save_data, []
+
+    # Version 1 stored every card dict plus an index into the list
+    cards = save_data.pop('cards', [])
+    remaining = cards[save_data.pop('current_index', 0):]
+    save_data['card_ids'] = [card['cardId'] for card in remaining]
+    save_data['version'] = SAVE_FORMAT_VERSION
+    return save_data, cards
+
+
+def hydrate_cards(card_ids, *card_sources):
+    """
+    Look up cards by ID, preserving the given order.
+
+    Args:
+        card_ids: Ordered list of card IDs
+        *card_sources: Lists of card dicts searched for the IDs
+
+    Returns:
+        Tuple of (cards, missing_ids)
+    """
+    lookup = {}
+    for source in card_sources:
+        for card in source or []:
+            lookup.setdefault(card.get('cardId'), card)
+
+    cards = []
+    missing = []
+    for cid in card_ids:
+        card = lookup.get(cid)
+        if card is None:
+            missing.append(cid)
+        else:
+            cards.append(card)
+    return cards, missing
+
+
+def write_deck_snapshot(deck_name, cards, path=DECK_SNAPSHOT_FILE):
+    """
+    Store a slim copy of the deck for re-hydrating saves without Anki.
+
+    Args:
+        deck_name: Name of the Anki deck
+        cards: Card info dicts from AnkiConnect
+        path: Snapshot file path
+    """
+    write_json_file(path, {
+        'version': SAVE_FORMAT_VERSION,
+        'deck_name': deck_name,
+        'cards': [slim_card(card) for card in cards]
+    })
+
+
+def read_deck_snapshot(deck_name, path=DECK_SNAPSHOT_FILE):
+    """
+    Read the local deck snapshot.
+
+    Args:
+        deck_name: Deck the snapshot must belong to
+        path: Snapshot file path
+
+    Returns:
+        List of slim card dicts, empty if missing or for another deck
+    """
+    try:
+        snapshot = read_json_file(path)
+    except (OSError, ValueError):
+        return []
+    if snapshot.get('deck_name') != deck_name:
+        return []
+    return snapshot.get('cards', [])
@@ -0,0 +1,157 @@
+"""
+Session state shared between the game loop and the preload thread.
+
+The card pipeline (shuffle order, resolve cursor and ready queue) is the
+only state touched by both threads. It lives behind a lock in CardPipeline,
+which hands out immutable snapshots so a save can capture a consistent
+point-in-time view without stopping the preloader.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from game.saving import build_save_data
+
+
+@dataclass(frozen=True)
+class PipelineSnapshot:
+    """Point-in-time view of a CardPipeline."""
+    generation: int
+    cards: tuple
+    cursor: int
+    ready: tuple
+
+    @property
+    def remaining_cards(self):
+        """Cards not yet resolved, in shuffle order."""
+        return self.cards[self.cursor:]
+
+
+@dataclass(frozen=True)
+class SessionState:
+    """Immutable snapshot of a game session, safe to hand to other threads."""
+    session_id: str
+    deck_name: str
+    game_mode: str
+    pipeline: PipelineSnapshot
+    current_info: dict
+    score: int
+    points: int
+    total: int
+    streak: int
+    incorrect_answers: tuple
+    retry_drill: bool
+    elapsed_time: float
+    word_text: str
+
+    def to_save_data(self):
+        """Build a save dict from this snapshot."""
+        return build_save_data(
+            self.deck_name,
+            self.game_mode,
+            self.pipeline.remaining_cards,
+            self.pipeline.ready,
+            self.current_info,
+            self.score,
+            self.points,
+            self.total,
+            self.streak,
+            self.incorrect_answers,
+            elapsed_time=self.elapsed_time,
+            word_text=self.word_text,
+            session_id=self.session_id,
+            retry_drill=self.retry_drill
+        )
+
+
+class CardPipeline:
+    """Lock-protected card queue shared by the preloader and the game loop.
+
+    The preloader claims the card at the cursor, resolves it without holding
+    the lock, then commits the result. A commit advances the cursor and
+    enqueues the resolved info in one step, so snapshots never see one
+    without the other. Resetting bumps the generation, which makes any
+    preloader still working on the previous session drop its result and exit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cards = ()
+        self._cursor = 0
+        self._ready = deque()
+        self.generation = 0
+
+    def reset(self, cards, ready=()):
+        """
+        Start a new session.
+
+        Args:
+            cards: Cards left to resolve, in play order
+            ready: Already resolved card infos to serve first
+
+        Returns:
+            The new generation number
+        """
+        with self._lock:
+            self._cards = tuple(cards)
+            self._cursor = 0
+            self._ready = deque(ready)
+            self.generation += 1
+            return self.generation
+
+    def claim_next(self, generation):
+        """
+        Get the next card to resolve.
+
+        Args:
+            generation: Generation the caller is working for
+
+        Returns:
+            Tuple of (index, card), or None if the generation is stale or
+            every card has been resolved
+        """
+        with self._lock:
+            if generation != self.generation or self._cursor >= len(self._cards):
+                return None
+            return self._cursor, self._cards[self._cursor]
+
+    def commit(self, generation, index, info):
+        """
+        Record the result of resolving a claimed card.
+
+        Args:
+            generation: Generation the card was claimed for
+            index: Index returned by claim_next
+            info: Resolved card info, or None if the lookup failed
+
+        Returns:
+            True if the result was accepted
+        """
+        with self._lock:
+            if generation != self.generation or index != self._cursor:
+                return False
+            if info is not None:
+                self._ready.append(info)
+            self._cursor += 1
+            return True
+
+    def pop_ready(self):
+        """Take the next resolved card info, or None if none is ready."""
+        with self._lock:
+            return self._ready.popleft() if self._ready else None
+
+    def ready_count(self):
+        """Number of resolved cards waiting to be shown."""
+        with self._lock:
+            return len(self._ready)
+
+    def has_pending(self):
+        """Whether any cards are still waiting to be resolved."""
+        with self._lock:
+            return self._cursor < len(self._cards)
+
+    def snapshot(self):
+        """Capture the pipeline state. Cheap: the card tuple is shared."""
+        with self._lock:
+            return PipelineSnapshot(self.generation, self._cards, self._cursor, tuple(self._ready))
@@ -8,22 +8,118 @@ and comprehensive scoring.
 Author: Tristan Hayes
 """
 
-import pygame
-from config import DEFAULT_DECK_NAME
-from ui.game_gui import VocabGameGUI
+import time
+
+SCRIPT_START = time.perf_counter()  # Before any other import, for --profile-startup
+SCRIPT_START_WALL = time.time()
+
+import argparse
+import os
+
+from config import DEFAULT_DECK_NAME, STARTUP_TARGET_MS, STARTUP_PROFILE_TOP
+
+
+def interpreter_startup_ms():
+    """
+    Get the time from process start until this script began running.
+
+    Returns:
+        Milliseconds, or None where /proc isn't available. The kernel
+        records process start in clock ticks, so this is only accurate to
+        about 10 ms.
+    """
+    try:
+        with open('/proc/self/stat') as f:
+            # Fields after the parenthesised command name; starttime is field 22
+            fields = f.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        started_after_boot = int(fields[19]) / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return None
+    boot_time = time.time() - uptime
+    return max(0.0, (SCRIPT_START_WALL - (boot_time + started_after_boot)) * 1000)
+
+
+def print_startup_report(phases, interpreter_ms, profile):
+    """
+    Print the startup time breakdown.
+
+    Args:
+        phases: List of (phase name, milliseconds) after the script started
+        interpreter_ms: Time before the script started, or None if unknown
+        profile: cProfile.Profile covering the phases, or None. Its overhead
+            is included in the phase times.
+    """
+    print("\nStartup profile")
+    rows = list(phases)
+    if interpreter_ms is not None:
+        rows.insert(0, ("interpreter startup", interpreter_ms))
+    for name, ms in rows:
+        print(f"  {name:<28}{ms:>9.1f} ms")
+
+    total = sum(ms for _, ms in rows)
+    verdict = "within" if total <= STARTUP_TARGET_MS else "OVER"
+    print(f"  {'total to first frame':<28}{total:>9.1f} ms  ({verdict} target {STARTUP_TARGET_MS} ms)")
+    if interpreter_ms is None:
+        print("  (interpreter startup unknown: no /proc on this system)")
+
+    if profile is not None:
+        import pstats
+        print(f"\nSlowest {STARTUP_PROFILE_TOP} functions by cumulative time:")
+        pstats.Stats(profile).sort_stats('cumulative').print_stats(STARTUP_PROFILE_TOP)
 
 
 def main():
     """Main entry point for the game."""
-    # Initialize pygame
-    pygame.init()
-    pygame.mixer.init()
+    parser = argparse.ArgumentParser(description="Japanese vocabulary quiz for your Anki deck.")
+    parser.add_argument('--profile-startup', nargs='?', const='phases', choices=('phases', 'functions'),
+                        help="report where the time to the first frame goes, then exit; "
+                             "'functions' also lists the slowest functions (profiling slows startup)")
+    args = parser.parse_args()
+    
+    profile = None
+    if args.profile_startup == 'functions':
+        import cProfile
+        profile = cProfile.Profile()
+        profile.enable()
+    
+    phases = []
+    mark = [SCRIPT_START]
+    
+    def phase(name):
+        now = time.perf_counter()
+        phases.append((name, (now - mark[0]) * 1000))
+        mark[0] = now
+    
+    phase("main.py imports")
+    import pygame
+    phase("import pygame")
+    
+    # Only the subsystems the first frame needs; the mixer opens after it
+    pygame.display.init()
+    pygame.font.init()
+    phase("init display and font")
+    
+    from ui.game_gui import VocabGameGUI
+    phase("import game modules")
     
     # Create and run the game
     # Pass None for cards to trigger deck loading on startup
     deck_name = DEFAULT_DECK_NAME
     app = VocabGameGUI(None, deck_name)
-    app.run()
+    phase("create game")
+    
+    def on_first_frame():
+        phase("first frame")
+        if profile is not None:
+            profile.disable()
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+    
+    app.run(on_first_frame if args.profile_startup else None)
+    
+    if args.profile_startup:
+        print_startup_report(phases, interpreter_startup_ms(), profile)
 
 
 if __name__ == "__main__":
@@ -2,10 +2,32 @@
 UI components for the Japanese Vocabulary Game.
 """
 
-from .particles import Particle, FireParticle, StarParticle
+from .particles import ParticleSystem, SpriteAtlas
+from .fonts import FontRegistry, TextCache, TextLayoutCache
+from .font_resolver import resolve_japanese_font
+from .word_zoom import WordZoomRenderer
+from .background import AmbientBackground, DotField
+from .buffers import EffectBuffers
+from .layers import LayerCache
+from .glyphs import GlyphAtlas
+from .presenter import ScaledPresenter
+from .profiler import FrameProfiler
+from .governor import QualityGovernor
 
 __all__ = [
-    'Particle',
-    'FireParticle',
-    'StarParticle',
+    'ParticleSystem',
+    'SpriteAtlas',
+    'FontRegistry',
+    'TextCache',
+    'TextLayoutCache',
+    'resolve_japanese_font',
+    'WordZoomRenderer',
+    'AmbientBackground',
+    'DotField',
+    'EffectBuffers',
+    'LayerCache',
+    'GlyphAtlas',
+    'ScaledPresenter',
+    'FrameProfiler',
+    'QualityGovernor',
 ]
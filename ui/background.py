@@ -0,0 +1,163 @@
+"""
+Ambient background dots shared by the menu, loading and game screens.
+
+Each screen drifts a field of faint dots across the window. Dot positions
+come from closed-form functions of time, so they are computed for the whole
+field at once with NumPy; the dots themselves are pre-rendered per
+(color, radius, alpha bucket) and drawn with a single Surface.blits call.
+"""
+
+from dataclasses import dataclass, replace
+
+import numpy as np
+import pygame
+
+from config import AMBIENT_ALPHA_STEP, AMBIENT_BAKE_LAYERS
+
+
+@dataclass(frozen=True)
+class DotField:
+    """Parameters for one screen's dot field.
+
+    Dot i sits at
+        x = (t * speed + i * spacing_x) % (width + wrap_margin) + wobble_x * sin(i * wobble_freq_x)
+        y = (i * spacing_y) % height + wobble_y * cos(i * wobble_freq_y)
+    with alpha = alpha_base + alpha_amp * sin(t * alpha_speed + i) and
+    radius = size + int(pulse_amp * sin(t * pulse_speed + i * 0.5)).
+    """
+    count: int
+    speed: float
+    spacing_x: float
+    spacing_y: float
+    wrap_margin: int
+    wobble_x: float
+    wobble_freq_x: float
+    wobble_y: float
+    wobble_freq_y: float
+    alpha_base: float
+    alpha_amp: float
+    alpha_speed: float = 1.0
+    size: float = 2
+    pulse_amp: float = 0
+    pulse_speed: float = 0
+
+
+MENU_FIELD = DotField(count=12, speed=25, spacing_x=137, spacing_y=83, wrap_margin=50,
+                      wobble_x=40, wobble_freq_x=3.14, wobble_y=35, wobble_freq_y=2.71,
+                      alpha_base=50, alpha_amp=30)
+LOADING_FIELD = DotField(count=15, speed=45, spacing_x=119, spacing_y=71, wrap_margin=50,
+                         wobble_x=35, wobble_freq_x=2.97, wobble_y=30, wobble_freq_y=3.33,
+                         alpha_base=100, alpha_amp=50, alpha_speed=2,
+                         size=3, pulse_amp=2, pulse_speed=3)
+GAME_FIELD = DotField(count=5, speed=30, spacing_x=150, spacing_y=47, wrap_margin=100,
+                      wobble_x=30, wobble_freq_x=2.7, wobble_y=25, wobble_freq_y=3.1,
+                      alpha_base=50, alpha_amp=30, size=3)
+
+MAX_GAME_DOTS = 80
+MAX_BAKED_LAYERS = 8
+
+
+class AmbientBackground:
+    """Draws dot fields from a shared sprite cache."""
+
+    def __init__(self, alpha_step=AMBIENT_ALPHA_STEP, bake_layers=AMBIENT_BAKE_LAYERS):
+        """
+        Args:
+            alpha_step: Alpha bucket width; dots snap to multiples of this
+            bake_layers: Pre-draw non-pulsing fields into a scrolling texture
+                (dots keep their base alpha instead of twinkling)
+        """
+        self.alpha_step = max(1, alpha_step)
+        self.bake_layers = bake_layers
+        self._sprites = {}  # (color, radius, alpha) -> surface
+        self._layers = {}   # (field, color, width, height) -> baked texture
+
+    def draw(self, surface, field, t, color):
+        """
+        Draw a dot field.
+
+        Args:
+            surface: Target surface
+            field: DotField to draw
+            t: Background animation time in seconds
+            color: RGB dot color
+        """
+        color = tuple(color[:3])
+        width, height = surface.get_size()
+        if self.bake_layers and not field.pulse_amp:
+            self._draw_baked(surface, field, t, color, width, height)
+            return
+
+        i = np.arange(field.count, dtype=np.float64)
+        x, y = self._positions(field, i, t, width, height)
+        alpha = field.alpha_base + field.alpha_amp * np.sin(t * field.alpha_speed + i)
+        alpha = (alpha.astype(np.int64) // self.alpha_step) * self.alpha_step
+        radius = np.full(field.count, int(field.size), dtype=np.int64)
+        if field.pulse_amp:
+            radius += (field.pulse_amp * np.sin(t * field.pulse_speed + i * 0.5)).astype(np.int64)
+        radius = np.maximum(radius, 1)
+
+        sprites = [self._sprite(color, r, a) for r, a in zip(radius.tolist(), alpha.tolist())]
+        positions = zip(x.astype(np.int64).tolist(), y.astype(np.int64).tolist())
+        surface.blits(zip(sprites, positions), doreturn=False)
+
+    def draw_game(self, surface, t, color, streak, speed_multiplier, density=1.0):
+        """
+        Draw the in-game field, which grows and speeds up with the streak.
+
+        Args:
+            surface: Target surface
+            t: Background animation time in seconds
+            color: RGB dot color
+            streak: Current answer streak
+            speed_multiplier: Twinkle speed
+            density: Fraction of the dots to draw
+        """
+        field = replace(
+            GAME_FIELD,
+            count=max(1, int(min(GAME_FIELD.count + streak * 4, MAX_GAME_DOTS) * density)),
+            speed=GAME_FIELD.speed + streak * 5,
+            size=GAME_FIELD.size + streak * 0.2,
+            alpha_speed=speed_multiplier
+        )
+        self.draw(surface, field, t, color)
+
+    def _positions(self, field, i, t, width, height):
+        """Dot positions for indices i at time t."""
+        x = (t * field.speed + i * field.spacing_x) % (width + field.wrap_margin)
+        x += field.wobble_x * np.sin(i * field.wobble_freq_x)
+        y = (i * field.spacing_y) % height + field.wobble_y * np.cos(i * field.wobble_freq_y)
+        return x, y
+
+    def _sprite(self, color, radius, alpha):
+        """Pre-rendered dot, 2 * radius wide."""
+        key = (color, radius, alpha)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, max(0, min(255, alpha))), (radius, radius), radius)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _draw_baked(self, surface, field, t, color, width, height):
+        """Scroll a texture holding the whole field at its base alpha."""
+        wrap = width + field.wrap_margin
+        key = (field, color, width, height)
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = pygame.Surface((wrap, height), pygame.SRCALPHA)
+            i = np.arange(field.count, dtype=np.float64)
+            x, y = self._positions(field, i, 0.0, width, height)
+            sprite = self._sprite(color, max(1, int(field.size)),
+                                  int(field.alpha_base) // self.alpha_step * self.alpha_step)
+            for px, py in zip(x.astype(np.int64).tolist(), y.astype(np.int64).tolist()):
+                # Draw wrapped copies so dots crossing the seam stay whole
+                for shift in (-wrap, 0, wrap):
+                    layer.blit(sprite, (px + shift, py))
+            if len(self._layers) >= MAX_BAKED_LAYERS:
+                self._layers.clear()
+            self._layers[key] = layer
+
+        offset = int(t * field.speed) % wrap
+        surface.blit(layer, (offset, 0))
+        surface.blit(layer, (offset - wrap, 0))
@@ -0,0 +1,79 @@
+"""
+Persistent full-window surfaces for screen effects.
+
+Screen shake draws the game into an offscreen buffer that is then blitted
+at an offset, and the answer flash blends a solid color over the window.
+Both used to allocate a new window-sized surface every frame; here they are
+created once per window size, in the display's pixel format, and reused.
+"""
+
+import pygame
+
+
+class EffectBuffers:
+    """Window-sized surfaces reused across frames. Rebuilt on resize."""
+
+    def __init__(self, size=None):
+        """
+        Args:
+            size: Window size, or None to build lazily on first use
+        """
+        self.size = None
+        self._shake = None
+        self._flash = {}  # color -> surface pre-filled with that color
+        if size is not None:
+            self.resize(size)
+
+    def resize(self, size):
+        """
+        Rebuild the buffers for a new window size.
+
+        Args:
+            size: (width, height) of the window
+        """
+        size = tuple(size)
+        if size == self.size:
+            return
+        self.size = size
+        self._shake = self._new_surface()
+        self._flash.clear()
+
+    def shake_surface(self, fill_color):
+        """
+        Get the screen shake buffer, cleared to a color.
+
+        Args:
+            fill_color: Background color to clear it with
+
+        Returns:
+            pygame.Surface the size of the window
+        """
+        self._shake.fill(fill_color)
+        return self._shake
+
+    def flash_overlay(self, color, alpha):
+        """
+        Get a solid overlay for the answer flash.
+
+        Args:
+            color: RGB flash color
+            alpha: Overall opacity, 0-255
+
+        Returns:
+            pygame.Surface the size of the window; only its alpha changes per frame
+        """
+        color = tuple(color[:3])
+        overlay = self._flash.get(color)
+        if overlay is None:
+            overlay = self._new_surface()
+            overlay.fill(color)
+            self._flash[color] = overlay
+        overlay.set_alpha(alpha)
+        return overlay
+
+    def _new_surface(self):
+        """Window-sized surface in the display format when a display exists."""
+        surface = pygame.Surface(self.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
@@ -0,0 +1,67 @@
+"""
+Dirty-region tracking for presenting frames.
+
+Screens that animate invalidate the whole window every frame. Static
+screens (leaderboard, pause, game over, review) only change in response to
+input, so the loop invalidates the regions an event touched and presents
+just those with pygame.display.update, or skips presenting entirely when
+nothing changed.
+"""
+
+import pygame
+
+
+class FrameDamage:
+    """Regions of the window changed since the last present."""
+
+    def __init__(self, display=pygame.display):
+        """
+        Args:
+            display: What frames are presented through; pygame.display, or
+                anything with the same flip() and update(rects)
+        """
+        self.display = display
+        self._full = True
+        self._rects = []
+        self.presented = 0
+        self.skipped = 0
+
+    @property
+    def is_dirty(self):
+        """Whether anything needs to be drawn and presented."""
+        return self._full or bool(self._rects)
+
+    def invalidate(self, rect=None):
+        """
+        Mark a region as changed.
+
+        Args:
+            rect: pygame.Rect that changed, or None for the whole window
+        """
+        if rect is None:
+            self._full = True
+        elif not self._full and rect.width > 0 and rect.height > 0:
+            self._rects.append(pygame.Rect(rect))
+
+    def present(self):
+        """
+        Push the changed regions to the display and reset.
+
+        Returns:
+            True if anything was presented
+        """
+        if self._full:
+            self.display.flip()
+        elif self._rects:
+            self.display.update(self._rects)
+        else:
+            self.skipped += 1
+            return False
+        self._full = False
+        self._rects = []
+        self.presented += 1
+        return True
+
+    def skip(self):
+        """Record a frame that was not drawn because nothing changed."""
+        self.skipped += 1
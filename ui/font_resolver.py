@@ -0,0 +1,290 @@
+"""
+Japanese font discovery.
+
+pygame's SysFont only knows font names, and the names the game used to ask
+for are Windows fonts. This module looks for a font file that can actually
+render Japanese: fontconfig's best match for Japanese and every font it
+lists for the language, then the files common CJK packages install on each
+platform, then the old SysFont names. Each candidate's glyph coverage is
+checked by rendering kana and kanji.
+
+The result, including "nothing found", is cached on disk together with the
+modification times of the system font directories. Later launches only stat
+those directories, and installing or removing a font invalidates the cache.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pygame
+
+from config import FONT_CACHE_FILE, JAPANESE_FONTS
+
+
+CACHE_VERSION = 1
+COVERAGE_SAMPLE = "あアー日本語漢字"  # Hiragana, katakana, the long vowel mark and common kanji
+MISSING_GLYPH = "\U0010FFFD"  # Private-use code point no real font maps, so it renders as .notdef
+FONTCONFIG_TIMEOUT = 5  # seconds allowed for fc-match / fc-list
+
+# Files installed by common CJK font packages, checked when fontconfig finds nothing
+KNOWN_FONT_FILES = {
+    'linux': [
+        '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',  # Debian, Ubuntu
+        '/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc',  # Arch
+        '/usr/share/fonts/google-noto-cjk/NotoSansCJK-Regular.ttc',  # Fedora
+        '/usr/share/fonts/opentype/noto/NotoSerifCJK-Regular.ttc',
+        '/usr/share/fonts/truetype/fonts-japanese-gothic.ttf',  # Debian alternatives link
+        '/usr/share/fonts/opentype/ipafont-gothic/ipag.ttf',
+        '/usr/share/fonts/truetype/ipafont-gothic/ipag.ttf',
+        '/usr/share/fonts/ipa-gothic/ipag.ttf',
+        '/usr/share/fonts/OTF/ipag.ttf',
+        '/usr/share/fonts/truetype/takao-gothic/TakaoGothic.ttf',
+    ],
+    'darwin': [
+        '/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc',
+        '/System/Library/Fonts/Hiragino Sans GB.ttc',
+        '/System/Library/Fonts/Supplemental/Arial Unicode.ttf',
+        '/Library/Fonts/Arial Unicode.ttf',
+    ],
+    'win32': [
+        'msgothic.ttc',
+        'meiryo.ttc',
+        'YuGothM.ttc',
+        'msmincho.ttc',
+    ],
+}
+
+
+def platform_key():
+    """Get the KNOWN_FONT_FILES key for this platform."""
+    if sys.platform.startswith('win'):
+        return 'win32'
+    if sys.platform == 'darwin':
+        return 'darwin'
+    return 'linux'
+
+
+def font_dirs():
+    """
+    List the directories system and user fonts are installed in.
+
+    Returns:
+        List of existing directory paths
+    """
+    home = os.path.expanduser('~')
+    platform = platform_key()
+    if platform == 'win32':
+        windir = os.environ.get('WINDIR', r'C:\Windows')
+        local = os.environ.get('LOCALAPPDATA', os.path.join(home, 'AppData', 'Local'))
+        dirs = [os.path.join(windir, 'Fonts'), os.path.join(local, 'Microsoft', 'Windows', 'Fonts')]
+    elif platform == 'darwin':
+        dirs = ['/System/Library/Fonts', '/Library/Fonts', os.path.join(home, 'Library', 'Fonts')]
+    else:
+        data_home = os.environ.get('XDG_DATA_HOME', os.path.join(home, '.local', 'share'))
+        dirs = ['/usr/share/fonts', '/usr/local/share/fonts',
+                os.path.join(data_home, 'fonts'), os.path.join(home, '.fonts')]
+    return [d for d in dirs if os.path.isdir(d)]
+
+
+def font_dirs_key(dirs=None):
+    """
+    Get the modification times of the font directories and their
+    subdirectories, which change whenever a font is installed or removed.
+
+    Args:
+        dirs: Directories to check, or None for font_dirs()
+
+    Returns:
+        Dict of directory path -> mtime in nanoseconds
+    """
+    key = {}
+    for root in font_dirs() if dirs is None else dirs:
+        try:
+            key[root] = os.stat(root).st_mtime_ns
+            # Packages install into per-family subdirectories, e.g. fonts/opentype/noto
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        key[entry.path] = entry.stat().st_mtime_ns
+        except OSError:
+            continue
+    return key
+
+
+def fontconfig_fonts(lang='ja'):
+    """
+    Ask fontconfig for font files supporting a language.
+
+    Args:
+        lang: Language code
+
+    Returns:
+        List of font file paths, best match first; empty without fontconfig
+    """
+    paths = []
+    commands = (['fc-match', '-f', '%{file}\n', f':lang={lang}'],
+                ['fc-list', '-f', '%{file}\n', f':lang={lang}'])
+    for command in commands:
+        if shutil.which(command[0]) is None:
+            continue
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, check=True,
+                                    timeout=FONTCONFIG_TIMEOUT).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        # fc-list's order is arbitrary; sort for the same pick on every run
+        found = output.split('\n') if command[0] == 'fc-match' else sorted(output.split('\n'))
+        paths.extend(path for path in found if path and path not in paths)
+    return paths
+
+
+def known_font_files():
+    """
+    List the KNOWN_FONT_FILES for this platform that exist.
+
+    Returns:
+        List of font file paths
+    """
+    platform = platform_key()
+    paths = KNOWN_FONT_FILES[platform]
+    if platform == 'win32':
+        fonts = os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts')
+        paths = [os.path.join(fonts, name) for name in paths]
+    return [path for path in paths if os.path.isfile(path)]
+
+
+def sysfont_files():
+    """
+    Find the files of the JAPANESE_FONTS system font names.
+
+    pygame scans every installed font the first time this is called, so it
+    is the last thing tried.
+
+    Returns:
+        List of font file paths
+    """
+    paths = []
+    for name in JAPANESE_FONTS:
+        path = pygame.font.match_font(name)
+        if path and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def covers(path, sample=COVERAGE_SAMPLE):
+    """
+    Check that a font has glyphs for every character of a sample.
+
+    Missing characters render as the font's .notdef glyph, so each
+    character is compared against a code point no font maps.
+
+    Args:
+        path: Font file path
+        sample: Characters the font must provide
+
+    Returns:
+        bool
+    """
+    try:
+        font = pygame.font.Font(path, 24)
+        missing = pygame.image.tobytes(font.render(MISSING_GLYPH, False, (255, 255, 255)), 'RGB')
+        for char in sample:
+            glyph = font.render(char, False, (255, 255, 255))
+            if glyph.get_width() == 0 or pygame.image.tobytes(glyph, 'RGB') == missing:
+                return False
+    except (pygame.error, OSError, ValueError):
+        return False
+    return True
+
+
+def discover_japanese_font():
+    """
+    Search for a font file that renders Japanese.
+
+    Returns:
+        Font file path, or None if no installed font covers Japanese
+    """
+    checked = set()
+    for candidates in (fontconfig_fonts, known_font_files, sysfont_files):
+        for path in candidates():
+            if path in checked:
+                continue
+            checked.add(path)
+            if covers(path):
+                return path
+    return None
+
+
+def read_font_cache(path, dirs_key):
+    """
+    Read the cached font paths if they are still valid.
+
+    Args:
+        path: Cache file path
+        dirs_key: Current font_dirs_key()
+
+    Returns:
+        Dict of role -> font path or None, or None if the cache is missing,
+        unreadable or stale
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION or cache.get('font_dirs') != dirs_key:
+        return None
+    fonts = cache.get('fonts')
+    if not isinstance(fonts, dict):
+        return None
+    if any(font is not None and not os.path.isfile(font) for font in fonts.values()):
+        return None
+    return fonts
+
+
+def write_font_cache(path, dirs_key, fonts):
+    """
+    Store resolved font paths.
+
+    Args:
+        path: Cache file path
+        dirs_key: font_dirs_key() the fonts were resolved under
+        fonts: Dict of role -> font path or None
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'font_dirs': dirs_key, 'fonts': fonts}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not write font cache: {e}")
+
+
+def resolve_japanese_font(cache_path=FONT_CACHE_FILE):
+    """
+    Get a font file that renders Japanese, from the cache when the font
+    directories haven't changed since it was written.
+
+    Requires pygame.font to be initialized.
+
+    Args:
+        cache_path: Font cache file
+
+    Returns:
+        Font file path, or None to use pygame's default font
+    """
+    dirs_key = font_dirs_key()
+    fonts = read_font_cache(cache_path, dirs_key)
+    if fonts is not None and 'japanese' in fonts:
+        return fonts['japanese']
+
+    path = discover_japanese_font()
+    if path is None:
+        print("No Japanese font found; install Noto Sans CJK or IPA fonts to display kanji")
+    else:
+        print(f"Japanese font: {path}")
+    write_font_cache(cache_path, dirs_key, {'japanese': path})
+    return path
@@ -0,0 +1,234 @@
+"""
+Font registry and rendered-text cache shared by all screens.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from config import TEXT_CACHE_SIZE, TEXT_LAYOUT_CACHE_SIZE
+
+WRAP_SLACK_PER_WORD = 2  # Pixels a summed word width may differ from the measured line
+
+
+class FontRegistry:
+    """Creates each (face, size) font once and hands out the same object."""
+
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, size, name=None):
+        """
+        Get a font loaded from a file.
+
+        Args:
+            size: Point size
+            name: Font file path, or None for pygame's default font
+
+        Returns:
+            pygame.font.Font
+        """
+        key = ('file', name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def get_sys(self, name, size):
+        """
+        Get a system font by name.
+
+        Args:
+            name: System font name
+            size: Point size
+
+        Returns:
+            pygame.font.Font
+        """
+        key = ('sys', name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            self._fonts[key] = font
+        return font
+
+    def __len__(self):
+        return len(self._fonts)
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces.
+
+    Surfaces are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Render text, reusing the surface from an earlier identical call.
+
+        Args:
+            font: pygame.font.Font to render with
+            text: Text to render
+            color: RGB color
+            antialias: Whether to antialias
+
+        Returns:
+            pygame.Surface
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface."""
+        self._surfaces.clear()
+
+    def stats(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, entries and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._surfaces),
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+class TextLayoutCache:
+    """Bounded LRU cache of word-wrapped text.
+
+    Each entry holds the line breaks for (text, font, max_width) and the
+    rendered line surfaces for every color the text was drawn in.
+    """
+
+    def __init__(self, max_entries=TEXT_LAYOUT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (text, font, max_width) -> (lines, {color: surfaces})
+
+    def render(self, text, font, color, max_width):
+        """
+        Wrap and render text, reusing earlier results.
+
+        Args:
+            text: Text to wrap at spaces
+            font: pygame.font.Font to measure and render with
+            color: RGB color
+            max_width: Maximum line width in pixels
+
+        Returns:
+            Tuple of line surfaces, top to bottom
+        """
+        lines, rendered = self._entry(text, font, max_width)
+        color = tuple(color)
+        surfaces = rendered.get(color)
+        if surfaces is None:
+            surfaces = tuple(font.render(line, True, color) for line in lines)
+            rendered[color] = surfaces
+        return surfaces
+
+    def layout(self, text, font, max_width):
+        """
+        Get the line breaks for text.
+
+        Args:
+            text: Text to wrap at spaces
+            font: pygame.font.Font to measure with
+            max_width: Maximum line width in pixels
+
+        Returns:
+            Tuple of lines
+        """
+        return self._entry(text, font, max_width)[0]
+
+    def clear(self):
+        """Drop every cached layout."""
+        self._entries.clear()
+
+    def _entry(self, text, font, max_width):
+        key = (text, font, max_width)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+
+        entry = (wrap_text(text, font, max_width), {})
+        self._entries[key] = entry
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+
+def wrap_text(text, font, max_width):
+    """
+    Split text into lines no wider than max_width.
+
+    Each word is measured once and line widths are accumulated, rather than
+    re-measuring every growing line. Summed widths can be off by a pixel or
+    so per word from the rendered line, so a line is only measured as a
+    whole when the sum lands that close to max_width. A word wider than
+    max_width gets a line of its own.
+
+    Args:
+        text: Text to wrap at spaces
+        font: pygame.font.Font to measure with
+        max_width: Maximum line width in pixels
+
+    Returns:
+        Tuple of lines
+    """
+    space_width = font.size(' ')[0]
+    lines = []
+    current_line = []
+    current_width = 0
+
+    for word in text.split(' '):
+        word_width = font.size(word)[0]
+        if not current_line:
+            current_line = [word]
+            current_width = word_width
+            continue
+
+        estimate = current_width + space_width + word_width
+        slack = WRAP_SLACK_PER_WORD * len(current_line)
+        if estimate + slack <= max_width:
+            fits = True
+        elif estimate - slack > max_width:
+            fits = False
+        else:
+            exact = font.size(' '.join(current_line + [word]))[0]
+            fits = exact <= max_width
+            estimate = exact
+
+        if fits:
+            current_line.append(word)
+            current_width = estimate
+        else:
+            lines.append(' '.join(current_line))
+            current_line = [word]
+            current_width = word_width
+
+    if current_line:
+        lines.append(' '.join(current_line))
+    return tuple(lines)
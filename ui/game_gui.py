@@ -7,23 +7,38 @@ import random
 import time
 import threading
 import math
-import json
-import os
-from queue import Queue
-from datetime import datetime
+import uuid
 
 from config import *
 from utils import (
     get_deck_names, get_card_ids, get_cards_info, get_jisho_info,
     strip_html, contains_kanji, katakana_to_hiragana, 
-    convert_romaji_to_hiragana, generate_sound
+    SoundBank
 )
 from game import (
     save_score_to_csv, get_high_scores, calculate_points,
     CardFilter, filter_cards_by_maturity, analyze_deck_maturity,
-    MATURITY_YOUNG, MATURITY_MATURE
+    MATURITY_YOUNG, MATURITY_MATURE,
+    hydrate_cards, write_deck_snapshot, read_deck_snapshot,
+    SessionJournal, load_session, SessionState, CardPipeline,
+    SaveSlotManager, slot_metadata
 )
-from ui.particles import Particle, FireParticle, StarParticle
+from ui.particles import ParticleSystem
+from ui.background import AmbientBackground
+from ui.damage import FrameDamage
+from ui.presenter import ScaledPresenter
+from ui.profiler import FrameProfiler
+from ui.governor import QualityGovernor
+from ui.screens import build_screens
+from ui.fonts import FontRegistry, TextCache, TextLayoutCache
+from ui.font_resolver import resolve_japanese_font
+from ui.glyphs import GlyphAtlas, collect_cjk_chars, KANA
+
+
+STREAK_SOUND_EVENT = pygame.USEREVENT + 1
+# Posted by background threads when they finish, to wake an idle game loop.
+# The event's 'task' attribute names what finished.
+TASK_DONE_EVENT = pygame.USEREVENT + 2
 
 
 class VocabGameGUI:
@@ -32,7 +47,7 @@ class VocabGameGUI:
     def __init__(self, cards, deck_name=None):
         self.cards = cards
         self.deck_name = deck_name or DEFAULT_DECK_NAME
-        self.current_index = 0
+        self.session_id = None
         self.score = 0
         self.points = 0
         self.total = 0
@@ -59,6 +74,7 @@ class VocabGameGUI:
         self.countdown_start = 0
         self.countdown_number = 3
         self.game_mode = 'normal'
+        self.retry_drill = False  # Replaying missed words, not scored
         
         # Card filtering
         self.card_filter = CardFilter()
@@ -72,12 +88,21 @@ class VocabGameGUI:
         self.time_attack_start_time = 0
         self.time_attack_paused_elapsed = 0
         
-        # Word zoom animation
+        # Word zoom animation, with its values before the last simulation step
         self.word_zoom = 0.2
         self.word_distance = 1.0
+        self.prev_word_zoom = self.word_zoom
+        self.prev_word_distance = self.word_distance
+        
+        # Fixed-step simulation: time not yet simulated, and how far the
+        # frame being drawn sits between the last two steps
+        self.sim_rng = random.Random(SIMULATION_SEED)
+        self.sim_accumulator = 0.0
+        self.sim_alpha = 1.0
         
         # Particle system
-        self.particles = []
+        self.particles = ParticleSystem(seed=SIMULATION_SEED)
+        self.ambient = AmbientBackground()
         self.background_time = 0
         
         # Screen shake
@@ -85,27 +110,33 @@ class VocabGameGUI:
         self.screen_shake_y = 0
         self.screen_shake_intensity = 0
         
-        # Sound effects
-        try:
-            self.sound_correct = generate_sound(523, 0.1)  # C note
-            self.sound_incorrect = generate_sound(200, 0.15)  # Low note
-            self.sound_streak = generate_sound(659, 0.08)  # E note
-        except:
-            self.sound_correct = None
-            self.sound_incorrect = None
-            self.sound_streak = None
-        
-        # Card preloading queue
-        self.ready_cards = Queue()
+        # Sound effects, synthesized on first use
+        self.sounds = SoundBank()
+        
+        # Card preloading pipeline
+        self.pipeline = CardPipeline()
         self.preload_count = PRELOAD_COUNT
-        self.loading = True
         self.fetch_thread = None
+        self._fetch_generation = None
+        
+        # Save slots and the crash-safe autosave journal
+        self.save_slots = SaveSlotManager()
+        self.slot_name = None
+        self.journal = SessionJournal()
         
         # Create window
         self.width = WINDOW_WIDTH
         self.height = WINDOW_HEIGHT
-        self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
+        window = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
         pygame.display.set_caption(WINDOW_TITLE)
+        if RENDER_MODE == 'scaled':
+            # Screens draw to a fixed-size canvas that is scaled to the window
+            self.presenter = ScaledPresenter(window, (self.width, self.height))
+            self.screen = self.presenter.canvas
+        else:
+            self.presenter = None
+            self.screen = window
+        self._pending_window_size = None
         
         # Colors
         self.bg_color = COLOR_BG
@@ -117,7 +148,15 @@ class VocabGameGUI:
         self.gray_color = COLOR_GRAY
         self.status_color = COLOR_STATUS
         
+        # Japanese characters in the deck, pre-rasterized into the glyph atlas
+        self.deck_chars = set()
+        if cards:
+            self.deck_chars = collect_cjk_chars(strip_html(card['question']) for card in cards)
+        
         # Initialize fonts
+        self.fonts = FontRegistry()
+        self.text_cache = TextCache()
+        self.text_layouts = TextLayoutCache()
         self._initialize_fonts()
         
         # Input state
@@ -129,9 +168,6 @@ class VocabGameGUI:
         # Enable text input for IME support
         pygame.key.start_text_input()
         
-        # Initialize buttons
-        self._initialize_buttons()
-        
         # Animation state
         self.feedback_text = ""
         self.feedback_color = self.text_color
@@ -145,12 +181,23 @@ class VocabGameGUI:
         
         # Review screen scroll
         self.review_scroll = 0
-        self.review_cache = None
-        self.review_cache_scroll = -1
         
         # Clock for frame rate
         self.clock = pygame.time.Clock()
         
+        # One screen object per state; the active one gets enter/exit calls
+        self.screens = build_screens(self)
+        self.active_screen = None
+        
+        # Changed window regions; static screens are only redrawn when dirty
+        self.damage = FrameDamage(self.presenter or pygame.display)
+        
+        # Per-phase frame timings for the profiler overlay and trace export
+        self.profiler = FrameProfiler(enabled=PROFILER_ENABLED)
+        
+        # Scales effect budgets to keep gameplay at its target frame rate
+        self.governor = QualityGovernor()
+        
         # Start deck loading if needed
         if self.loading_deck:
             loading_thread = threading.Thread(target=self._load_deck, daemon=True)
@@ -158,102 +205,52 @@ class VocabGameGUI:
     
     def _initialize_fonts(self):
         """Initialize fonts with Japanese support."""
-        self.word_font = None
-        for font_name in JAPANESE_FONTS:
-            try:
-                self.word_font = pygame.font.SysFont(font_name, 72)
-                test = self.word_font.render('あ', True, (255, 255, 255))
-                if test.get_width() > 0:
-                    break
-            except:
-                continue
-        
-        if not self.word_font:
-            self.word_font = pygame.font.Font(None, 72)
-        
-        self.reading_font = None
-        for font_name in JAPANESE_FONTS:
-            try:
-                self.reading_font = pygame.font.SysFont(font_name, 32)
-                test = self.reading_font.render('あ', True, (0, 0, 0))
-                if test.get_width() > 0:
-                    break
-            except:
-                continue
-        
-        if not self.reading_font:
-            self.reading_font = pygame.font.Font(None, 32)
-        
-        self.meaning_font = pygame.font.Font(None, 24)
-        self.score_font = pygame.font.Font(None, 20)
+        # Font file that renders kana and kanji, or None for pygame's default
+        self.japanese_font_path = resolve_japanese_font()
+        
+        self.word_font = self.japanese_font(72)
+        self.reading_font = self.japanese_font(32)
+        self.meaning_font = self.fonts.get(24)
+        self.score_font = self.fonts.get(20)
+        self.glyphs = GlyphAtlas(self.japanese_font)
+        self.glyphs.queue(KANA)
+        self.glyphs.queue(self.deck_chars)
     
-    def _initialize_buttons(self):
-        """Initialize all button rectangles."""
-        self.button_rect = pygame.Rect(self.width // 2 - 100, 330, 200, 50)
-        self.button_hover = False
-        
-        # Menu buttons
-        self.play_button = pygame.Rect(self.width // 2 - 100, 250, 200, 60)
-        self.resume_game_button = pygame.Rect(self.width // 2 - 100, 330, 200, 60)
-        self.leaderboard_button = pygame.Rect(self.width // 2 - 100, 410, 200, 60)
-        self.back_button = pygame.Rect(self.width // 2 - 100, 500, 200, 50)
-        self.pause_button = pygame.Rect(self.width - 80, 10, 70, 30)
-        self.play_button_hover = False
-        self.resume_game_button_hover = False
-        self.leaderboard_button_hover = False
-        self.back_button_hover = False
-        self.pause_button_hover = False
-        
-        # Pause menu buttons
-        self.resume_button = pygame.Rect(self.width // 2 - 100, 250, 200, 60)
-        self.save_quit_button = pygame.Rect(self.width // 2 - 100, 330, 200, 60)
-        self.quit_button = pygame.Rect(self.width // 2 - 100, 410, 200, 60)
-        self.resume_button_hover = False
-        self.save_quit_button_hover = False
-        self.quit_button_hover = False
-        
-        # Retry button for connection errors
-        self.retry_button = pygame.Rect(self.width // 2 - 100, self.height // 2 + 80, 200, 50)
-        self.retry_button_hover = False
-        
-        # Mode selection buttons
-        self.normal_mode_button = pygame.Rect(self.width // 2 - 220, 250, 200, 80)
-        self.fast_mode_button = pygame.Rect(self.width // 2 + 20, 250, 200, 80)
-        self.time_attack_button = pygame.Rect(self.width // 2 - 100, 360, 200, 80)
-        self.normal_mode_hover = False
-        self.fast_mode_hover = False
-        self.time_attack_hover = False
-        
-        # Filter screen buttons
-        self.filter_checkboxes = {}
-        self.clear_filter_button = pygame.Rect(0, 0, 0, 0)
-        self.continue_filter_button = pygame.Rect(0, 0, 0, 0)
-        self.filter_back_button = pygame.Rect(0, 0, 0, 0)
-        self.clear_filter_button_hover = False
-        self.continue_filter_button_hover = False
-        self.filter_back_button_hover = False
+    def japanese_font(self, size):
+        """Get the Japanese-capable font at a size from the font registry."""
+        return self.fonts.get(size, self.japanese_font_path)
     
-    def update_button_positions(self):
-        """Update button positions based on current window size."""
-        self._initialize_buttons()
+    def start_preloader(self):
+        """Start the preload thread for the current session unless it is running."""
+        generation = self.pipeline.generation
+        if (self.fetch_thread and self.fetch_thread.is_alive()
+                and self._fetch_generation == generation):
+            return
+        self._fetch_generation = generation
+        self.fetch_thread = threading.Thread(target=self._preload_cards, args=(generation,), daemon=True)
+        self.fetch_thread.start()
     
-    def _preload_cards(self):
+    def _preload_cards(self, generation):
         """Background thread to preload cards from Jisho."""
-        while self.current_index < len(self.cards) and self.loading:
-            if self.ready_cards.qsize() < self.preload_count:
-                card = self.cards[self.current_index]
-                word = strip_html(card['question'])
-                info = get_jisho_info(word)
-                
-                if info and info['readings']:
-                    self.ready_cards.put(info)
-                    print(f"Preloaded card {self.current_index + 1}/{len(self.cards)}: {info['word']}")
-                
-                self.current_index += 1
-            else:
+        while generation == self.pipeline.generation:
+            if self.pipeline.ready_count() >= self.preload_count:
                 time.sleep(0.1)
-        
-        self.loading = False
+                continue
+            
+            claimed = self.pipeline.claim_next(generation)
+            if claimed is None:
+                break
+            
+            index, card = claimed
+            word = strip_html(card['question'])
+            info = get_jisho_info(word)
+            
+            if info and info['readings']:
+                info['card_id'] = card.get('cardId')
+                print(f"Preloaded card {index + 1}: {info['word']}")
+            else:
+                info = None
+            self.pipeline.commit(generation, index, info)
     
     def _load_deck(self):
         """Background thread to load the Anki deck."""
@@ -293,9 +290,16 @@ class VocabGameGUI:
             
             # Store all cards and analyze maturity
             self.all_cards = kanji_cards
+            self.deck_chars = collect_cjk_chars(strip_html(card['question']) for card in kanji_cards)
             self.maturity_counts = analyze_deck_maturity(kanji_cards)
             print(f"Maturity distribution: {self.maturity_counts}")
             
+            # Keep a slim local copy so saves can be resumed without the full deck
+            try:
+                write_deck_snapshot(self.deck_name, kanji_cards)
+            except OSError as e:
+                print(f"Could not write deck snapshot: {e}")
+            
             random.shuffle(kanji_cards)
             
             self.cards = kanji_cards
@@ -308,11 +312,18 @@ class VocabGameGUI:
         except Exception as e:
             self.loading_error = f"Unexpected error: {str(e)}"
             print(self.loading_error)
+        finally:
+            self._post_task_done('deck_loaded')
     
     def start_game(self):
         """Go to filter selection."""
         self.state = STATE_FILTER_SELECT
     
+    def show_leaderboard(self):
+        """Show the leaderboard with freshly read high scores."""
+        self.state = STATE_LEADERBOARD
+        self.high_scores = get_high_scores()
+    
     def continue_from_filter(self):
         """Continue from filter screen to mode selection."""
         # Apply filters to cards if any are selected
@@ -337,18 +348,56 @@ class VocabGameGUI:
     
     def _reset_card_state(self):
         """Reset card loading state for a fresh game."""
-        self.loading = False
-        if self.fetch_thread and self.fetch_thread.is_alive():
-            time.sleep(0.1)
-        
-        self.ready_cards = Queue()
-        self.current_index = 0
+        # Resetting the pipeline retires any preloader from the previous game
         random.shuffle(self.cards)
+        self.pipeline.reset(self.cards)
+        self.session_id = uuid.uuid4().hex
         self.current_info = None
     
     def start_game_with_mode(self, mode):
         """Start a new game with the selected mode."""
+        self._reset_session(mode)
+        self._reset_card_state()
+        self._start_autosave()
+    
+    def start_retry_drill(self):
+        """
+        Drill the words answered incorrectly in the last game.
+        
+        Builds the session from the readings and meanings already resolved
+        for the review list, so it starts without any Anki or Jisho lookups.
+        """
+        missed = []
+        seen = set()
+        for ans in self.incorrect_answers:
+            if ans['word'] in seen:
+                continue
+            seen.add(ans['word'])
+            missed.append({
+                'word': ans['word'],
+                # Answers restored from older saves only have the joined string
+                'readings': ans.get('readings') or ans['correct_reading'].split(' / '),
+                'meanings': ans.get('meanings', []),
+                'card_id': ans.get('card_id')
+            })
+        if not missed:
+            return
+        random.shuffle(missed)
+        
+        # A timed drill makes little sense for a handful of words
+        mode = 'normal' if self.game_mode == 'time_attack' else self.game_mode
+        self._reset_session(mode)
+        self.retry_drill = True
+        self.pipeline.reset((), missed)
+        self.session_id = uuid.uuid4().hex
+        self.current_info = None
+        self._start_autosave()
+        print(f"Retrying {len(missed)} missed words")
+    
+    def _reset_session(self, mode):
+        """Reset session counters and enter the countdown for a new game."""
         self.game_mode = mode
+        self.retry_drill = False
         self.state = STATE_COUNTDOWN
         self.countdown_start = pygame.time.get_ticks()
         self.countdown_number = 3
@@ -363,8 +412,6 @@ class VocabGameGUI:
         self.incorrect_answers = []
         self.animating = False
         self.game_over = False
-        
-        self._reset_card_state()
     
     def retry_connection(self):
         """Retry connecting to Anki deck."""
@@ -398,51 +445,31 @@ class VocabGameGUI:
     
     def save_game(self):
         """Initiate save game in background thread."""
+        # Capture on the game loop thread so the snapshot matches what is on screen
+        session_state = self.capture_session_state()
+        if self.slot_name is None:
+            # Started with every slot full; one may have been freed since
+            slot_name = self.save_slots.allocate()
+            if slot_name is not None:
+                self._open_slot(slot_name)
         self.state = STATE_SAVING
         self.save_load_status = "Saving game..."
         self.save_load_error = None
-        save_thread = threading.Thread(target=self._save_game_thread, daemon=True)
+        save_thread = threading.Thread(target=self._save_game_thread, args=(session_state,), daemon=True)
         save_thread.start()
     
-    def _save_game_thread(self):
-        """Save the current game state to a file."""
+    def _save_game_thread(self, session_state):
+        """Save a session snapshot to a file."""
         try:
-            self.loading = False
-            
-            ready_cards_list = []
-            temp_queue = Queue()
-            while not self.ready_cards.empty():
-                card = self.ready_cards.get()
-                ready_cards_list.append(card)
-                temp_queue.put(card)
-            self.ready_cards = temp_queue
-            
-            elapsed_time = 0
-            if self.question_start_time:
-                elapsed_time = time.time() - self.question_start_time
-            
-            save_data = {
-                'deck_name': self.deck_name,
-                'game_mode': self.game_mode,
-                'current_index': self.current_index,
-                'score': self.score,
-                'points': self.points,
-                'total': self.total,
-                'streak': self.streak,
-                'incorrect_answers': self.incorrect_answers,
-                'cards': self.cards,
-                'ready_cards': ready_cards_list,
-                'current_info': self.current_info,
-                'elapsed_time': elapsed_time,
-                'word_text': self.word_text if hasattr(self, 'word_text') else '',
-                'timestamp': datetime.now().isoformat()
-            }
-            
+            if self.slot_name is None:
+                raise RuntimeError(f"all {self.save_slots.slot_count} save slots are full")
             self.save_load_status = "Writing to file..."
-            with open(SAVE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            self._checkpoint(session_state.to_save_data())
+            self.journal.flush()
+            if self.journal.error:
+                raise self.journal.error
             
-            print(f"Game saved to {SAVE_FILE}")
+            print(f"Game saved to slot {self.slot_name}")
             self.save_load_status = "Game saved!"
             time.sleep(0.5)
             self.state = STATE_MENU
@@ -451,38 +478,56 @@ class VocabGameGUI:
             self.save_load_error = f"Failed to save: {str(e)}"
             time.sleep(2)
             self.state = STATE_MENU
+        finally:
+            self._post_task_done('save_done')
     
-    def load_game(self):
+    def load_game(self, slot_name):
         """Initiate load game in background thread."""
         self.state = STATE_LOADING_SAVE
         self.save_load_status = "Loading saved game..."
         self.save_load_error = None
-        load_thread = threading.Thread(target=self._load_game_thread, daemon=True)
+        load_thread = threading.Thread(target=self._load_game_thread, args=(slot_name,), daemon=True)
         load_thread.start()
     
-    def _load_game_thread(self):
-        """Load game state from file."""
+    def _load_game_thread(self, slot_name):
+        """Load game state from a save slot."""
         try:
             self.save_load_status = "Reading save file..."
-            with open(SAVE_FILE, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data, inline_cards = load_session(
+                self.save_slots.save_path(slot_name), self.save_slots.journal_path(slot_name))
+            
+            # The session saved from this run is still live: keep its pipeline
+            # and preloader instead of re-resolving cards
+            live = save_data.get('session_id') is not None and save_data['session_id'] == self.session_id
+            if not live:
+                self.save_load_status = "Restoring cards..."
+                if save_data['deck_name'] != self.deck_name:
+                    # Deck in memory is a different one, don't match against it
+                    deck_cards = []
+                else:
+                    deck_cards = self.all_cards or []
+                cards, missing = hydrate_cards(save_data['card_ids'], inline_cards, deck_cards)
+                if missing:
+                    snapshot = read_deck_snapshot(save_data['deck_name'])
+                    cards, missing = hydrate_cards(save_data['card_ids'], inline_cards, deck_cards, snapshot)
+                if missing:
+                    print(f"Warning: {len(missing)} saved cards are no longer in the deck")
+                self.pipeline.reset(cards, save_data['ready_cards'])
+                self.session_id = save_data.get('session_id') or uuid.uuid4().hex
             
             self.save_load_status = "Restoring game state..."
             self.deck_name = save_data['deck_name']
             self.game_mode = save_data['game_mode']
-            self.current_index = save_data['current_index']
+            self.retry_drill = save_data.get('retry_drill', False)
             self.score = save_data['score']
             self.points = save_data['points']
             self.total = save_data['total']
             self.streak = save_data['streak']
             self.incorrect_answers = save_data['incorrect_answers']
-            self.cards = save_data['cards']
             self.current_info = save_data['current_info']
             self.word_text = save_data.get('word_text', '')
             
-            self.ready_cards = Queue()
-            for card_info in save_data['ready_cards']:
-                self.ready_cards.put(card_info)
+            self._open_slot(slot_name, save_data['journal_seq'])
             
             elapsed = save_data.get('elapsed_time', 0)
             self.question_start_time = time.time() - elapsed
@@ -497,14 +542,12 @@ class VocabGameGUI:
             self.game_over = False
             
             self.save_load_status = "Starting game..."
-            self.loading = True
-            self.fetch_thread = threading.Thread(target=self._preload_cards, daemon=True)
-            self.fetch_thread.start()
+            self.start_preloader()
             
             time.sleep(0.3)
             self.state = STATE_PLAYING
             
-            print(f"Game loaded from {SAVE_FILE}")
+            print(f"Game loaded from slot {slot_name}")
         except FileNotFoundError:
             print("No save file found")
             self.save_load_error = "No save file found"
@@ -515,25 +558,98 @@ class VocabGameGUI:
             self.save_load_error = f"Failed to load: {str(e)}"
             time.sleep(2)
             self.state = STATE_MENU
+        finally:
+            self._post_task_done('load_done')
     
-    @staticmethod
-    def has_save_file():
-        """Check if a save file exists."""
-        return os.path.isfile(SAVE_FILE)
+    def has_save_file(self):
+        """Check if any save slot holds a resumable game. Uses the cached index."""
+        return self.save_slots.has_slots()
     
-    @staticmethod
-    def delete_save_file():
-        """Delete the save file."""
-        try:
-            if os.path.isfile(SAVE_FILE):
-                os.remove(SAVE_FILE)
-                print(f"Deleted {SAVE_FILE}")
-        except Exception as e:
-            print(f"Error deleting save file: {e}")
+    def delete_save_file(self):
+        """Delete the current session's save slot and its journal."""
+        if self.slot_name is None:
+            return
+        # Goes through the journal writer so no queued checkpoint can recreate it
+        slot_name = self.slot_name
+        self.journal.discard(on_done=lambda: self.save_slots.remove(slot_name))
+        self.journal.flush()
+        self.slot_name = None
+        print(f"Deleted save slot {slot_name}")
+    
+    def delete_save_slot(self, slot_name):
+        """Delete a save slot chosen from the menu."""
+        self.save_slots.remove(slot_name)
+        print(f"Deleted save slot {slot_name}")
+    
+    def _open_slot(self, slot_name, seq=0):
+        """Point the autosave journal at a save slot."""
+        self.slot_name = slot_name
+        self.journal.open(self.save_slots.save_path(slot_name),
+                          self.save_slots.journal_path(slot_name), seq)
+    
+    def _start_autosave(self):
+        """
+        Give a new session an empty save slot and checkpoint it. With every
+        slot occupied the session isn't autosaved; the mode select screen
+        warns about that before the game starts.
+        """
+        slot_name = self.save_slots.allocate()
+        if slot_name is None:
+            self.slot_name = None
+            print("All save slots are full; this game will not be autosaved")
+            return
+        self._open_slot(slot_name)
+        self._checkpoint_session()
+    
+    def _checkpoint(self, save_data):
+        """Write a checkpoint to the current slot and update the slot index."""
+        slot_name = self.slot_name
+        if slot_name is None:
+            return
+        metadata = slot_metadata(save_data)
+        self.journal.checkpoint(save_data, on_done=lambda: self.save_slots.record(slot_name, metadata))
+    
+    def capture_session_state(self):
+        """
+        Take an immutable snapshot of the current session.
+        
+        Must be called from the game loop thread, which owns the counters;
+        the card pipeline is captured atomically under its own lock.
+        """
+        elapsed_time = 0
+        if self.question_start_time:
+            elapsed_time = time.time() - self.question_start_time
+        
+        return SessionState(
+            session_id=self.session_id,
+            deck_name=self.deck_name,
+            game_mode=self.game_mode,
+            pipeline=self.pipeline.snapshot(),
+            current_info=self.current_info,
+            score=self.score,
+            points=self.points,
+            total=self.total,
+            streak=self.streak,
+            incorrect_answers=tuple(self.incorrect_answers),
+            retry_drill=self.retry_drill,
+            elapsed_time=elapsed_time,
+            word_text=self.word_text if hasattr(self, 'word_text') else ''
+        )
+    
+    def _checkpoint_session(self):
+        """Compact the autosave journal into a full checkpoint."""
+        self._checkpoint(self.capture_session_state().to_save_data())
+    
+    def _journal(self, op, **fields):
+        """Record a session delta, compacting the journal when due."""
+        if self.slot_name is None:
+            return
+        if self.journal.record(op, **fields):
+            self._checkpoint_session()
     
     def leave_game(self):
         """Leave the current game and save score."""
-        if self.total > 0:
+        if self.total > 0 and not self.retry_drill:
             percentage = int(self.score / self.total * 100)
             avg_points = int(self.points / self.total)
             save_score_to_csv(self.score, self.total, self.points, percentage, avg_points, self.game_mode)
@@ -542,9 +658,6 @@ class VocabGameGUI:
         
         if self.incorrect_answers:
             self.state = STATE_REVIEW_INCORRECT
-            self.review_scroll = 0
-            self.review_cache = None
-            self.review_cache_scroll = -1
         else:
             self.state = STATE_MENU
         self.animating = False
@@ -559,13 +672,15 @@ class VocabGameGUI:
         self.romaji_buffer = ""
         self.input_active = False
         self.word_color = self.text_color
-        self.word_zoom = 0.2
-        self.word_distance = 1.0
+        self.word_zoom = self.prev_word_zoom = 0.2
+        self.word_distance = self.prev_word_distance = 1.0
         
-        if not self.ready_cards.empty():
-            self.current_info = self.ready_cards.get()
+        info = self.pipeline.pop_ready()
+        if info is not None:
+            self.current_info = info
+            self._journal('advance', info=self.current_info)
             self._display_word()
-        elif not self.loading:
+        elif not self.pipeline.has_pending():
             self.show_final_score()
         else:
             self.status_text = "Loading cards..."
@@ -575,6 +690,8 @@ class VocabGameGUI:
     def _display_word(self):
         """Display the word in the UI."""
         self.word_text = self.current_info['word']
+        # Rasterize once per card; the zoom animation only scales this
+        self.screens[STATE_PLAYING].prepare_word(self.word_text)
         self.status_text = ""
         self.input_active = True
         self.question_start_time = time.time()
@@ -613,6 +730,15 @@ class VocabGameGUI:
             self.streak = 0
             self.last_points_earned = 0
             self.animate_incorrect(correct_readings)
+        
+        self._journal(
+            'answer',
+            score=self.score,
+            points=self.points,
+            total=self.total,
+            streak=self.streak,
+            incorrect=None if is_correct else self.incorrect_answers[-1]
+        )
     
     def animate_correct(self):
         """Animate correct answer."""
@@ -622,45 +748,32 @@ class VocabGameGUI:
         self.word_color = self.correct_color
         
         if self.streak >= 10:
-            self.screen_shake_intensity = min(5 + (self.streak - 10) * 2, 40)
+            self.screen_shake_intensity = min(5 + (self.streak - 10) * 2, 40) * self.governor.factor('shake')
         
-        if self.sound_correct:
-            self.sound_correct.play()
-        if self.streak >= 5 and self.sound_streak:
-            pygame.time.set_timer(pygame.USEREVENT + 1, 100, 1)
+        self.sounds.play('correct')
+        if self.streak >= 5:
+            pygame.time.set_timer(STREAK_SOUND_EVENT, 100, 1)
         
         # Create particles
         particle_count = int(50 * pow(max(1, self.streak), 0.5))
-        particle_count = min(particle_count, 300)
-        for _ in range(particle_count):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            vx = random.uniform(-150, 150)
-            vy = random.uniform(-200, -50)
-            color = self.correct_color
-            particle = Particle(x, y, color, vx, vy, random.uniform(0.5, 1.5), random.uniform(3, 8))
-            self.particles.append(particle)
+        particle_count = self.governor.count('particles', min(particle_count, 300))
+        self.particles.emit_scatter(particle_count, self.width, self.height, self.correct_color,
+                                    (-150, 150), (-200, -50), (0.5, 1.5), (3, 8))
         
         # Star burst effects at 10+ streak
         if self.streak >= 10:
             corners = [(0, 0), (self.width, 0), (0, self.height), (self.width, self.height)]
-            star_count = min(15 + self.streak, 40)
+            star_count = self.governor.count('stars', min(15 + self.streak, 40))
             for corner_x, corner_y in corners:
-                for _ in range(star_count // 4):
-                    angle = random.uniform(0, math.pi / 2)
-                    if corner_x == 0 and corner_y == 0:
-                        angle = random.uniform(0, math.pi / 2)
-                    elif corner_x == self.width and corner_y == 0:
-                        angle = random.uniform(math.pi / 2, math.pi)
-                    elif corner_x == 0 and corner_y == self.height:
-                        angle = random.uniform(-math.pi / 2, 0)
-                    else:
-                        angle = random.uniform(math.pi, 3 * math.pi / 2)
-                    
-                    speed = random.uniform(100, 300)
-                    vx = speed * math.cos(angle)
-                    vy = speed * math.sin(angle)
-                    self.particles.append(StarParticle(corner_x, corner_y, vx, vy))
+                if corner_x == 0 and corner_y == 0:
+                    angles = (0, math.pi / 2)
+                elif corner_x == self.width and corner_y == 0:
+                    angles = (math.pi / 2, math.pi)
+                elif corner_x == 0 and corner_y == self.height:
+                    angles = (-math.pi / 2, 0)
+                else:
+                    angles = (math.pi, 3 * math.pi / 2)
+                self.particles.emit_stars(corner_x, corner_y, star_count // 4, angles, (100, 300))
         
         # Show meanings
         if self.current_info['meanings']:
@@ -678,21 +791,19 @@ class VocabGameGUI:
         self.incorrect_answers.append({
             'word': self.current_info['word'],
             'correct_reading': ' / '.join(correct_readings),
-            'your_answer': self.input_text.strip()
+            'your_answer': self.input_text.strip(),
+            # Kept so missed words can be drilled again without new lookups
+            'readings': list(correct_readings),
+            'meanings': self.current_info['meanings'],
+            'card_id': self.current_info.get('card_id')
         })
         
-        if self.sound_incorrect:
-            self.sound_incorrect.play()
+        self.sounds.play('incorrect')
         
         # Create particles
-        for _ in range(40):
-            x = random.randint(0, self.width)
-            y = random.randint(0, self.height)
-            vx = random.uniform(-100, 100)
-            vy = random.uniform(-150, -30)
-            color = self.incorrect_color
-            particle = Particle(x, y, color, vx, vy, random.uniform(0.4, 1.2), random.uniform(3, 6))
-            self.particles.append(particle)
+        particle_count = self.governor.count('particles', 40)
+        self.particles.emit_scatter(particle_count, self.width, self.height, self.incorrect_color,
+                                    (-100, 100), (-150, -30), (0.4, 1.2), (3, 6))
         
         # Show meanings
         if self.current_info['meanings']:
@@ -754,7 +865,9 @@ class VocabGameGUI:
         percentage = int(self.score / self.total * 100) if self.total > 0 else 0
         avg_points = int(self.points / self.total) if self.total > 0 else 0
         
-        save_score_to_csv(self.score, self.total, self.points, percentage, avg_points, self.game_mode)
+        # Drills of missed words don't count towards the leaderboard
+        if not self.retry_drill:
+            save_score_to_csv(self.score, self.total, self.points, percentage, avg_points, self.game_mode)
         self.delete_save_file()
         self.high_scores = get_high_scores()
         
@@ -762,275 +875,330 @@ class VocabGameGUI:
         self.input_active = False
     
     def draw_text_wrapped(self, text, font, color, y_pos, max_width=500, draw_target=None):
-        """Draw text with word wrapping."""
+        """Draw text with word wrapping. Line breaks and line surfaces are cached."""
         if draw_target is None:
             draw_target = self.screen
         
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if font.size(test_line)[0] <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        for i, line in enumerate(lines):
-            text_surface = font.render(line, True, color)
+        for i, text_surface in enumerate(self.text_layouts.render(text, font, color, max_width)):
             text_rect = text_surface.get_rect(center=(self.width // 2, y_pos + i * 25))
             draw_target.blit(text_surface, text_rect)
     
+    def current_screen(self):
+        """
+        Get the screen for the current state, running exit/enter hooks if the state changed.
+        
+        Returns:
+            Screen
+        """
+        screen = self.screens[self.state]
+        if screen is not self.active_screen:
+            if self.active_screen is not None:
+                self.active_screen.exit()
+            self.active_screen = screen
+            screen.enter()
+            self.damage.invalidate()
+        return screen
+    
     def draw(self):
-        """Draw the UI based on current state."""
-        # Import screen drawing methods here to avoid circular imports
-        from ui.screens.menu_screen import draw_menu, draw_mode_select
-        from ui.screens.game_screen import draw_game, draw_countdown, draw_paused, draw_game_over
-        from ui.screens.leaderboard_screen import draw_leaderboard
-        from ui.screens.review_screen import draw_review_incorrect
-        from ui.screens.loading_screen import draw_loading, draw_loading_save, draw_saving
-        from ui.screens.filter_screen import draw_filter_screen
-        
-        if self.state == STATE_LOADING:
-            draw_loading(self)
-        elif self.state == STATE_LOADING_SAVE:
-            draw_loading_save(self)
-        elif self.state == STATE_SAVING:
-            draw_saving(self)
-        elif self.state == STATE_MENU:
-            draw_menu(self)
-        elif self.state == STATE_FILTER_SELECT:
-            draw_filter_screen(self)
-        elif self.state == STATE_MODE_SELECT:
-            draw_mode_select(self)
-        elif self.state == STATE_COUNTDOWN:
-            draw_countdown(self)
-        elif self.state == STATE_LEADERBOARD:
-            draw_leaderboard(self)
-        elif self.state == STATE_PLAYING:
-            draw_game(self)
-        elif self.state == STATE_PAUSED:
-            draw_paused(self)
-        elif self.state == STATE_GAME_OVER:
-            draw_game_over(self)
-        elif self.state == STATE_REVIEW_INCORRECT:
-            draw_review_incorrect(self)
-        
-        pygame.display.flip()
+        """Draw the UI based on current state, skipping static screens that haven't changed."""
+        screen = self.current_screen()
+        if self.state in STATIC_STATES:
+            if not self.damage.is_dirty:
+                self.damage.skip()
+                return
+        else:
+            self.damage.invalidate()
+        
+        screen.draw()
+        if self.profiler.overlay_visible:
+            self.profiler.draw_overlay(self.screen, self.fonts.get(14), self._profiler_counters())
+        self.profiler.mark('draw')
+        self.damage.present()
+        self.profiler.mark('present')
+    
+    def update(self, dt):
+        """
+        Advance everything that changes without input, once per frame.
+        
+        Effects run in fixed simulation steps; this runs as many as the
+        frame's time covers and leaves the remainder for the next frame.
+        
+        Args:
+            dt: Delta time in seconds
+        """
+        self.background_time += dt
+        
+        # Rasterize a few queued deck glyphs per frame
+        if self.glyphs.pending:
+            self.glyphs.build_step()
+        
+        # Check time attack expiration
+        if self.state == STATE_PLAYING and self.game_mode == 'time_attack' and self.time_attack_start_time > 0:
+            elapsed_time = (pygame.time.get_ticks() - self.time_attack_start_time) / 1000.0
+            if elapsed_time >= self.time_attack_duration:
+                self.show_final_score()
+        
+        # Pick up save slots changed outside this window (throttled)
+        self.save_slots.poll()
+        
+        # Update animations
+        self.update_animation()
+        self.current_screen().update(dt)
+        self.profiler.mark('animation')
+        
+        step = 1 / SIMULATION_RATE
+        self.sim_accumulator += dt
+        steps = 0
+        # The epsilon keeps float rounding in dt from costing a step
+        while self.sim_accumulator >= step - 1e-9 and steps < MAX_SIMULATION_STEPS:
+            self.simulate(step)
+            self.sim_accumulator -= step
+            steps += 1
+        # After a stall, drop the backlog rather than fall further behind
+        self.sim_accumulator = max(0.0, min(self.sim_accumulator, step))
+        self.sim_alpha = self.sim_accumulator / step
+    
+    def simulate(self, step):
+        """
+        Advance the effects by one fixed step.
+        
+        Args:
+            step: Step length in seconds
+        """
+        self.particles.update(step)
+        self.profiler.mark('particles')
+        
+        # Word zoom while waiting for an answer
+        self.prev_word_zoom = self.word_zoom
+        self.prev_word_distance = self.word_distance
+        if self.state == STATE_PLAYING and not self.animating and self.input_active:
+            self.word_zoom = min(1.0, self.word_zoom + WORD_ZOOM_SPEED * step)
+            eased_zoom = 1.0 - math.pow(1.0 - self.word_zoom, 3)
+            self.word_distance = 1.0 - (eased_zoom * 0.5)
+        
+        # Streak fire from the window edges
+        if self.state == STATE_PLAYING and self.streak >= 5:
+            # Chance per 1/60 s, scaled to the step
+            chance = min(0.3 + (self.streak * 0.05), 0.95) * self.governor.factor('fire')
+            if self.sim_rng.random() < chance * step * 60:
+                self._spawn_fire()
+        
+        # Screen shake, decaying by 0.9 per 1/60 s
+        if self.screen_shake_intensity > 0:
+            self.screen_shake_x = self.sim_rng.uniform(-self.screen_shake_intensity, self.screen_shake_intensity)
+            self.screen_shake_y = self.sim_rng.uniform(-self.screen_shake_intensity, self.screen_shake_intensity)
+            self.screen_shake_intensity *= 0.9 ** (step * 60)
+            if self.screen_shake_intensity < 0.5:
+                self.screen_shake_intensity = 0
+                self.screen_shake_x = 0
+                self.screen_shake_y = 0
+        self.profiler.mark('animation')
+    
+    def interpolate(self, previous, current):
+        """
+        Blend a simulated value for drawing between simulation steps.
+        
+        Args:
+            previous: Value before the last step
+            current: Value after the last step
+        
+        Returns:
+            float
+        """
+        return previous + (current - previous) * self.sim_alpha
     
-    def run(self):
-        """Start the game loop."""
+    def _spawn_fire(self):
+        """Emit a fire particle at a random point on the window edge."""
+        rng = self.sim_rng
+        edge = rng.randint(0, 3)
+        if edge == 0:
+            fire_x = rng.randint(0, self.width)
+            fire_y = 0
+        elif edge == 1:
+            fire_x = self.width
+            fire_y = rng.randint(0, self.height)
+        elif edge == 2:
+            fire_x = rng.randint(0, self.width)
+            fire_y = self.height
+        else:
+            fire_x = 0
+            fire_y = rng.randint(0, self.height)
+        self.particles.emit_fire(fire_x, fire_y)
+    
+    def run(self, on_first_frame=None):
+        """
+        Start the game loop.
+        
+        Args:
+            on_first_frame: Optional function called once the first frame is on screen
+        """
         running = True
+        first_frame = True
         
         while running:
-            dt = self.clock.tick(60) / 1000.0
-            self.background_time += dt
-            
-            # Update particles
-            self.particles = [p for p in self.particles if p.update(dt)]
+            if self.state in STATIC_STATES and not self.damage.is_dirty:
+                # Nothing animates: sleep until input or a background task wakes us
+                event = pygame.event.wait(IDLE_WAIT_TIMEOUT)
+                events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+                dt = self.clock.tick() / 1000.0
+            else:
+                dt = self.clock.tick(self._frame_rate()) / 1000.0
+                events = pygame.event.get()
+            frame_start = time.perf_counter()
+            self.profiler.begin_frame()
             
-            for event in pygame.event.get():
+            for event in events:
+                # Anything but pointer movement may change a static screen
+                if event.type != pygame.MOUSEMOTION:
+                    self.damage.invalidate()
+                
                 if event.type == pygame.QUIT:
                     running = False
                 
                 elif event.type == pygame.VIDEORESIZE:
-                    self.width = event.w
-                    self.height = event.h
-                    self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
-                    self.update_button_positions()
+                    # Applied once after this batch; dragging the window edge sends many
+                    self._pending_window_size = (event.w, event.h)
                 
-                elif event.type == pygame.USEREVENT + 1:
-                    if self.sound_streak:
-                        self.sound_streak.play()
+                elif event.type == STREAK_SOUND_EVENT:
+                    self.sounds.play_streak(self.streak)
                 
-                elif event.type == pygame.TEXTINPUT:
-                    if self.state == STATE_PLAYING and self.input_active and not self.animating:
-                        if any('\u3040' <= c <= '\u30ff' for c in event.text):
-                            self.input_text += event.text
-                        else:
-                            self.romaji_buffer += event.text.lower()
-                            self.input_text = convert_romaji_to_hiragana(self.romaji_buffer)
-                        print(f"Input: {self.input_text} (romaji: {self.romaji_buffer})")
+                elif event.type == TASK_DONE_EVENT:
+                    if event.task == 'deck_loaded':
+                        self.glyphs.queue(self.deck_chars)
                 
-                elif event.type == pygame.TEXTEDITING:
-                    if self.state == STATE_PLAYING:
-                        self.composition = event.text
-                        print(f"Composing: {self.composition}")
+                elif event.type in (pygame.TEXTINPUT, pygame.TEXTEDITING):
+                    self.screens[self.state].handle_text(event)
                 
                 elif event.type == pygame.KEYDOWN:
-                    self._handle_keydown(event, running)
+                    self._handle_keydown(event)
                 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if self.state == STATE_REVIEW_INCORRECT:
-                        if event.button == 4:
-                            self.review_scroll -= 30
-                        elif event.button == 5:
-                            self.review_scroll += 30
+                    # Buttons 4 and 5 are the scroll wheel
+                    if event.button == 4:
+                        self.screens[self.state].scroll(-30)
+                    elif event.button == 5:
+                        self.screens[self.state].scroll(30)
                     
-                    self.handle_mouse_click(event.pos)
+                    self.handle_mouse_click(self._logical_pos(event.pos))
                 
                 elif event.type == pygame.MOUSEMOTION:
-                    self.update_button_hover(event.pos)
-            
-            # Check time attack expiration
-            if self.state == STATE_PLAYING and self.game_mode == 'time_attack' and self.time_attack_start_time > 0:
-                elapsed_time = (pygame.time.get_ticks() - self.time_attack_start_time) / 1000.0
-                if elapsed_time >= self.time_attack_duration:
-                    self.show_final_score()
+                    hover_before = self._hover_snapshot()
+                    self.update_button_hover(self._logical_pos(event.pos))
+                    if self._hover_snapshot() != hover_before:
+                        for rect in self._hover_regions():
+                            self.damage.invalidate(rect)
             
-            # Update animations
-            self.update_animation()
+            if self._pending_window_size is not None:
+                self._apply_resize(self._pending_window_size)
+                self._pending_window_size = None
+            self.profiler.mark('events')
             
-            # Update screen shake
-            if self.screen_shake_intensity > 0:
-                self.screen_shake_x = random.uniform(-self.screen_shake_intensity, self.screen_shake_intensity)
-                self.screen_shake_y = random.uniform(-self.screen_shake_intensity, self.screen_shake_intensity)
-                self.screen_shake_intensity *= 0.9
-                if self.screen_shake_intensity < 0.5:
-                    self.screen_shake_intensity = 0
-                    self.screen_shake_x = 0
-                    self.screen_shake_y = 0
+            self.update(dt)
             
             # Draw everything
             self.draw()
-        
+            self.profiler.end_frame(len(self.particles))
+            if self.state == STATE_PLAYING:
+                self.governor.observe((time.perf_counter() - frame_start) * 1000)
+            
+            if first_frame:
+                first_frame = False
+                if on_first_frame:
+                    on_first_frame()
+                # The mixer is slow to open; do it once the window is showing
+                self._init_audio()
+        
+        self.journal.flush()
         pygame.quit()
     
-    def _handle_keydown(self, event, running):
-        """Handle keyboard input."""
-        if self.state == STATE_LOADING and self.loading_error:
-            if event.key == pygame.K_ESCAPE:
-                running = False
-            elif event.key == pygame.K_r:
-                self.retry_connection()
-        elif self.state == STATE_PAUSED:
-            if event.key == pygame.K_ESCAPE or event.key == pygame.K_SPACE:
-                self.resume_game()
-        elif self.state == STATE_PLAYING:
-            if event.key == pygame.K_ESCAPE:
-                self.pause_game()
-            elif event.key == pygame.K_RETURN:
-                if self.input_active and not self.animating:
-                    self.check_answer()
-                elif self.can_skip and self.animating:
-                    self.next_word()
-            elif self.input_active and not self.animating:
-                if event.key == pygame.K_BACKSPACE:
-                    if len(self.input_text) > 0:
-                        self.input_text = self.input_text[:-1]
-                        while len(self.romaji_buffer) > 0:
-                            test_conversion = convert_romaji_to_hiragana(self.romaji_buffer)
-                            if test_conversion == self.input_text:
-                                break
-                            self.romaji_buffer = self.romaji_buffer[:-1]
-                    print(f"Input: {self.input_text} (romaji: {self.romaji_buffer})")
+    def _init_audio(self):
+        """Open the mixer if it isn't already. The game runs silently if it can't."""
+        if pygame.mixer.get_init():
+            return
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Audio unavailable: {e}")
+    
+    def _apply_resize(self, size):
+        """
+        Adapt to a new window size.
+        
+        Args:
+            size: (width, height) of the window
+        """
+        window = pygame.display.set_mode(size, pygame.RESIZABLE)
+        if self.presenter is not None:
+            # Layout and caches are in canvas pixels, so only the scaling changes
+            self.presenter.resize(window)
+            return
+        
+        self.width, self.height = size
+        self.screen = window
+        for screen in self.screens.loaded():
+            screen.resize()
+    
+    def _logical_pos(self, pos):
+        """Map a window position to the coordinates screens lay out in."""
+        if self.presenter is None:
+            return pos
+        return self.presenter.to_logical(pos)
+    
+    def _handle_keydown(self, event):
+        """Handle keyboard input: the profiler keys, then the current screen's."""
+        if event.key == pygame.K_F3:
+            self.profiler.toggle_overlay()
+        elif event.key == pygame.K_F4:
+            if self.profiler.enabled:
+                frames = self.profiler.export_trace()
+                print(f"Wrote {frames} profiled frames to {PROFILER_TRACE_FILE}")
+            else:
+                print("Profiler is off; press F3 to start recording")
+        else:
+            self.screens[self.state].handle_key(event)
     
     def handle_mouse_click(self, pos):
-        """Handle mouse clicks based on current state."""
-        if self.state == STATE_LOADING and self.loading_error:
-            if self.retry_button.collidepoint(pos):
-                self.retry_connection()
-        elif self.state == STATE_MENU:
-            if self.play_button.collidepoint(pos):
-                self.start_game()
-            elif self.has_save_file() and self.resume_game_button.collidepoint(pos):
-                self.load_game()
-            elif self.leaderboard_button.collidepoint(pos):
-                self.state = STATE_LEADERBOARD
-                self.high_scores = get_high_scores()
-        
-        elif self.state == STATE_FILTER_SELECT:
-            # Check checkbox clicks
-            for level, rect in self.filter_checkboxes.items():
-                if rect.collidepoint(pos):
-                    self.card_filter.toggle_maturity_level(level)
-                    break
-            
-            # Check button clicks
-            if self.clear_filter_button.collidepoint(pos):
-                self.card_filter.clear()
-            elif self.continue_filter_button.collidepoint(pos):
-                self.continue_from_filter()
-            elif self.filter_back_button.collidepoint(pos):
-                self.state = STATE_MENU
-        
-        elif self.state == STATE_MODE_SELECT:
-            if self.normal_mode_button.collidepoint(pos):
-                self.start_game_with_mode('normal')
-            elif self.fast_mode_button.collidepoint(pos):
-                self.start_game_with_mode('fast')
-            elif self.time_attack_button.collidepoint(pos):
-                self.start_game_with_mode('time_attack')
-            elif self.back_button.collidepoint(pos):
-                self.state = STATE_FILTER_SELECT
-        
-        elif self.state == STATE_LEADERBOARD:
-            if self.back_button.collidepoint(pos):
-                self.state = STATE_MENU
-        
-        elif self.state == STATE_PLAYING:
-            if self.button_rect.collidepoint(pos) and not self.animating:
-                self.check_answer()
-            elif self.pause_button.collidepoint(pos):
-                self.pause_game()
-        
-        elif self.state == STATE_PAUSED:
-            if self.resume_button.collidepoint(pos):
-                self.resume_game()
-            elif self.save_quit_button.collidepoint(pos):
-                self.save_game()
-            elif self.quit_button.collidepoint(pos):
-                self.leave_game()
-        
-        elif self.state == STATE_GAME_OVER:
-            if self.button_rect.collidepoint(pos):
-                self.state = STATE_MENU
-        
-        elif self.state == STATE_REVIEW_INCORRECT:
-            if self.button_rect.collidepoint(pos):
-                self.state = STATE_MENU
+        """Pass a mouse click to the current screen."""
+        self.screens[self.state].handle_click(pos)
     
     def update_button_hover(self, pos):
-        """Update button hover states based on mouse position."""
-        if self.state == STATE_LOADING and self.loading_error:
-            self.retry_button_hover = self.retry_button.collidepoint(pos)
-        
-        elif self.state == STATE_MENU:
-            self.play_button_hover = self.play_button.collidepoint(pos)
-            self.resume_game_button_hover = self.resume_game_button.collidepoint(pos)
-            self.leaderboard_button_hover = self.leaderboard_button.collidepoint(pos)
-        
-        elif self.state == STATE_FILTER_SELECT:
-            self.clear_filter_button_hover = self.clear_filter_button.collidepoint(pos)
-            self.continue_filter_button_hover = self.continue_filter_button.collidepoint(pos)
-            self.filter_back_button_hover = self.filter_back_button.collidepoint(pos)
-        
-        elif self.state == STATE_MODE_SELECT:
-            self.normal_mode_hover = self.normal_mode_button.collidepoint(pos)
-            self.fast_mode_hover = self.fast_mode_button.collidepoint(pos)
-            self.time_attack_hover = self.time_attack_button.collidepoint(pos)
-            self.back_button_hover = self.back_button.collidepoint(pos)
-        
-        elif self.state == STATE_LEADERBOARD:
-            self.back_button_hover = self.back_button.collidepoint(pos)
-        
-        elif self.state == STATE_PLAYING:
-            self.button_hover = self.button_rect.collidepoint(pos)
-            self.pause_button_hover = self.pause_button.collidepoint(pos)
-        
-        elif self.state == STATE_PAUSED:
-            self.resume_button_hover = self.resume_button.collidepoint(pos)
-            self.save_quit_button_hover = self.save_quit_button.collidepoint(pos)
-            self.quit_button_hover = self.quit_button.collidepoint(pos)
-        
-        elif self.state == STATE_GAME_OVER:
-            self.button_hover = self.button_rect.collidepoint(pos)
-        
-        elif self.state == STATE_REVIEW_INCORRECT:
-            self.button_hover = self.button_rect.collidepoint(pos)
+        """Update the current screen's button hover state."""
+        self.screens[self.state].update_hover(pos)
+    
+    def _hover_snapshot(self):
+        """Current hover state of the current screen's buttons."""
+        return self.screens[self.state].hover_state()
+    
+    def _hover_regions(self):
+        """
+        Get the regions to redraw after a hover change.
+        
+        Returns:
+            List of button rects for static screens, [None] (whole window) otherwise
+        """
+        return self.screens[self.state].hover_regions()
+    
+    def _profiler_counters(self):
+        """Live counts shown under the profiler graph."""
+        text_stats = self.text_cache.stats()
+        return {
+            'fps': f"{self.clock.get_fps():.0f}",
+            'particles': len(self.particles),
+            'text cache': f"{text_stats['entries']} ({text_stats['hit_rate']:.0%} hits)",
+            'layers built': sum(screen.layers.builds for screen in self.screens.loaded() if screen.layers is not None),
+            'glyphs': f"{len(self.glyphs)} ({self.glyphs.pending} queued)",
+            'frames': f"{self.damage.presented} presented, {self.damage.skipped} skipped",
+            'quality': f"{self.governor.preset} x{self.governor.scale:.2f}",
+        }
+    
+    def _frame_rate(self):
+        """Frame rate cap for the current state."""
+        return STATE_FRAME_RATES.get(self.state, FPS_AMBIENT)
+    
+    def _post_task_done(self, task):
+        """Wake the game loop from a background thread."""
+        try:
+            pygame.event.post(pygame.event.Event(TASK_DONE_EVENT, task=task))
+        except pygame.error:
+            # Display already shut down
+            pass
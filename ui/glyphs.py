@@ -0,0 +1,139 @@
+"""
+Glyph atlas for Japanese text.
+
+Rasterizing a multi-character CJK string with the TTF renderer is slow, and
+every distinct string (each new card, each keystroke in the input box) is a
+fresh rasterization. The atlas rasterizes each character once per size, in
+white, and composes strings by blitting glyphs at their cached advances and
+tinting the result. Characters from the loaded deck and all kana are queued
+up front and rasterized a few at a time between frames; anything else is
+rasterized on first use.
+"""
+
+from collections import OrderedDict, deque
+
+import pygame
+
+from config import GLYPH_ATLAS_SIZES, GLYPH_ATLAS_BUILD_BUDGET, GLYPH_TEXT_CACHE_SIZE
+
+
+KANA = (
+    [chr(c) for c in range(0x3041, 0x3097)]    # Hiragana
+    + [chr(c) for c in range(0x30A1, 0x30FB)]  # Katakana
+    + ['ー', '、', '。', '・']
+)
+
+
+def collect_cjk_chars(texts):
+    """
+    Get the Japanese characters used in some texts.
+
+    Args:
+        texts: Iterable of strings
+
+    Returns:
+        Set of characters in the CJK blocks (U+3000 and up)
+    """
+    chars = set()
+    for text in texts:
+        chars.update(c for c in text if c >= '　')
+    return chars
+
+
+class GlyphAtlas:
+    """Per-size glyph cache that composes strings without TTF rendering."""
+
+    def __init__(self, font_for_size, sizes=GLYPH_ATLAS_SIZES,
+                 build_budget=GLYPH_ATLAS_BUILD_BUDGET, max_texts=GLYPH_TEXT_CACHE_SIZE):
+        """
+        Args:
+            font_for_size: Function returning the font to rasterize with at a point size
+            sizes: Point sizes to pre-build queued characters at
+            build_budget: Glyphs rasterized per build_step call
+            max_texts: Composed strings kept in the LRU cache
+        """
+        self.font_for_size = font_for_size
+        self.sizes = tuple(sizes)
+        self.build_budget = build_budget
+        self.max_texts = max_texts
+        self._glyphs = {}  # (size, char) -> white glyph surface
+        self._pending = deque()
+        self._texts = OrderedDict()  # (text, size, color) -> composed surface
+
+    def queue(self, chars):
+        """
+        Schedule characters to be rasterized at every atlas size.
+
+        Args:
+            chars: Iterable of characters
+        """
+        for size in self.sizes:
+            self._pending.extend((size, c) for c in sorted(set(chars))
+                                 if (size, c) not in self._glyphs)
+
+    @property
+    def pending(self):
+        """Glyphs still waiting to be rasterized."""
+        return len(self._pending)
+
+    def build_step(self, budget=None):
+        """
+        Rasterize some queued glyphs. Call between frames on the main thread.
+
+        Args:
+            budget: Maximum glyphs to rasterize, or None for build_budget
+        """
+        budget = self.build_budget if budget is None else budget
+        while self._pending and budget > 0:
+            size, char = self._pending.popleft()
+            if (size, char) not in self._glyphs:
+                self._glyph(size, char)
+                budget -= 1
+
+    def render(self, text, size, color):
+        """
+        Get text composed from atlas glyphs.
+
+        Args:
+            text: Text to draw
+            size: Point size
+            color: RGB color
+
+        Returns:
+            pygame.Surface, shared and not to be modified
+        """
+        color = tuple(color)
+        key = (text, size, color)
+        surface = self._texts.get(key)
+        if surface is not None:
+            self._texts.move_to_end(key)
+            return surface
+
+        glyphs = [self._glyph(size, c) for c in text]
+        height = self.font_for_size(size).get_height()
+        width = sum(g.get_width() for g in glyphs)
+        surface = pygame.Surface((max(1, width), height), pygame.SRCALPHA)
+        x = 0
+        blits = []
+        for glyph in glyphs:
+            blits.append((glyph, (x, 0)))
+            x += glyph.get_width()
+        surface.blits(blits, doreturn=False)
+        surface.fill(color, special_flags=pygame.BLEND_RGB_MULT)
+
+        self._texts[key] = surface
+        if len(self._texts) > self.max_texts:
+            self._texts.popitem(last=False)
+        return surface
+
+    def __len__(self):
+        return len(self._glyphs)
+
+    def _glyph(self, size, char):
+        """White glyph for a character, rasterized on first use."""
+        key = (size, char)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            glyph = self.font_for_size(size).render(char, True, (255, 255, 255))
+            self._glyphs[key] = glyph
+        return glyph
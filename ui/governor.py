@@ -0,0 +1,91 @@
+"""
+Frame-time governor for visual effects.
+
+Particle bursts, star bursts, streak fire, background dots and screen shake
+are the parts of a frame whose cost grows with the streak. The quality
+preset sets a ceiling for each of them; on top of that the governor watches
+how long recent gameplay frames took to produce and scales every effect
+down when frames run over budget, and back up when there is headroom.
+"""
+
+from config import (
+    QUALITY_PRESET, QUALITY_PRESETS, GOVERNOR_ENABLED, GOVERNOR_TARGET_FPS,
+    GOVERNOR_MIN_SCALE, GOVERNOR_WINDOW
+)
+
+
+HEADROOM = 0.8  # Aim for frames using at most this much of the frame budget
+RECOVER_BELOW = 0.5  # Scale back up once the slow frames use less than this much
+DECREASE_FACTOR = 0.75
+INCREASE_STEP = 0.05
+
+
+class QualityGovernor:
+    """Effect budgets from a quality preset, scaled by recent frame times."""
+
+    def __init__(self, preset=QUALITY_PRESET, enabled=GOVERNOR_ENABLED, target_fps=GOVERNOR_TARGET_FPS,
+                 min_scale=GOVERNOR_MIN_SCALE, window=GOVERNOR_WINDOW):
+        """
+        Args:
+            preset: Name of a preset in QUALITY_PRESETS
+            enabled: Adjust the scale from observed frame times
+            target_fps: Frame rate to keep
+            min_scale: Lowest scale the governor goes down to
+            window: Frames observed between adjustments
+        """
+        self.preset = preset
+        self.factors = QUALITY_PRESETS[preset]
+        self.enabled = enabled
+        self.budget_ms = 1000 / target_fps
+        self.min_scale = min_scale
+        self.window = window
+        self.scale = 1.0
+        self._samples = []
+
+    def observe(self, frame_ms):
+        """
+        Record how long a frame took to update and draw, excluding any wait
+        for the frame rate cap.
+
+        Args:
+            frame_ms: Frame work time in milliseconds
+        """
+        if not self.enabled:
+            return
+        self._samples.append(frame_ms)
+        if len(self._samples) < self.window:
+            return
+
+        # Judge by the slow frames, not the average: those are the visible hitches
+        self._samples.sort()
+        slow = self._samples[int(len(self._samples) * 0.9)]
+        self._samples.clear()
+        if slow > self.budget_ms * HEADROOM:
+            self.scale = max(self.min_scale, self.scale * DECREASE_FACTOR)
+        elif slow < self.budget_ms * RECOVER_BELOW:
+            self.scale = min(1.0, self.scale + INCREASE_STEP)
+
+    def factor(self, effect):
+        """
+        Get the current multiplier for an effect.
+
+        Args:
+            effect: 'particles', 'stars', 'fire', 'dots' or 'shake'
+
+        Returns:
+            float, the preset's factor times the governor's scale
+        """
+        return self.factors[effect] * self.scale
+
+    def count(self, effect, count):
+        """
+        Scale a spawn count for an effect.
+
+        Args:
+            effect: Effect name, as for factor()
+            count: Count at full quality
+
+        Returns:
+            int
+        """
+        return int(count * self.factor(effect))
@@ -0,0 +1,61 @@
+"""
+Cached static UI layers.
+
+Titles, labels and buttons on menu-style screens only change when the
+window is resized, the hovered button changes or the data they show
+changes. Screens render that content once into a layer surface, keyed by
+everything it depends on, and blit the layer over their animated
+background each frame.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from config import LAYER_CACHE_SIZE
+
+
+class LayerCache:
+    """Bounded LRU cache of pre-rendered screen layers."""
+
+    def __init__(self, max_layers=LAYER_CACHE_SIZE):
+        self.max_layers = max_layers
+        self._layers = OrderedDict()
+        self.builds = 0
+
+    def get(self, key, size, build, opaque=False):
+        """
+        Get a layer, building it on a miss.
+
+        Args:
+            key: Hashable description of everything the layer shows,
+                including the hover state
+            size: Window size; part of the cache key
+            build: Function taking the blank layer surface and drawing onto it
+            opaque: Build an opaque surface instead of a transparent one
+
+        Returns:
+            pygame.Surface of the given size
+        """
+        full_key = (key, tuple(size))
+        layer = self._layers.get(full_key)
+        if layer is not None:
+            self._layers.move_to_end(full_key)
+            return layer
+
+        if opaque:
+            layer = pygame.Surface(size)
+        else:
+            layer = pygame.Surface(size, pygame.SRCALPHA)
+        build(layer)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert() if opaque else layer.convert_alpha()
+        self.builds += 1
+        self._layers[full_key] = layer
+        if len(self._layers) > self.max_layers:
+            self._layers.popitem(last=False)
+        return layer
+
+    def clear(self):
+        """Drop every layer, e.g. after the window was resized."""
+        self._layers.clear()
@@ -1,115 +1,300 @@
 """
 Particle effects for visual feedback.
+
+All live particles are stored column-wise in one NumPy array and advanced
+with a handful of vectorized operations per simulation step. Each particle
+keeps its position from before the last step, so drawing can interpolate
+between steps. Drawing quantizes each
+particle's color, radius, fade and rotation into a sprite atlas key, so
+thousands of particles draw from a small set of pre-rendered surfaces with
+a single Surface.blits call.
 """
 
 import math
-import random
+
+import numpy as np
 import pygame
 
+from config import PARTICLE_MAX_COUNT, PARTICLE_ALPHA_LEVELS, PARTICLE_ROTATION_STEPS
 
-class Particle:
-    """Base particle class for visual effects."""
-    
-    def __init__(self, x, y, color, velocity_x=0, velocity_y=0, lifetime=1.0, size=3):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.alpha = 255
-    
-    def update(self, dt):
+
+SHAPE_CIRCLE = 0
+SHAPE_STAR = 1
+
+FIRE_COLORS = [(255, 100, 0), (255, 200, 0), (255, 150, 0), (255, 69, 0)]
+STAR_COLORS = [(255, 255, 0), (255, 255, 255), (255, 215, 0), (255, 250, 150)]
+
+# Rows of ParticleSystem._data
+(X, Y, VX, VY, LIFE, MAX_LIFE, SIZE, GRAVITY, DRAG,
+ ROTATION, ROTATION_SPEED, COLOR, SHAPE, PREV_X, PREV_Y) = range(15)
+FIELD_COUNT = 15
+
+MAX_RADIUS = 32
+STAR_SYMMETRY = 72  # A five-pointed star looks the same every 72 degrees
+
+
+class SpriteAtlas:
+    """Pre-rendered particle sprites keyed by (shape, color, radius, alpha, rotation)."""
+
+    def __init__(self, alpha_levels=PARTICLE_ALPHA_LEVELS, rotation_steps=PARTICLE_ROTATION_STEPS):
+        self.alpha_levels = alpha_levels
+        self.rotation_steps = rotation_steps
+        self._sprites = {}
+
+    def get(self, shape, color, radius, alpha_level, rotation_step):
         """
-        Update particle state.
-        
+        Get a sprite, rendering it on first use.
+
         Args:
-            dt: Delta time in seconds
-            
+            shape: SHAPE_CIRCLE or SHAPE_STAR
+            color: RGB color
+            radius: Radius in pixels
+            alpha_level: Fade bucket, 0 to alpha_levels - 1
+            rotation_step: Rotation bucket, 0 to rotation_steps - 1 (stars only)
+
         Returns:
-            True if particle is still alive, False if expired
+            pygame.Surface
         """
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
-        self.velocity_y += 200 * dt  # Gravity
-        self.lifetime -= dt
-        self.alpha = int(255 * (self.lifetime / self.max_lifetime))
-        return self.lifetime > 0
-    
-    def draw(self, surface):
-        """Draw particle to surface."""
-        if self.alpha > 0:
-            s = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-            color_with_alpha = (*self.color[:3], self.alpha)
-            pygame.draw.circle(s, color_with_alpha, (int(self.size), int(self.size)), int(self.size))
-            surface.blit(s, (int(self.x - self.size), int(self.y - self.size)))
-
-
-class FireParticle(Particle):
-    """Particle that rises upward like fire."""
-    
-    def __init__(self, x, y):
-        colors = [(255, 100, 0), (255, 200, 0), (255, 150, 0), (255, 69, 0)]
-        color = random.choice(colors)
-        velocity_x = random.uniform(-30, 30)
-        velocity_y = random.uniform(-100, -50)
-        lifetime = random.uniform(0.5, 1.0)
-        size = random.uniform(3, 6)
-        super().__init__(x, y, color, velocity_x, velocity_y, lifetime, size)
-    
-    def update(self, dt):
-        """Update fire particle - rises upward."""
-        self.velocity_y -= 50 * dt  # Rise up instead of fall
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
-        self.lifetime -= dt
-        self.alpha = int(255 * (self.lifetime / self.max_lifetime))
-        return self.lifetime > 0
-
-
-class StarParticle(Particle):
-    """Star-shaped particle for burst effects."""
-    
-    def __init__(self, x, y, velocity_x, velocity_y):
-        colors = [(255, 255, 0), (255, 255, 255), (255, 215, 0), (255, 250, 150)]
-        color = random.choice(colors)
-        lifetime = random.uniform(0.8, 1.5)
-        size = random.uniform(4, 8)
-        super().__init__(x, y, color, velocity_x, velocity_y, lifetime, size)
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-360, 360)
-    
+        key = (shape, color, radius, alpha_level, rotation_step)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            alpha = int(255 * (alpha_level + 1) / self.alpha_levels)
+            if shape == SHAPE_STAR:
+                rotation = rotation_step * STAR_SYMMETRY / self.rotation_steps
+                sprite = _render_star(color, radius, alpha, rotation)
+            else:
+                sprite = _render_circle(color, radius, alpha)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._sprites[key] = sprite
+        return sprite
+
+    def __len__(self):
+        return len(self._sprites)
+
+
+def _render_circle(color, radius, alpha):
+    """Render a filled circle sprite, 2 * radius wide."""
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius)
+    return surface
+
+
+def _render_star(color, radius, alpha, rotation):
+    """Render a five-pointed star sprite, 3 * radius wide."""
+    dim = radius * 3
+    center = dim / 2
+    points = []
+    for i in range(10):
+        angle = math.radians(rotation + i * 36)
+        r = radius if i % 2 == 0 else radius * 0.4
+        points.append((center + r * math.cos(angle), center + r * math.sin(angle)))
+    surface = pygame.Surface((dim, dim), pygame.SRCALPHA)
+    pygame.draw.polygon(surface, (*color, alpha), points)
+    return surface
+
+
+class ParticleSystem:
+    """Fixed-capacity particle pool updated with NumPy.
+
+    Each row of _data is one field (x, y, velocity, lifetime, ...) for every
+    particle; the first `count` columns are live. Expired particles are
+    removed by compacting the live columns after each update.
+    """
+
+    def __init__(self, capacity=PARTICLE_MAX_COUNT, atlas=None, seed=None):
+        """
+        Args:
+            capacity: Maximum live particles; emits beyond this are dropped
+            atlas: SpriteAtlas to draw from, or None to create one
+            seed: Seed for the emit randomness, or None for a random one
+        """
+        self._rng = np.random.default_rng(seed)
+        self.capacity = capacity
+        self.atlas = atlas or SpriteAtlas()
+        self.count = 0
+        self._data = np.zeros((FIELD_COUNT, capacity), dtype=np.float64)
+        self._colors = []        # Palette: index -> RGB tuple
+        self._color_index = {}   # RGB tuple -> index
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove every particle."""
+        self.count = 0
+
+    def emit(self, x, y, vx, vy, lifetime, size, color, gravity=200.0, drag=1.0,
+             shape=SHAPE_CIRCLE, rotation=0.0, rotation_speed=0.0):
+        """
+        Add particles. Numeric arguments may be scalars or equal-length arrays.
+
+        Args:
+            x, y: Start position
+            vx, vy: Velocity in pixels per second
+            lifetime: Seconds until the particle expires
+            size: Radius in pixels
+            color: RGB color shared by every emitted particle
+            gravity: Vertical acceleration in pixels per second squared
+            drag: Velocity multiplier per 1/60 s (1.0 for none)
+            shape: SHAPE_CIRCLE or SHAPE_STAR
+            rotation: Start rotation in degrees
+            rotation_speed: Degrees per second
+
+        Returns:
+            Number of particles actually added
+        """
+        columns = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float64) for v in
+              (x, y, vx, vy, lifetime, lifetime, size, gravity, drag,
+               rotation, rotation_speed, self._palette_index(color), shape, x, y))
+        )
+        n = columns[0].size
+        n = min(n, self.capacity - self.count)
+        if n <= 0:
+            return 0
+        start, end = self.count, self.count + n
+        for field, column in enumerate(columns):
+            self._data[field, start:end] = column.ravel()[:n]
+        self.count = end
+        return n
+
+    def emit_scatter(self, count, width, height, color, vx_range, vy_range,
+                     lifetime_range, size_range):
+        """
+        Emit particles at random positions across the screen.
+
+        Args:
+            count: Number of particles
+            width, height: Area to scatter over
+            color: RGB color
+            vx_range, vy_range: (low, high) velocity ranges
+            lifetime_range: (low, high) lifetime range in seconds
+            size_range: (low, high) radius range
+        """
+        self.emit(
+            self._rng.integers(0, width + 1, count),
+            self._rng.integers(0, height + 1, count),
+            self._rng.uniform(*vx_range, count),
+            self._rng.uniform(*vy_range, count),
+            self._rng.uniform(*lifetime_range, count),
+            self._rng.uniform(*size_range, count),
+            color
+        )
+
+    def emit_fire(self, x, y):
+        """Emit one ember that rises from (x, y)."""
+        color = FIRE_COLORS[self._rng.integers(len(FIRE_COLORS))]
+        self.emit(x, y, self._rng.uniform(-30, 30), self._rng.uniform(-100, -50),
+                  self._rng.uniform(0.5, 1.0), self._rng.uniform(3, 6), color, gravity=-50.0)
+
+    def emit_stars(self, x, y, count, angle_range, speed_range):
+        """
+        Emit spinning stars from a point.
+
+        Args:
+            x, y: Origin
+            count: Number of stars
+            angle_range: (low, high) launch angle in radians
+            speed_range: (low, high) launch speed
+        """
+        angle = self._rng.uniform(*angle_range, count)
+        speed = self._rng.uniform(*speed_range, count)
+        colors = self._rng.integers(len(STAR_COLORS), size=count)
+        for i, color in enumerate(STAR_COLORS):
+            mask = colors == i
+            if not mask.any():
+                continue
+            k = int(mask.sum())
+            self.emit(x, y,
+                      speed[mask] * np.cos(angle[mask]),
+                      speed[mask] * np.sin(angle[mask]),
+                      self._rng.uniform(0.8, 1.5, k),
+                      self._rng.uniform(4, 8, k),
+                      color, gravity=150.0, drag=0.98, shape=SHAPE_STAR,
+                      rotation=self._rng.uniform(0, 360, k),
+                      rotation_speed=self._rng.uniform(-360, 360, k))
+
     def update(self, dt):
-        """Update star particle with rotation."""
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
-        self.velocity_y += 150 * dt  # Gravity
-        self.velocity_x *= 0.98  # Air resistance
-        self.velocity_y *= 0.98
-        self.lifetime -= dt
-        self.rotation += self.rotation_speed * dt
-        self.alpha = int(255 * (self.lifetime / self.max_lifetime))
-        return self.lifetime > 0
-    
-    def draw(self, surface):
-        """Draw a 5-pointed star."""
-        if self.alpha > 0:
-            # Draw a 5-pointed star
-            points = []
-            for i in range(10):
-                angle = math.radians(self.rotation + i * 36)
-                radius = self.size if i % 2 == 0 else self.size * 0.4
-                px = self.x + radius * math.cos(angle)
-                py = self.y + radius * math.sin(angle)
-                points.append((px, py))
-            
-            if len(points) >= 3:
-                s = pygame.Surface((int(self.size * 3), int(self.size * 3)), pygame.SRCALPHA)
-                offset_x = self.size * 1.5
-                offset_y = self.size * 1.5
-                adjusted_points = [(px - self.x + offset_x, py - self.y + offset_y) for px, py in points]
-                color_with_alpha = (*self.color[:3], self.alpha)
-                pygame.draw.polygon(s, color_with_alpha, adjusted_points)
-                surface.blit(s, (int(self.x - offset_x), int(self.y - offset_y)))
+        """
+        Advance every particle and drop the expired ones.
+
+        Args:
+            dt: Delta time in seconds
+        """
+        n = self.count
+        if n == 0:
+            return
+        d = self._data[:, :n]
+
+        d[PREV_X] = d[X]
+        d[PREV_Y] = d[Y]
+        d[VY] += d[GRAVITY] * dt
+        damping = d[DRAG] ** (dt * 60)
+        d[VX] *= damping
+        d[VY] *= damping
+        d[X] += d[VX] * dt
+        d[Y] += d[VY] * dt
+        d[ROTATION] += d[ROTATION_SPEED] * dt
+        d[LIFE] -= dt
+
+        alive = d[LIFE] > 0
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            self._data[:, :live] = d[:, alive]
+            self.count = live
+
+    def draw(self, surface, alpha=1.0):
+        """
+        Draw every live particle with one batched blit.
+
+        Args:
+            surface: Target surface
+            alpha: How far between the previous and the latest step to draw
+                positions, 0.0-1.0
+        """
+        n = self.count
+        if n == 0:
+            return
+        d = self._data[:, :n]
+        atlas = self.atlas
+
+        shape = d[SHAPE].astype(np.int64)
+        color = d[COLOR].astype(np.int64)
+        radius = np.clip(d[SIZE].astype(np.int64), 1, MAX_RADIUS)
+        fade = np.clip(d[LIFE] / d[MAX_LIFE], 0.0, 1.0)
+        alpha_level = np.minimum((fade * atlas.alpha_levels).astype(np.int64), atlas.alpha_levels - 1)
+        steps = atlas.rotation_steps
+        rotation = ((d[ROTATION] % STAR_SYMMETRY) * steps / STAR_SYMMETRY).astype(np.int64) % steps
+        rotation[shape != SHAPE_STAR] = 0
+
+        # Pack the atlas key into one integer so identical sprites group together
+        key = shape
+        key = key * len(self._colors) + color
+        key = key * (MAX_RADIUS + 1) + radius
+        key = key * atlas.alpha_levels + alpha_level
+        key = key * steps + rotation
+        unique, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+
+        sprites = np.empty(len(unique), dtype=object)
+        for i, j in enumerate(first):
+            sprites[i] = atlas.get(int(shape[j]), self._colors[color[j]], int(radius[j]),
+                                   int(alpha_level[j]), int(rotation[j]))
+
+        half = np.where(shape == SHAPE_STAR, (radius * 3) // 2, radius)
+        x = d[PREV_X] + (d[X] - d[PREV_X]) * alpha
+        y = d[PREV_Y] + (d[Y] - d[PREV_Y]) * alpha
+        left = x.astype(np.int64) - half
+        top = y.astype(np.int64) - half
+        surface.blits(zip(sprites[inverse].tolist(), zip(left.tolist(), top.tolist())),
+                      doreturn=False)
+
+    def _palette_index(self, color):
+        """Index of an RGB color in the palette, adding it if new."""
+        color = tuple(color[:3])
+        index = self._color_index.get(color)
+        if index is None:
+            index = len(self._colors)
+            self._colors.append(color)
+            self._color_index[color] = index
+        return index
@@ -0,0 +1,112 @@
+"""
+Fixed logical resolution, scaled to the window.
+
+Screens lay out against a WINDOW_WIDTH x WINDOW_HEIGHT canvas. Once per
+frame the canvas is scaled into the largest rect of the same aspect ratio
+that fits the window, with the rest left as black bars. Resizing the window
+then only moves that rect: layout, button rects and every cache keyed by
+the canvas size stay valid.
+"""
+
+import pygame
+
+from config import RENDER_SCALE_QUALITY
+
+
+class ScaledPresenter:
+    """Offscreen canvas presented to the window at any size.
+
+    Implements flip() and update(rects) like pygame.display, so FrameDamage
+    can present through it.
+    """
+
+    def __init__(self, window, logical_size, quality=RENDER_SCALE_QUALITY):
+        """
+        Args:
+            window: Display surface returned by pygame.display.set_mode
+            logical_size: (width, height) screens draw at
+            quality: 'smooth' (smoothscale) or 'fast' (nearest-neighbour)
+        """
+        self.logical_size = tuple(logical_size)
+        self.quality = quality
+        self.canvas = pygame.Surface(self.logical_size).convert()
+        self.window = None
+        self.viewport = None
+        self._target = None
+        self.resize(window)
+
+    def resize(self, window):
+        """
+        Fit the canvas to a new window surface.
+
+        Args:
+            window: Display surface after the resize
+        """
+        self.window = window
+        window_width, window_height = window.get_size()
+        width, height = self.logical_size
+        scale = min(window_width / width, window_height / height)
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        self.viewport = pygame.Rect((0, 0), size)
+        self.viewport.center = (window_width // 2, window_height // 2)
+        self.viewport = self.viewport.clip(window.get_rect())
+
+        # Bars stay black; only the viewport is redrawn after this
+        window.fill((0, 0, 0))
+        self._target = window.subsurface(self.viewport) if self.viewport.size != self.logical_size else None
+
+    def to_logical(self, pos):
+        """
+        Map a window position (e.g. a mouse event) onto the canvas.
+
+        Args:
+            pos: (x, y) in window pixels
+
+        Returns:
+            (x, y) in canvas pixels; points on the bars fall outside the canvas
+        """
+        x = (pos[0] - self.viewport.x) * self.logical_size[0] / max(1, self.viewport.width)
+        y = (pos[1] - self.viewport.y) * self.logical_size[1] / max(1, self.viewport.height)
+        return (int(x), int(y))
+
+    def to_window(self, rect):
+        """
+        Map a canvas rect to the window rect it is presented in.
+
+        Args:
+            rect: pygame.Rect in canvas pixels
+
+        Returns:
+            pygame.Rect in window pixels, rounded outwards
+        """
+        scale_x = self.viewport.width / self.logical_size[0]
+        scale_y = self.viewport.height / self.logical_size[1]
+        left = self.viewport.x + int(rect.left * scale_x)
+        top = self.viewport.y + int(rect.top * scale_y)
+        right = self.viewport.x + int(rect.right * scale_x + 0.999)
+        bottom = self.viewport.y + int(rect.bottom * scale_y + 0.999)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def flip(self):
+        """Scale the whole canvas to the window and present it."""
+        self._blit_canvas()
+        pygame.display.flip()
+
+    def update(self, rects):
+        """
+        Scale the canvas to the window and present only some regions.
+
+        Args:
+            rects: Changed pygame.Rects in canvas pixels
+        """
+        self._blit_canvas()
+        pygame.display.update([self.to_window(rect) for rect in rects])
+
+    def _blit_canvas(self):
+        """Copy the canvas into the viewport, scaling unless the sizes match."""
+        if self._target is None:
+            self.window.blit(self.canvas, self.viewport)
+        elif self.quality == 'smooth':
+            pygame.transform.smoothscale(self.canvas, self.viewport.size, self._target)
+        else:
+            pygame.transform.scale(self.canvas, self.viewport.size, self._target)
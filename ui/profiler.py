@@ -0,0 +1,210 @@
+"""
+Frame-phase profiler.
+
+The game loop marks the end of each phase of a frame (event handling,
+particle update, animation, screen draw, present). Phase durations go into
+a fixed-size ring buffer together with the live particle count, so
+recording costs a few perf_counter calls per frame and no allocation. The
+history can be shown as an overlay graph or exported in Chrome's trace
+event format (open it in chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import json
+import time
+
+import numpy as np
+import pygame
+
+from config import PROFILER_HISTORY, PROFILER_TRACE_FILE, FPS_ACTIVE
+
+
+PHASES = ('events', 'particles', 'animation', 'draw', 'present')
+PHASE_COLORS = {
+    'events': (149, 165, 166),
+    'particles': (230, 126, 34),
+    'animation': (155, 89, 182),
+    'draw': (52, 152, 219),
+    'present': (46, 204, 113),
+}
+
+GRAPH_WIDTH = 240
+GRAPH_HEIGHT = 80
+GRAPH_MAX_MS = 2 * 1000 / FPS_ACTIVE  # Top of the graph; the frame budget line sits halfway
+COLUMN_WIDTH = 2
+STATS_INTERVAL = 0.25  # seconds between refreshes of the overlay's text
+
+
+class FrameProfiler:
+    """Ring buffer of per-phase frame timings."""
+
+    def __init__(self, history=PROFILER_HISTORY, enabled=False):
+        """
+        Args:
+            history: Frames kept
+            enabled: Start recording immediately
+        """
+        self.enabled = enabled
+        self.overlay_visible = False
+        self.history = history
+        # Per frame: start time (s since creation), phase durations (ms), particle count
+        self._frames = np.zeros((history, len(PHASES) + 2))
+        self._count = 0
+        self._phase_index = {name: i for i, name in enumerate(PHASES)}
+        self._origin = time.perf_counter()
+        self._current = np.zeros(len(PHASES))
+        self._frame_start = 0.0
+        self._last_mark = 0.0
+        self._graph = None
+        self._stats_lines = []
+        self._stats_time = 0.0
+
+    def toggle_overlay(self):
+        """Show or hide the overlay. Showing it also starts recording."""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+
+    def begin_frame(self):
+        """Start timing a frame. Call after the frame rate limiter's sleep."""
+        # Stamped even when disabled, so enabling mid-frame times from here
+        self._frame_start = self._last_mark = time.perf_counter()
+        self._current[:] = 0
+
+    def mark(self, phase):
+        """
+        Attribute the time since the previous mark to a phase.
+
+        Args:
+            phase: Name from PHASES
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current[self._phase_index[phase]] += (now - self._last_mark) * 1000
+        self._last_mark = now
+
+    def end_frame(self, particle_count):
+        """
+        Store the frame in the ring buffer.
+
+        Args:
+            particle_count: Live particles this frame
+        """
+        if not self.enabled:
+            return
+        row = self._frames[self._count % self.history]
+        row[0] = self._frame_start - self._origin
+        row[1:-1] = self._current
+        row[-1] = particle_count
+        self._count += 1
+        if self.overlay_visible:
+            self._push_graph_column(self._current)
+
+    def frames(self):
+        """
+        Get the recorded frames, oldest first.
+
+        Returns:
+            numpy array with one row per frame: start time in seconds, one
+            duration in ms per phase in PHASES, particle count
+        """
+        if self._count <= self.history:
+            return self._frames[:self._count].copy()
+        split = self._count % self.history
+        return np.concatenate((self._frames[split:], self._frames[:split]))
+
+    def summary(self):
+        """
+        Get mean and worst duration per phase over the recorded frames.
+
+        Returns:
+            Dict of phase -> (mean ms, max ms), plus 'frame' for the total
+        """
+        frames = self.frames()
+        if not len(frames):
+            return {}
+        phases = frames[:, 1:-1]
+        totals = phases.sum(axis=1)
+        result = {name: (float(phases[:, i].mean()), float(phases[:, i].max())) for i, name in enumerate(PHASES)}
+        result['frame'] = (float(totals.mean()), float(totals.max()))
+        return result
+
+    def export_trace(self, path=PROFILER_TRACE_FILE):
+        """
+        Write the recorded frames in Chrome trace event format.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Number of frames written
+        """
+        events = []
+        for row in self.frames():
+            ts = row[0] * 1e6
+            total = row[1:-1].sum() * 1000
+            events.append({'name': 'frame', 'ph': 'X', 'ts': ts, 'dur': total, 'pid': 1, 'tid': 1})
+            for i, name in enumerate(PHASES):
+                dur = row[1 + i] * 1000
+                if dur > 0:
+                    events.append({'name': name, 'ph': 'X', 'ts': ts, 'dur': dur, 'pid': 1, 'tid': 1})
+                    ts += dur
+            events.append({'name': 'particles', 'ph': 'C', 'ts': row[0] * 1e6, 'pid': 1,
+                           'args': {'count': int(row[-1])}})
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return len(self.frames())
+
+    def draw_overlay(self, surface, font, counters):
+        """
+        Draw the frame-time graph and counters in the bottom-right corner.
+
+        Args:
+            surface: Surface to draw on
+            font: pygame.font.Font for the text
+            counters: Dict of label -> value shown under the graph, e.g. cache sizes
+        """
+        if self._graph is None:
+            self._graph = pygame.Surface((GRAPH_WIDTH, GRAPH_HEIGHT))
+            self._graph.fill((0, 0, 0))
+
+        now = time.perf_counter()
+        if now - self._stats_time >= STATS_INTERVAL or not self._stats_lines:
+            self._stats_time = now
+            lines = [f"{name} {mean:.2f} / {worst:.2f} ms" for name, (mean, worst) in self.summary().items()]
+            lines += [f"{label}: {value}" for label, value in counters.items()]
+            self._stats_lines = [font.render(line, True, (236, 240, 241)) for line in lines]
+
+        line_height = font.get_linesize()
+        panel = pygame.Rect(0, 0, GRAPH_WIDTH + 10, GRAPH_HEIGHT + 10 + line_height * len(self._stats_lines))
+        panel.bottomright = (surface.get_width() - 5, surface.get_height() - 5)
+        surface.fill((0, 0, 0), panel)
+        surface.blit(self._graph, (panel.x + 5, panel.y + 5))
+
+        # Frame budget line
+        budget_y = panel.y + 5 + GRAPH_HEIGHT - int(GRAPH_HEIGHT * (1000 / FPS_ACTIVE) / GRAPH_MAX_MS)
+        pygame.draw.line(surface, (231, 76, 60), (panel.x + 5, budget_y), (panel.x + 5 + GRAPH_WIDTH, budget_y))
+
+        y = panel.y + 10 + GRAPH_HEIGHT
+        surface.blits([(line, (panel.x + 5, y + i * line_height)) for i, line in enumerate(self._stats_lines)],
+                      doreturn=False)
+
+    def _push_graph_column(self, durations):
+        """Scroll the graph left and draw one frame's stacked phase bar."""
+        if self._graph is None:
+            return
+        graph = self._graph
+        graph.scroll(-COLUMN_WIDTH, 0)
+        x = GRAPH_WIDTH - COLUMN_WIDTH
+        graph.fill((0, 0, 0), (x, 0, COLUMN_WIDTH, GRAPH_HEIGHT))
+        bottom = GRAPH_HEIGHT
+        for name, ms in zip(PHASES, durations):
+            height = int(GRAPH_HEIGHT * ms / GRAPH_MAX_MS)
+            if height <= 0:
+                continue
+            top = max(0, bottom - height)
+            graph.fill(PHASE_COLORS[name], (x, top, COLUMN_WIDTH, bottom - top))
+            bottom = top
+            if bottom == 0:
+                break
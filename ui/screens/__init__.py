@@ -1,3 +1,99 @@
 """
 Screen rendering modules.
+
+Screen modules are imported the first time their state is shown, so startup
+only loads the loading screen.
 """
+
+import importlib
+
+from config import *
+from ui.screens.base import Screen
+
+
+# State -> (module in this package, Screen subclass)
+SCREEN_SPECS = {
+    STATE_LOADING: ('loading_screen', 'LoadingScreen'),
+    STATE_LOADING_SAVE: ('loading_screen', 'LoadingSaveScreen'),
+    STATE_SAVING: ('loading_screen', 'SavingScreen'),
+    STATE_MENU: ('menu_screen', 'MenuScreen'),
+    STATE_FILTER_SELECT: ('filter_screen', 'FilterScreen'),
+    STATE_MODE_SELECT: ('menu_screen', 'ModeSelectScreen'),
+    STATE_COUNTDOWN: ('game_screen', 'CountdownScreen'),
+    STATE_LEADERBOARD: ('leaderboard_screen', 'LeaderboardScreen'),
+    STATE_PLAYING: ('game_screen', 'PlayingScreen'),
+    STATE_PAUSED: ('game_screen', 'PausedScreen'),
+    STATE_GAME_OVER: ('game_screen', 'GameOverScreen'),
+    STATE_REVIEW_INCORRECT: ('review_screen', 'ReviewScreen'),
+}
+
+# Screen classes re-exported from this package, loaded on first access
+_LAZY_EXPORTS = {
+    'LoadingScreen': 'loading_screen',
+    'SaveProgressScreen': 'loading_screen',
+    'LoadingSaveScreen': 'loading_screen',
+    'SavingScreen': 'loading_screen',
+    'MenuScreen': 'menu_screen',
+    'ModeSelectScreen': 'menu_screen',
+    'FilterScreen': 'filter_screen',
+    'LeaderboardScreen': 'leaderboard_screen',
+    'CountdownScreen': 'game_screen',
+    'PlayingScreen': 'game_screen',
+    'PausedScreen': 'game_screen',
+    'GameOverScreen': 'game_screen',
+    'ReviewScreen': 'review_screen',
+}
+
+
+class ScreenRegistry:
+    """The screen for every game state, created when first requested."""
+
+    def __init__(self, game):
+        """
+        Args:
+            game: VocabGameGUI the screens draw
+        """
+        self.game = game
+        self._screens = {}
+
+    def __getitem__(self, state):
+        screen = self._screens.get(state)
+        if screen is None:
+            module_name, name = SCREEN_SPECS[state]
+            screen = getattr(importlib.import_module(f'{__name__}.{module_name}'), name)(self.game)
+            self._screens[state] = screen
+        return screen
+
+    def __contains__(self, state):
+        return state in SCREEN_SPECS
+
+    def loaded(self):
+        """Get the screens created so far."""
+        return list(self._screens.values())
+
+
+def build_screens(game):
+    """
+    Create the screen registry.
+
+    Args:
+        game: VocabGameGUI the screens draw
+
+    Returns:
+        ScreenRegistry mapping state name to Screen
+    """
+    return ScreenRegistry(game)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f'{__name__}.{module_name}'), name)
+
+
+__all__ = [
+    'Screen', 'LoadingScreen', 'SaveProgressScreen', 'LoadingSaveScreen', 'SavingScreen', 'MenuScreen',
+    'ModeSelectScreen', 'FilterScreen', 'LeaderboardScreen', 'CountdownScreen', 'PlayingScreen',
+    'PausedScreen', 'GameOverScreen', 'ReviewScreen', 'ScreenRegistry', 'build_screens'
+]
@@ -0,0 +1,105 @@
+"""
+Base class for per-state screens.
+"""
+
+
+class Screen:
+    """Renderer and per-frame logic for one game state.
+
+    The game loop calls enter() when its state becomes active and exit()
+    when it is left, so a screen can build fonts, surfaces and layout once
+    and free them again. update() runs once per frame before draw().
+
+    Screens own their buttons and handle all input for their state: the
+    game passes clicks, hover, keys, text input and scrolling to the
+    current screen's handle_*() hooks and keeps only global keys itself.
+    """
+
+    layers = None  # LayerCache owned by the screen, if it caches layers
+
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self):
+        """Called when the game switches to this screen's state."""
+
+    def exit(self):
+        """Called when the game leaves this screen's state."""
+
+    def release(self):
+        """Free what the screen keeps between visits. Called when the game returns to the menu."""
+
+    def update(self, dt):
+        """
+        Advance per-frame logic.
+
+        Args:
+            dt: Delta time in seconds
+        """
+
+    def draw(self):
+        """Draw the screen to game.screen."""
+        raise NotImplementedError
+
+    def resize(self):
+        """Called after the window was resized in native render mode."""
+        if self.layers is not None:
+            self.layers.clear()
+
+    def handle_click(self, pos):
+        """
+        Handle a mouse click.
+
+        Args:
+            pos: Position in canvas coordinates
+
+        Returns:
+            True if the screen handled it
+        """
+        return False
+
+    def handle_key(self, event):
+        """
+        Handle a key press.
+
+        Args:
+            event: pygame KEYDOWN event
+        """
+
+    def handle_text(self, event):
+        """
+        Handle typed or composing (IME) text.
+
+        Args:
+            event: pygame TEXTINPUT or TEXTEDITING event
+        """
+
+    def scroll(self, amount):
+        """
+        Scroll the screen's content.
+
+        Args:
+            amount: Pixels to scroll; positive scrolls down
+        """
+
+    def update_hover(self, pos):
+        """
+        Update the screen's button hover state.
+
+        Args:
+            pos: Mouse position in canvas coordinates
+        """
+
+    def hover_state(self):
+        """Current hover state of the screen's buttons, for change detection."""
+        return ()
+
+    def hover_regions(self):
+        """
+        Get the regions to redraw after a hover change.
+
+        Returns:
+            List of rects, or [None] for the whole window
+        """
+        return [None]
+
@@ -1,17 +1,90 @@
 """
-Filter selection screen renderer.
+Filter selection screen.
 """
 
 import math
 import pygame
 from config import *
+from ui.background import MENU_FIELD
+from ui.layers import LayerCache
+from ui.screens.base import Screen
 from game.filtering import (
     MATURITY_NEW, MATURITY_LEARNING, MATURITY_YOUNG, MATURITY_MATURE,
     MATURITY_DISPLAY_NAMES
 )
 
+MATURITY_LEVELS = [MATURITY_NEW, MATURITY_LEARNING, MATURITY_YOUNG, MATURITY_MATURE]
+FILTER_Y_START = 180
+FILTER_CHECKBOX_SIZE = 24
+FILTER_SPACING = 55
 
-def draw_filter_screen(game):
+
+class FilterScreen(Screen):
+    """Maturity level checkboxes, shown before the mode is picked."""
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.layers = LayerCache()
+        self.title_font = None
+        self.layout()
+    
+    def layout(self):
+        """Place the checkboxes and buttons for the current canvas size."""
+        game = self.game
+        checkbox_x = game.width // 2 - 180
+        self.checkboxes = {
+            level: pygame.Rect(checkbox_x, FILTER_Y_START + i * FILTER_SPACING, FILTER_CHECKBOX_SIZE, FILTER_CHECKBOX_SIZE)
+            for i, level in enumerate(MATURITY_LEVELS)
+        }
+        
+        button_y = game.height - 150
+        self.buttons = {
+            'clear': pygame.Rect(game.width // 2 - 250, button_y, 150, 50),
+            'continue': pygame.Rect(game.width // 2 + 100, button_y, 150, 50),
+            'back': pygame.Rect(game.width // 2 - 75, button_y + 60, 150, 40),
+        }
+        self.hovered = None
+    
+    def enter(self):
+        self.title_font = self.game.fonts.get(56)
+    
+    def exit(self):
+        self.title_font = None
+        self.hovered = None
+        self.layers.clear()
+    
+    def resize(self):
+        super().resize()
+        self.layout()
+    
+    def handle_click(self, pos):
+        game = self.game
+        for level, rect in self.checkboxes.items():
+            if rect.collidepoint(pos):
+                game.card_filter.toggle_maturity_level(level)
+                return True
+        
+        if self.buttons['clear'].collidepoint(pos):
+            game.card_filter.clear()
+        elif self.buttons['continue'].collidepoint(pos):
+            game.continue_from_filter()
+        elif self.buttons['back'].collidepoint(pos):
+            game.state = STATE_MENU
+        else:
+            return False
+        return True
+    
+    def update_hover(self, pos):
+        self.hovered = next((name for name, rect in self.buttons.items() if rect.collidepoint(pos)), None)
+    
+    def hover_state(self):
+        return (self.hovered,)
+    
+    def draw(self):
+        draw_filter_screen(self.game, self)
+
+
+def draw_filter_screen(game, screen):
     """Draw the filter selection screen."""
     base_color = game.bg_color
     wave = int(10 * math.sin(game.background_time * 0.5))
@@ -23,79 +96,59 @@ def draw_filter_screen(game):
     game.screen.fill(bg_color)
     
     # Draw background particles
-    for i in range(12):
-        base_x = (game.background_time * 25 + i * 137) % (game.width + 50)
-        base_y = (i * 83) % game.height
-        offset_x = 40 * math.sin(i * 3.14)
-        offset_y = 35 * math.cos(i * 2.71)
-        x = base_x + offset_x
-        y = base_y + offset_y
-        alpha = int(50 + 30 * math.sin(game.background_time + i))
-        s = pygame.Surface((4, 4), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*game.text_color[:3], alpha), (2, 2), 2)
-        game.screen.blit(s, (int(x), int(y)))
+    game.ambient.draw(game.screen, MENU_FIELD, game.background_time, game.text_color)
     
+    counts = game.maturity_counts or {}
+    key = (
+        frozenset(game.card_filter.maturity_levels),
+        tuple(sorted(counts.items())),
+        screen.hovered
+    )
+    layer = screen.layers.get(key, game.screen.get_size(), lambda surface: _build_filter_layer(game, screen, surface))
+    game.screen.blit(layer, (0, 0))
+
+
+def _build_filter_layer(game, screen, surface):
+    """Draw the filter screen's titles, checkboxes and buttons onto a layer."""
     # Title
-    title_font = pygame.font.Font(None, 56)
-    title = title_font.render("Filter Cards", True, game.text_color)
+    title = game.text_cache.render(screen.title_font, "Filter Cards", game.text_color)
     title_rect = title.get_rect(center=(game.width // 2, 80))
-    game.screen.blit(title, title_rect)
+    surface.blit(title, title_rect)
     
     # Subtitle
-    subtitle = game.meaning_font.render("Select which cards to practice", True, game.gray_color)
+    subtitle = game.text_cache.render(game.meaning_font, "Select which cards to practice", game.gray_color)
     subtitle_rect = subtitle.get_rect(center=(game.width // 2, 120))
-    game.screen.blit(subtitle, subtitle_rect)
+    surface.blit(subtitle, subtitle_rect)
     
-    # Get maturity counts if available
-    if hasattr(game, 'maturity_counts') and game.maturity_counts:
-        counts = game.maturity_counts
-    else:
-        counts = None
+    counts = game.maturity_counts
     
     # Maturity level checkboxes
-    y_start = 180
-    checkbox_size = 24
-    spacing = 55
-    
-    maturity_levels = [MATURITY_NEW, MATURITY_LEARNING, MATURITY_YOUNG, MATURITY_MATURE]
-    
-    for i, level in enumerate(maturity_levels):
-        y_pos = y_start + i * spacing
-        
-        # Checkbox
-        checkbox_x = game.width // 2 - 180
-        checkbox_rect = pygame.Rect(checkbox_x, y_pos, checkbox_size, checkbox_size)
-        
-        # Store checkbox rect for click detection
-        if not hasattr(game, 'filter_checkboxes'):
-            game.filter_checkboxes = {}
-        game.filter_checkboxes[level] = checkbox_rect
+    for level in MATURITY_LEVELS:
+        checkbox_rect = screen.checkboxes[level]
         
         # Draw checkbox background
-        pygame.draw.rect(game.screen, (255, 255, 255), checkbox_rect)
-        pygame.draw.rect(game.screen, game.text_color, checkbox_rect, 2)
+        pygame.draw.rect(surface, (255, 255, 255), checkbox_rect)
+        pygame.draw.rect(surface, game.text_color, checkbox_rect, 2)
         
         # Draw checkmark if selected
-        is_selected = level in game.card_filter.maturity_levels
-        if is_selected:
+        if level in game.card_filter.maturity_levels:
             # Draw an X or checkmark
-            pygame.draw.line(game.screen, game.correct_color, 
+            pygame.draw.line(surface, game.correct_color, 
                            (checkbox_rect.left + 4, checkbox_rect.top + 4),
                            (checkbox_rect.right - 4, checkbox_rect.bottom - 4), 3)
-            pygame.draw.line(game.screen, game.correct_color,
+            pygame.draw.line(surface, game.correct_color,
                            (checkbox_rect.right - 4, checkbox_rect.top + 4),
                            (checkbox_rect.left + 4, checkbox_rect.bottom - 4), 3)
         
         # Label
-        label_x = checkbox_x + checkbox_size + 15
         label_text = MATURITY_DISPLAY_NAMES[level]
         
         # Add count if available
         if counts and level in counts:
             label_text = f"{label_text} ({counts[level]} cards)"
         
-        label_surface = game.meaning_font.render(label_text, True, game.text_color)
-        game.screen.blit(label_surface, (label_x, y_pos + 2))
+        label_surface = game.text_cache.render(game.meaning_font, label_text, game.text_color)
+        surface.blit(label_surface, (checkbox_rect.right + 15, checkbox_rect.y + 2))
     
     # Info text
     if game.card_filter.is_active():
@@ -106,36 +159,19 @@ def draw_filter_screen(game):
         info_text = "No filters selected - playing with all cards"
         info_color = game.gray_color
     
-    info_surface = game.score_font.render(info_text, True, info_color)
-    info_rect = info_surface.get_rect(center=(game.width // 2, y_start + 4 * spacing + 20))
-    game.screen.blit(info_surface, info_rect)
-    
-    # Buttons
-    button_y = game.height - 150
-    
-    # Clear Filters button
-    clear_button = pygame.Rect(game.width // 2 - 250, button_y, 150, 50)
-    game.clear_filter_button = clear_button
-    clear_color = game.button_hover_color if game.clear_filter_button_hover else game.status_color
-    pygame.draw.rect(game.screen, clear_color, clear_button, border_radius=10)
-    clear_text = game.meaning_font.render("Clear All", True, (255, 255, 255))
-    clear_text_rect = clear_text.get_rect(center=clear_button.center)
-    game.screen.blit(clear_text, clear_text_rect)
-    
-    # Continue button
-    continue_button = pygame.Rect(game.width // 2 + 100, button_y, 150, 50)
-    game.continue_filter_button = continue_button
-    continue_color = game.button_hover_color if game.continue_filter_button_hover else game.correct_color
-    pygame.draw.rect(game.screen, continue_color, continue_button, border_radius=10)
-    continue_text = game.meaning_font.render("Continue →", True, (255, 255, 255))
-    continue_text_rect = continue_text.get_rect(center=continue_button.center)
-    game.screen.blit(continue_text, continue_text_rect)
-    
-    # Back button
-    back_button = pygame.Rect(game.width // 2 - 75, button_y + 60, 150, 40)
-    game.filter_back_button = back_button
-    back_color = game.button_hover_color if game.filter_back_button_hover else game.button_color
-    pygame.draw.rect(game.screen, back_color, back_button, border_radius=10)
-    back_text = game.score_font.render("← Back to Menu", True, (255, 255, 255))
-    back_text_rect = back_text.get_rect(center=back_button.center)
-    game.screen.blit(back_text, back_text_rect)
+    info_surface = game.text_cache.render(game.score_font, info_text, info_color)
+    info_rect = info_surface.get_rect(center=(game.width // 2, FILTER_Y_START + 4 * FILTER_SPACING + 20))
+    surface.blit(info_surface, info_rect)
+    
+    # Clear All, Continue and Back to Menu buttons
+    buttons = (
+        ('clear', "Clear All", game.meaning_font, game.status_color),
+        ('continue', "Continue →", game.meaning_font, game.correct_color),
+        ('back', "← Back to Menu", game.score_font, game.button_color),
+    )
+    for name, text, font, color in buttons:
+        rect = screen.buttons[name]
+        button_color = game.button_hover_color if screen.hovered == name else color
+        pygame.draw.rect(surface, button_color, rect, border_radius=10)
+        text_surface = game.text_cache.render(font, text, (255, 255, 255))
+        surface.blit(text_surface, text_surface.get_rect(center=rect.center))
@@ -3,13 +3,48 @@ Game screen renderers (playing, countdown, paused, game over).
 """
 
 import math
-import random
-import threading
 import pygame
 from config import *
+from ui.buffers import EffectBuffers
+from ui.layers import LayerCache
+from ui.screens.base import Screen
+from ui.word_zoom import WordZoomRenderer
+from utils import convert_romaji_to_hiragana
 
 
-def draw_countdown(game):
+class CountdownScreen(Screen):
+    """Countdown before a game; preloads cards while it runs."""
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.digit_renderer = None
+    
+    def enter(self):
+        # The digit is rendered once at full size; the pulse uses scaled copies
+        self.digit_renderer = WordZoomRenderer(self.game.fonts.get(COUNTDOWN_SIZE), COUNTDOWN_SIZE,
+                                               size_step=COUNTDOWN_SIZE_STEP)
+        self.game.start_preloader()
+        print("Started preloading cards during countdown...")
+    
+    def exit(self):
+        self.digit_renderer = None
+    
+    def update(self, dt):
+        game = self.game
+        elapsed = pygame.time.get_ticks() - game.countdown_start
+        game.countdown_number = 3 - (elapsed // 1000)
+        if game.countdown_number <= 0:
+            game.state = STATE_PLAYING
+            # Start time attack timer
+            if game.game_mode == 'time_attack':
+                game.time_attack_start_time = pygame.time.get_ticks()
+            game.load_next_word()
+    
+    def draw(self):
+        draw_countdown(self.game, self)
+
+
+def draw_countdown(game, screen):
     """Draw the countdown screen."""
     base_color = game.bg_color
     wave = int(15 * math.sin(game.background_time * 2))
@@ -20,42 +55,172 @@ def draw_countdown(game):
     )
     game.screen.fill(bg_color)
     
-    # Calculate countdown
     elapsed = pygame.time.get_ticks() - game.countdown_start
-    game.countdown_number = 3 - (elapsed // 1000)
-    
-    # Start preloading cards during countdown
-    if not hasattr(game, '_countdown_preload_started') or not game._countdown_preload_started:
-        game._countdown_preload_started = True
-        game.loading = True
-        game.fetch_thread = threading.Thread(target=game._preload_cards, daemon=True)
-        game.fetch_thread.start()
-        print("Started preloading cards during countdown...")
-    
     if game.countdown_number <= 0:
-        game._countdown_preload_started = False
-        game.state = STATE_PLAYING
-        # Start time attack timer
-        if game.game_mode == 'time_attack':
-            game.time_attack_start_time = pygame.time.get_ticks()
-        game.load_next_word()
         return
     
     # Draw countdown number with pulsing effect
     pulse = 0.7 + 0.3 * math.sin(elapsed / 150)
-    countdown_font = pygame.font.Font(None, int(200 * pulse))
-    countdown_text = countdown_font.render(str(game.countdown_number), True, game.text_color)
+    countdown_text = screen.digit_renderer.render(str(game.countdown_number), COUNTDOWN_SIZE * pulse,
+                                                  game.text_color)
     countdown_rect = countdown_text.get_rect(center=(game.width // 2, game.height // 2))
     game.screen.blit(countdown_text, countdown_rect)
     
     # Draw "Get Ready!" text
-    ready_font = pygame.font.Font(None, 36)
-    ready_text = ready_font.render("Get Ready!", True, game.gray_color)
+    ready_font = game.fonts.get(36)
+    ready_text = game.text_cache.render(ready_font, "Get Ready!", game.gray_color)
     ready_rect = ready_text.get_rect(center=(game.width // 2, game.height // 2 + 100))
     game.screen.blit(ready_text, ready_rect)
 
 
-def draw_game(game):
+class PlayingScreen(Screen):
+    """The quiz itself.
+    
+    Owns the word zoom renderer, built on enter and dropped on exit, and
+    the full-window shake and flash buffers. The buffers stay allocated
+    across pauses and games; they are rebuilt only on resize and freed
+    when the game returns to the menu.
+    """
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.word_renderer = None
+        self.effects = None
+        self.score_font = None
+        self.streak_font = None
+        self.timer_font = None
+        self.panels = None
+        self.layout()
+    
+    def layout(self):
+        """Place the buttons for the current canvas size."""
+        game = self.game
+        self.pause_button = pygame.Rect(game.width - 80, 10, 70, 30)
+        self.submit_button = pygame.Rect(game.width // 2 - 150, 380, 300, 50)
+        self.hovered = None  # 'pause', 'submit' or None
+    
+    def enter(self):
+        game = self.game
+        self.score_font = game.fonts.get(32)
+        self.streak_font = game.fonts.get(36)
+        self.timer_font = game.fonts.get(48)
+        if self.effects is None:
+            self.effects = EffectBuffers(game.screen.get_size())
+        if self.panels is None:
+            # Translucent backings for the HUD readouts
+            self.panels = {
+                'score': _hud_panel((250, 45), 100),
+                'streak': _hud_panel((150, 35), 120),
+                'timer': _hud_panel((120, 50), 120),
+            }
+        self.word_renderer = WordZoomRenderer(game.japanese_font(WORD_BASE_SIZE), WORD_BASE_SIZE, glyphs=game.glyphs)
+        if getattr(game, 'word_text', None):
+            self.prepare_word(game.word_text)
+    
+    def exit(self):
+        self.word_renderer = None
+        self.score_font = self.streak_font = self.timer_font = None
+        self.hovered = None
+    
+    def release(self):
+        self.effects = None
+        self.panels = None
+    
+    def resize(self):
+        super().resize()
+        self.layout()
+        if self.effects is not None:
+            self.effects.resize(self.game.screen.get_size())
+    
+    def prepare_word(self, text):
+        """
+        Rasterize a new quiz word in the colors it can be shown in. Does
+        nothing while the screen isn't active; enter() prepares the word then.
+        
+        Args:
+            text: Word to display
+        """
+        renderer = self.word_renderer
+        if renderer is not None:
+            game = self.game
+            renderer.prepare(text, (game.text_color, game.correct_color, game.incorrect_color))
+    
+    def handle_click(self, pos):
+        game = self.game
+        if self.submit_button.collidepoint(pos):
+            if not game.animating:
+                game.check_answer()
+            return True
+        if self.pause_button.collidepoint(pos):
+            game.pause_game()
+            return True
+        return False
+    
+    def handle_key(self, event):
+        game = self.game
+        if event.key == pygame.K_ESCAPE:
+            game.pause_game()
+        elif event.key == pygame.K_RETURN:
+            if game.input_active and not game.animating:
+                game.check_answer()
+            elif game.can_skip and game.animating:
+                game.next_word()
+        elif game.input_active and not game.animating:
+            if event.key == pygame.K_BACKSPACE:
+                if len(game.input_text) > 0:
+                    game.input_text = game.input_text[:-1]
+                    while len(game.romaji_buffer) > 0:
+                        test_conversion = convert_romaji_to_hiragana(game.romaji_buffer)
+                        if test_conversion == game.input_text:
+                            break
+                        game.romaji_buffer = game.romaji_buffer[:-1]
+                print(f"Input: {game.input_text} (romaji: {game.romaji_buffer})")
+    
+    def handle_text(self, event):
+        game = self.game
+        if event.type == pygame.TEXTEDITING:
+            game.composition = event.text
+            print(f"Composing: {game.composition}")
+        elif game.input_active and not game.animating:
+            if any('\u3040' <= c <= '\u30ff' for c in event.text):
+                game.input_text += event.text
+            else:
+                game.romaji_buffer += event.text.lower()
+                game.input_text = convert_romaji_to_hiragana(game.romaji_buffer)
+            print(f"Input: {game.input_text} (romaji: {game.romaji_buffer})")
+    
+    def update_hover(self, pos):
+        if self.pause_button.collidepoint(pos):
+            self.hovered = 'pause'
+        elif self.submit_button.collidepoint(pos):
+            self.hovered = 'submit'
+        else:
+            self.hovered = None
+    
+    def hover_state(self):
+        return (self.hovered,)
+    
+    def draw(self):
+        draw_game(self.game, self)
+
+
+def _hud_panel(size, alpha):
+    """
+    Build a translucent black panel.
+    
+    Args:
+        size: (width, height)
+        alpha: Opacity, 0-255
+    
+    Returns:
+        pygame.Surface
+    """
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill((0, 0, 0, alpha))
+    return surface
+
+
+def draw_game(game, screen):
     """Draw the main game screen."""
     # Streak-based background animation
     base_color = game.bg_color
@@ -95,32 +260,19 @@ def draw_game(game):
         )
     game.screen.fill(bg_color)
     
-    # Create surface for screen shake
+    # Draw into the offscreen buffer during screen shake
     if game.screen_shake_intensity > 0:
-        game_surface = pygame.Surface((game.width, game.height))
-        game_surface.fill(bg_color)
+        game_surface = screen.effects.shake_surface(bg_color)
         draw_target = game_surface
     else:
         draw_target = game.screen
     
     # Draw background particles
-    particle_count = 5 + (game.streak * 4)
-    for i in range(min(particle_count, 80)):
-        base_x = (game.background_time * (30 + game.streak * 5) + i * 150) % (game.width + 100)
-        base_y = (i * 47) % game.height
-        offset_x = 30 * math.sin(i * 2.7)
-        offset_y = 25 * math.cos(i * 3.1)
-        x = base_x + offset_x
-        y = base_y + offset_y
-        alpha = int(50 + 30 * math.sin(game.background_time * speed_multiplier + i))
-        size = 3 + (game.streak * 0.2)
-        s = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*game.text_color[:3], alpha), (int(size), int(size)), int(size))
-        game.screen.blit(s, (int(x), int(y)))
+    game.ambient.draw_game(game.screen, game.background_time, game.text_color, game.streak, speed_multiplier,
+                           game.governor.factor('dots'))
     
     # Draw active particles
-    for particle in game.particles:
-        particle.draw(draw_target)
+    game.particles.draw(draw_target, game.sim_alpha)
     
     # Draw timer for time attack mode
     if game.game_mode == 'time_attack' and game.time_attack_start_time > 0:
@@ -138,91 +290,57 @@ def draw_game(game):
         seconds = int(time_remaining % 60)
         timer_text = f"{minutes:01d}:{seconds:02d}"
         
-        timer_bg = pygame.Surface((120, 50), pygame.SRCALPHA)
-        timer_bg.fill((0, 0, 0, 120))
+        timer_bg = screen.panels['timer']
         timer_bg_rect = timer_bg.get_rect(center=(game.width // 2, 25))
         draw_target.blit(timer_bg, timer_bg_rect)
         
-        timer_font = pygame.font.Font(None, 48)
-        timer_surface = timer_font.render(timer_text, True, timer_color)
+        timer_surface = game.text_cache.render(screen.timer_font, timer_text, timer_color)
         timer_rect = timer_surface.get_rect(center=(game.width // 2, 25))
         draw_target.blit(timer_surface, timer_rect)
     
     # Draw pause button
-    pause_color = game.button_hover_color if game.pause_button_hover else game.button_color
-    pygame.draw.rect(draw_target, pause_color, game.pause_button, border_radius=5)
-    pause_text = game.score_font.render("Pause", True, (255, 255, 255))
-    pause_text_rect = pause_text.get_rect(center=game.pause_button.center)
+    pause_color = game.button_hover_color if screen.hovered == 'pause' else game.button_color
+    pygame.draw.rect(draw_target, pause_color, screen.pause_button, border_radius=5)
+    pause_text = game.text_cache.render(game.score_font, "Pause", (255, 255, 255))
+    pause_text_rect = pause_text.get_rect(center=screen.pause_button.center)
     draw_target.blit(pause_text, pause_text_rect)
     
     # Draw score and points
-    score_bg = pygame.Surface((250, 45), pygame.SRCALPHA)
-    score_bg.fill((0, 0, 0, 100))
-    draw_target.blit(score_bg, (10, 5))
+    draw_target.blit(screen.panels['score'], (10, 5))
     
-    score_font_large = pygame.font.Font(None, 32)
     score_text = f"{game.score}/{game.total}"
-    score_surface = score_font_large.render(score_text, True, game.text_color)
+    score_surface = game.text_cache.render(screen.score_font, score_text, game.text_color)
     draw_target.blit(score_surface, (20, 10))
     
     points_text = f"+{game.points} pts"
-    points_surface = game.score_font.render(points_text, True, COLOR_GOLD)
+    points_surface = game.text_cache.render(game.score_font, points_text, COLOR_GOLD)
     draw_target.blit(points_surface, (20, 35))
     
     # Draw streak
     if game.streak > 0:
-        streak_bg = pygame.Surface((150, 35), pygame.SRCALPHA)
-        streak_bg.fill((0, 0, 0, 120))
+        streak_bg = screen.panels['streak']
         streak_rect_bg = streak_bg.get_rect(center=(game.width // 2, 45))
         draw_target.blit(streak_bg, streak_rect_bg)
         
-        streak_font_large = pygame.font.Font(None, 36)
         streak_text = f"{game.streak}x Streak"
         streak_color = game.correct_color if game.streak >= 5 else game.text_color
-        streak_surface = streak_font_large.render(streak_text, True, streak_color)
+        streak_surface = game.text_cache.render(screen.streak_font, streak_text, streak_color)
         streak_rect = streak_surface.get_rect(center=(game.width // 2, 45))
         draw_target.blit(streak_surface, streak_rect)
-        
-        # Fire particles for high streaks
-        if game.streak >= 5:
-            from ui.particles import FireParticle
-            particle_chance = min(0.3 + (game.streak * 0.05), 0.95)
-            if random.random() < particle_chance:
-                edge = random.randint(0, 3)
-                if edge == 0:
-                    fire_x = random.randint(0, game.width)
-                    fire_y = 0
-                elif edge == 1:
-                    fire_x = game.width
-                    fire_y = random.randint(0, game.height)
-                elif edge == 2:
-                    fire_x = random.randint(0, game.width)
-                    fire_y = game.height
-                else:
-                    fire_x = 0
-                    fire_y = random.randint(0, game.height)
-                game.particles.append(FireParticle(fire_x, fire_y))
-    
-    # Update word zoom animation
-    if not game.animating and game.input_active:
-        game.word_zoom = min(1.0, game.word_zoom + 0.001)
-        eased_zoom = 1.0 - math.pow(1.0 - game.word_zoom, 3)
-        game.word_distance = 1.0 - (eased_zoom * 0.5)
     
     # Draw word with zoom effect
-    base_size = 90
-    eased_zoom = 1.0 - math.pow(1.0 - game.word_zoom, 3)
+    word_zoom = game.interpolate(game.prev_word_zoom, game.word_zoom)
+    eased_zoom = 1.0 - math.pow(1.0 - word_zoom, 3)
     zoom_factor = 0.2 + (eased_zoom * 0.8)
-    word_size = int(base_size * zoom_factor)
-    word_font_zoom = pygame.font.SysFont(game.word_font.get_name() if hasattr(game.word_font, 'get_name') else 'msgothic', word_size)
-    word_surface = word_font_zoom.render(game.word_text, True, game.word_color)
-    word_y = 120 + int(40 * game.word_distance)
+    word_size = int(WORD_BASE_SIZE * zoom_factor)
+    word_surface = screen.word_renderer.render(game.word_text, word_size, game.word_color)
+    word_y = 120 + int(40 * game.interpolate(game.prev_word_distance, game.word_distance))
     word_rect = word_surface.get_rect(center=(game.width // 2 + game.shake_offset, word_y))
     draw_target.blit(word_surface, word_rect)
     
     if not game.game_over:
         # Draw "Reading:" label
-        label_surface = game.meaning_font.render("Reading:", True, game.text_color)
+        label_surface = game.text_cache.render(game.meaning_font, "Reading:", game.text_color)
         label_rect = label_surface.get_rect(center=(game.width // 2, 280))
         draw_target.blit(label_surface, label_rect)
         
@@ -233,17 +351,16 @@ def draw_game(game):
         
         # Draw input text
         display_text = game.input_text + game.composition
-        input_surface = game.reading_font.render(display_text, True, (0, 0, 0))
+        input_surface = game.glyphs.render(display_text, 32, (0, 0, 0))
         input_text_rect = input_surface.get_rect(center=input_rect.center)
         draw_target.blit(input_surface, input_text_rect)
         
         # Draw submit button
-        game.button_rect = pygame.Rect(game.width // 2 - 150, 380, 300, 50)
-        button_color = game.button_hover_color if game.button_hover else game.button_color
-        pygame.draw.rect(draw_target, button_color, game.button_rect, border_radius=5)
+        button_color = game.button_hover_color if screen.hovered == 'submit' else game.button_color
+        pygame.draw.rect(draw_target, button_color, screen.submit_button, border_radius=5)
         button_text = "Submit"
-        button_surface = game.meaning_font.render(button_text, True, (255, 255, 255))
-        button_text_rect = button_surface.get_rect(center=game.button_rect.center)
+        button_surface = game.text_cache.render(game.meaning_font, button_text, (255, 255, 255))
+        button_text_rect = button_surface.get_rect(center=screen.submit_button.center)
         draw_target.blit(button_surface, button_text_rect)
     
     # Draw meanings
@@ -252,20 +369,18 @@ def draw_game(game):
     
     # Draw status
     if game.status_text:
-        status_surface = game.meaning_font.render(game.status_text, True, game.status_color)
+        status_surface = game.text_cache.render(game.meaning_font, game.status_text, game.status_color)
         status_rect = status_surface.get_rect(center=(game.width // 2, 600))
         draw_target.blit(status_surface, status_rect)
     
     # Show correct answer when incorrect
     if game.animating and game.animation_type == 'incorrect':
         if hasattr(game, 'correct_answer_text'):
-            correct_label_font = pygame.font.Font(None, 32)
-            correct_label = correct_label_font.render("Correct:", True, game.text_color)
+            correct_label = game.text_cache.render(screen.score_font, "Correct:", game.text_color)
             correct_label_rect = correct_label.get_rect(center=(game.width // 2, 520))
             draw_target.blit(correct_label, correct_label_rect)
             
-            correct_font = pygame.font.SysFont(game.reading_font.get_name() if hasattr(game.reading_font, 'get_name') else 'msgothic', 56)
-            correct_surface = correct_font.render(game.correct_answer_text, True, game.incorrect_color)
+            correct_surface = game.glyphs.render(game.correct_answer_text, 56, game.incorrect_color)
             correct_rect = correct_surface.get_rect(center=(game.width // 2, 565))
             draw_target.blit(correct_surface, correct_rect)
     
@@ -274,101 +389,266 @@ def draw_game(game):
         elapsed = pygame.time.get_ticks() - game.animation_start
         if elapsed < 400:
             flash_alpha = int(180 * (1.0 - elapsed / 400))
-            flash_surface = pygame.Surface((game.width, game.height))
-            if game.animation_type == 'correct':
-                flash_surface.fill(game.correct_color)
-            else:
-                flash_surface.fill(game.incorrect_color)
-            flash_surface.set_alpha(flash_alpha)
-            draw_target.blit(flash_surface, (0, 0))
+            flash_color = game.correct_color if game.animation_type == 'correct' else game.incorrect_color
+            draw_target.blit(screen.effects.flash_overlay(flash_color, flash_alpha), (0, 0))
     
     # Apply screen shake
     if game.screen_shake_intensity > 0:
         game.screen.blit(game_surface, (int(game.screen_shake_x), int(game.screen_shake_y)))
 
 
-def draw_paused(game):
+class PausedScreen(Screen):
+    """Pause menu drawn over a snapshot of the last game frame."""
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.layers = LayerCache()
+        self.backdrop = None
+        self.title_font = None
+        self.layout()
+    
+    def layout(self):
+        """Place the buttons for the current canvas size."""
+        game = self.game
+        self.buttons = {
+            'resume': pygame.Rect(game.width // 2 - 100, 250, 200, 60),
+            'save_quit': pygame.Rect(game.width // 2 - 100, 330, 200, 60),
+            'quit': pygame.Rect(game.width // 2 - 100, 410, 200, 60),
+        }
+        self.hovered = None
+    
+    def enter(self):
+        # Entered before the first paused frame is drawn, so the canvas still shows the game
+        self.backdrop = self.game.screen.copy()
+        self.title_font = self.game.fonts.get(72)
+    
+    def exit(self):
+        self.backdrop = None
+        self.title_font = None
+        self.hovered = None
+        self.layers.clear()
+    
+    def resize(self):
+        super().resize()
+        self.layout()
+    
+    def handle_click(self, pos):
+        game = self.game
+        if self.buttons['resume'].collidepoint(pos):
+            game.resume_game()
+        elif self.buttons['save_quit'].collidepoint(pos):
+            game.save_game()
+        elif self.buttons['quit'].collidepoint(pos):
+            game.leave_game()
+        else:
+            return False
+        return True
+    
+    def handle_key(self, event):
+        if event.key == pygame.K_ESCAPE or event.key == pygame.K_SPACE:
+            self.game.resume_game()
+    
+    def update_hover(self, pos):
+        self.hovered = next((name for name, rect in self.buttons.items() if rect.collidepoint(pos)), None)
+    
+    def hover_state(self):
+        return (self.hovered,)
+    
+    def hover_regions(self):
+        return list(self.buttons.values())
+    
+    def draw(self):
+        draw_paused(self.game, self)
+
+
+def draw_paused(game, screen):
     """Draw the pause screen."""
+    if screen.backdrop is not None and screen.backdrop.get_size() == game.screen.get_size():
+        game.screen.blit(screen.backdrop, (0, 0))
+    else:
+        game.screen.fill(game.bg_color)
+    
+    score_text = f"Score: {game.score}/{game.total}  |  Points: {game.points}"
+    if game.streak > 0:
+        score_text += f"  |  Streak: {game.streak}x"
+    
+    key = (score_text, screen.hovered)
+    layer = screen.layers.get(key, game.screen.get_size(),
+                              lambda surface: _build_paused_layer(game, screen, surface, score_text))
+    game.screen.blit(layer, (0, 0))
+
+
+def _build_paused_layer(game, screen, surface, score_text):
+    """Draw the pause overlay, score and buttons onto a layer."""
     # Semi-transparent overlay
-    overlay = pygame.Surface((game.width, game.height))
-    overlay.set_alpha(200)
-    overlay.fill((20, 30, 40))
-    game.screen.blit(overlay, (0, 0))
+    surface.fill((20, 30, 40, 200))
     
     # Title
-    title_font = pygame.font.Font(None, 72)
-    title = title_font.render("PAUSED", True, game.text_color)
+    title = game.text_cache.render(screen.title_font, "PAUSED", game.text_color)
     title_rect = title.get_rect(center=(game.width // 2, 120))
-    game.screen.blit(title, title_rect)
+    surface.blit(title, title_rect)
     
     # Current score
-    score_text = f"Score: {game.score}/{game.total}  |  Points: {game.points}"
-    if game.streak > 0:
-        score_text += f"  |  Streak: {game.streak}x"
-    score_surface = game.meaning_font.render(score_text, True, game.gray_color)
+    score_surface = game.text_cache.render(game.meaning_font, score_text, game.gray_color)
     score_rect = score_surface.get_rect(center=(game.width // 2, 180))
-    game.screen.blit(score_surface, score_rect)
-    
-    # Resume button
-    resume_color = game.button_hover_color if game.resume_button_hover else game.button_color
-    pygame.draw.rect(game.screen, resume_color, game.resume_button, border_radius=10)
-    resume_text = game.meaning_font.render("▶ Resume", True, (255, 255, 255))
-    resume_text_rect = resume_text.get_rect(center=game.resume_button.center)
-    game.screen.blit(resume_text, resume_text_rect)
-    
-    # Save & Quit button
-    save_quit_color = game.button_hover_color if game.save_quit_button_hover else game.correct_color
-    pygame.draw.rect(game.screen, save_quit_color, game.save_quit_button, border_radius=10)
-    save_quit_text = game.meaning_font.render("💾 Save & Quit", True, (255, 255, 255))
-    save_quit_text_rect = save_quit_text.get_rect(center=game.save_quit_button.center)
-    game.screen.blit(save_quit_text, save_quit_text_rect)
-    
-    # Quit button
-    quit_color = game.button_hover_color if game.quit_button_hover else game.incorrect_color
-    pygame.draw.rect(game.screen, quit_color, game.quit_button, border_radius=10)
-    quit_text = game.meaning_font.render("← Quit to Menu", True, (255, 255, 255))
-    quit_text_rect = quit_text.get_rect(center=game.quit_button.center)
-    game.screen.blit(quit_text, quit_text_rect)
+    surface.blit(score_surface, score_rect)
+    
+    buttons = (
+        ('resume', "▶ Resume", game.button_color),
+        ('save_quit', "💾 Save & Quit", game.correct_color),
+        ('quit', "← Quit to Menu", game.incorrect_color),
+    )
+    for name, text, color in buttons:
+        rect = screen.buttons[name]
+        button_color = game.button_hover_color if screen.hovered == name else color
+        pygame.draw.rect(surface, button_color, rect, border_radius=10)
+        text_surface = game.text_cache.render(game.meaning_font, text, (255, 255, 255))
+        surface.blit(text_surface, text_surface.get_rect(center=rect.center))
+
+
+class ResultsScreen(Screen):
+    """Base for the end-of-game screens: Back to Menu, and Retry Missed when
+    there are missed words, side by side at BUTTON_Y."""
+    
+    BUTTON_Y = 380
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.layout()
+    
+    def layout(self):
+        """Place the buttons for the current canvas size and missed-word list."""
+        game = self.game
+        if game.incorrect_answers:
+            self.menu_button = pygame.Rect(game.width // 2 - 210, self.BUTTON_Y, 200, 50)
+            self.retry_button = pygame.Rect(game.width // 2 + 10, self.BUTTON_Y, 200, 50)
+        else:
+            self.menu_button = pygame.Rect(game.width // 2 - 100, self.BUTTON_Y, 200, 50)
+            self.retry_button = pygame.Rect(0, 0, 0, 0)
+        self.hovered = None  # 'menu', 'retry' or None
+    
+    def enter(self):
+        self.layout()
+    
+    def exit(self):
+        self.hovered = None
+    
+    def resize(self):
+        super().resize()
+        self.layout()
+    
+    def handle_click(self, pos):
+        game = self.game
+        if self.menu_button.collidepoint(pos):
+            game.state = STATE_MENU
+        elif game.incorrect_answers and self.retry_button.collidepoint(pos):
+            game.start_retry_drill()
+        else:
+            return False
+        return True
+    
+    def update_hover(self, pos):
+        if self.menu_button.collidepoint(pos):
+            self.hovered = 'menu'
+        elif self.retry_button.collidepoint(pos):
+            self.hovered = 'retry'
+        else:
+            self.hovered = None
+    
+    def hover_state(self):
+        return (self.hovered,)
+    
+    def hover_regions(self):
+        return [self.menu_button, self.retry_button]
+    
+    def draw_buttons(self, surface):
+        """Draw Back to Menu and, with missed words, Retry Missed."""
+        game = self.game
+        button_color = game.button_hover_color if self.hovered == 'menu' else game.button_color
+        pygame.draw.rect(surface, button_color, self.menu_button, border_radius=10)
+        button_surface = game.text_cache.render(game.meaning_font, "← Back to Menu", (255, 255, 255))
+        surface.blit(button_surface, button_surface.get_rect(center=self.menu_button.center))
+        
+        if not game.incorrect_answers:
+            return
+        retry_color = game.button_hover_color if self.hovered == 'retry' else COLOR_ORANGE
+        pygame.draw.rect(surface, retry_color, self.retry_button, border_radius=10)
+        retry_text = f"↻ Retry Missed ({len(game.incorrect_answers)})"
+        retry_surface = game.text_cache.render(game.meaning_font, retry_text, (255, 255, 255))
+        surface.blit(retry_surface, retry_surface.get_rect(center=self.retry_button.center))
+        
+        if game.save_slots.is_full():
+            warning = game.text_cache.render(game.score_font, "Save slots full: won't autosave", COLOR_ORANGE)
+            surface.blit(warning, warning.get_rect(midbottom=(self.retry_button.centerx, self.retry_button.top - 2)))
 
 
-def draw_game_over(game):
+class GameOverScreen(ResultsScreen):
+    """Final score, high scores for the mode, and the way back."""
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.layers = LayerCache()
+        self.title_font = None
+    
+    def enter(self):
+        super().enter()
+        self.title_font = self.game.fonts.get(64)
+    
+    def exit(self):
+        super().exit()
+        self.title_font = None
+        self.layers.clear()
+    
+    def draw(self):
+        draw_game_over(self.game, self)
+
+
+def draw_game_over(game, screen):
     """Draw the game over screen."""
-    game.screen.fill(game.bg_color)
+    # High scores for this mode
+    high_score_lines = ()
+    if hasattr(game, 'high_scores') and game.high_scores:
+        if game.game_mode == 'time_attack':
+            scores_list = game.high_scores.get('time_attack', [])
+        else:
+            scores_list = game.high_scores.get('normal', [])
+        high_score_lines = tuple(
+            f"{i}. {hs['points']} pts ({hs['percentage']}%) - {hs['date']}"
+            for i, hs in enumerate(scores_list[:3], 1)
+        )
+    
+    key = (game.status_text, high_score_lines, len(game.incorrect_answers),
+           screen.hovered, game.save_slots.is_full())
+    layer = screen.layers.get(key, game.screen.get_size(),
+                              lambda surface: _build_game_over_layer(game, screen, surface, high_score_lines),
+                              opaque=True)
+    game.screen.blit(layer, (0, 0))
+
+
+def _build_game_over_layer(game, screen, surface, high_score_lines):
+    """Draw the whole game over screen onto a layer."""
+    surface.fill(game.bg_color)
     
     # Title
-    title_font = pygame.font.Font(None, 64)
-    title = title_font.render("Game Over!", True, game.text_color)
+    title = game.text_cache.render(screen.title_font, "Game Over!", game.text_color)
     title_rect = title.get_rect(center=(game.width // 2, 80))
-    game.screen.blit(title, title_rect)
+    surface.blit(title, title_rect)
     
     # Final score
     if game.status_text:
-        status_surface = game.meaning_font.render(game.status_text, True, game.status_color)
+        status_surface = game.text_cache.render(game.meaning_font, game.status_text, game.status_color)
         status_rect = status_surface.get_rect(center=(game.width // 2, 140))
-        game.screen.blit(status_surface, status_rect)
+        surface.blit(status_surface, status_rect)
     
     # High scores
     if hasattr(game, 'high_scores') and game.high_scores:
         hs_y = 180
-        hs_title = game.meaning_font.render("🏆 High Scores 🏆", True, COLOR_GOLD)
-        game.screen.blit(hs_title, hs_title.get_rect(center=(game.width // 2, hs_y)))
-        
-        # Get appropriate high scores list
-        if game.game_mode == 'time_attack':
-            scores_list = game.high_scores.get('time_attack', [])
-        else:
-            scores_list = game.high_scores.get('normal', [])
+        hs_title = game.text_cache.render(game.meaning_font, "🏆 High Scores 🏆", COLOR_GOLD)
+        surface.blit(hs_title, hs_title.get_rect(center=(game.width // 2, hs_y)))
         
-        for i, hs in enumerate(scores_list[:3], 1):
-            hs_text = f"{i}. {hs['points']} pts ({hs['percentage']}%) - {hs['date']}"
-            hs_surface = game.meaning_font.render(hs_text, True, game.text_color)
+        for i, hs_text in enumerate(high_score_lines, 1):
+            hs_surface = game.text_cache.render(game.meaning_font, hs_text, game.text_color)
             hs_rect = hs_surface.get_rect(center=(game.width // 2, hs_y + 25 + i * 25))
-            game.screen.blit(hs_surface, hs_rect)
-    
-    # Back to menu button
-    game.button_rect = pygame.Rect(game.width // 2 - 100, 380, 200, 50)
-    button_color = game.button_hover_color if game.button_hover else game.button_color
-    pygame.draw.rect(game.screen, button_color, game.button_rect, border_radius=10)
-    button_surface = game.meaning_font.render("← Back to Menu", True, (255, 255, 255))
-    button_text_rect = button_surface.get_rect(center=game.button_rect.center)
-    game.screen.blit(button_surface, button_text_rect)
+            surface.blit(hs_surface, hs_rect)
+    
+    screen.draw_buttons(surface)
@@ -1,31 +1,75 @@
 """
-Leaderboard screen renderer.
+Leaderboard screen.
 """
 
 import pygame
 from config import *
+from ui.screens.base import Screen
 
 
-def draw_leaderboard(game):
+class LeaderboardScreen(Screen):
+    """Top scores for Normal/Fast and Time Attack side by side."""
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.title_font = None
+        self.section_font = None
+        self.layout()
+    
+    def layout(self):
+        """Place the back button for the current canvas size."""
+        game = self.game
+        self.back_button = pygame.Rect(game.width // 2 - 100, 500, 200, 50)
+        self.hovered = False
+    
+    def enter(self):
+        game = self.game
+        self.title_font = game.fonts.get(48)
+        self.section_font = game.fonts.get(32)
+        if not game.high_scores:
+            from game import get_high_scores
+            game.high_scores = get_high_scores()
+    
+    def exit(self):
+        self.title_font = self.section_font = None
+        self.hovered = False
+    
+    def resize(self):
+        super().resize()
+        self.layout()
+    
+    def handle_click(self, pos):
+        if self.back_button.collidepoint(pos):
+            self.game.state = STATE_MENU
+            return True
+        return False
+    
+    def update_hover(self, pos):
+        self.hovered = self.back_button.collidepoint(pos)
+    
+    def hover_state(self):
+        return (self.hovered,)
+    
+    def hover_regions(self):
+        return [self.back_button]
+    
+    def draw(self):
+        draw_leaderboard(self.game, self)
+
+
+def draw_leaderboard(game, screen):
     """Draw the leaderboard screen with two sections."""
     game.screen.fill(game.bg_color)
     
     # Title
-    title_font = pygame.font.Font(None, 48)
-    title = title_font.render("Leaderboard", True, COLOR_GOLD)
+    title = game.text_cache.render(screen.title_font, "Leaderboard", COLOR_GOLD)
     title_rect = title.get_rect(center=(game.width // 2, 40))
     game.screen.blit(title, title_rect)
     
-    # Get high scores
-    if not game.high_scores:
-        from game import get_high_scores
-        game.high_scores = get_high_scores()
-    
     # Left section - Normal/Fast Mode
     left_x = 50
-    section_title_font = pygame.font.Font(None, 32)
     
-    normal_title = section_title_font.render("Normal / Fast Mode", True, game.button_color)
+    normal_title = game.text_cache.render(screen.section_font, "Normal / Fast Mode", game.button_color)
     normal_title_rect = normal_title.get_rect(x=left_x, y=90)
     game.screen.blit(normal_title, normal_title_rect)
     
@@ -35,24 +79,24 @@ def draw_leaderboard(game):
         for i, hs in enumerate(normal_scores[:5], 1):
             rank_color = game.correct_color if i <= 3 else game.text_color
             rank_text = f"{i}."
-            rank_surface = game.score_font.render(rank_text, True, rank_color)
+            rank_surface = game.text_cache.render(game.score_font, rank_text, rank_color)
             game.screen.blit(rank_surface, (left_x, y_start + i * 45))
             
             score_text = f"{hs['points']} pts | {hs['percentage']}%"
-            score_surface = game.score_font.render(score_text, True, game.text_color)
+            score_surface = game.text_cache.render(game.score_font, score_text, game.text_color)
             game.screen.blit(score_surface, (left_x + 30, y_start + i * 45))
             
             date_text = f"{hs['date']}"
-            date_surface = game.score_font.render(date_text, True, game.gray_color)
+            date_surface = game.text_cache.render(game.score_font, date_text, game.gray_color)
             game.screen.blit(date_surface, (left_x + 30, y_start + i * 45 + 18))
     else:
-        no_scores = game.score_font.render("No scores yet!", True, game.gray_color)
+        no_scores = game.text_cache.render(game.score_font, "No scores yet!", game.gray_color)
         game.screen.blit(no_scores, (left_x, 150))
     
     # Right section - Time Attack Mode
     right_x = game.width // 2 + 20
     
-    ta_title = section_title_font.render("⏱ Time Attack", True, COLOR_ORANGE)
+    ta_title = game.text_cache.render(screen.section_font, "⏱ Time Attack", COLOR_ORANGE)
     ta_title_rect = ta_title.get_rect(x=right_x, y=90)
     game.screen.blit(ta_title, ta_title_rect)
     
@@ -62,23 +106,23 @@ def draw_leaderboard(game):
         for i, hs in enumerate(time_attack_scores[:5], 1):
             rank_color = game.correct_color if i <= 3 else game.text_color
             rank_text = f"{i}."
-            rank_surface = game.score_font.render(rank_text, True, rank_color)
+            rank_surface = game.text_cache.render(game.score_font, rank_text, rank_color)
             game.screen.blit(rank_surface, (right_x, y_start + i * 45))
             
             score_text = f"{hs['score']}/{hs['total']} | {hs['points']} pts"
-            score_surface = game.score_font.render(score_text, True, game.text_color)
+            score_surface = game.text_cache.render(game.score_font, score_text, game.text_color)
             game.screen.blit(score_surface, (right_x + 30, y_start + i * 45))
             
             date_text = f"{hs['date']}"
-            date_surface = game.score_font.render(date_text, True, game.gray_color)
+            date_surface = game.text_cache.render(game.score_font, date_text, game.gray_color)
             game.screen.blit(date_surface, (right_x + 30, y_start + i * 45 + 18))
     else:
-        no_scores = game.score_font.render("No scores yet!", True, game.gray_color)
+        no_scores = game.text_cache.render(game.score_font, "No scores yet!", game.gray_color)
         game.screen.blit(no_scores, (right_x, 150))
     
     # Back button
-    back_color = game.button_hover_color if game.back_button_hover else game.button_color
-    pygame.draw.rect(game.screen, back_color, game.back_button, border_radius=10)
-    back_text = game.meaning_font.render("← Back to Menu", True, (255, 255, 255))
-    back_text_rect = back_text.get_rect(center=game.back_button.center)
+    back_color = game.button_hover_color if screen.hovered else game.button_color
+    pygame.draw.rect(game.screen, back_color, screen.back_button, border_radius=10)
+    back_text = game.text_cache.render(game.meaning_font, "← Back to Menu", (255, 255, 255))
+    back_text_rect = back_text.get_rect(center=screen.back_button.center)
     game.screen.blit(back_text, back_text_rect)
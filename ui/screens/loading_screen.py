@@ -1,14 +1,65 @@
 """
-Loading screen renderers.
+Loading, save loading and saving screens.
 """
 
 import math
 import pygame
 from config import *
+from ui.background import LOADING_FIELD
+from ui.screens.base import Screen
 
 
-def draw_loading(game):
-    """Draw the loading screen."""
+class LoadingScreen(Screen):
+    """Deck loading, with a Retry button when Anki can't be reached."""
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.title_font = None
+        self.layout()
+    
+    def layout(self):
+        """Place the retry button for the current canvas size."""
+        game = self.game
+        self.retry_button = pygame.Rect(game.width // 2 - 100, game.height // 2 + 80, 200, 50)
+        self.hovered = False
+    
+    def enter(self):
+        self.title_font = self.game.fonts.get(64)
+    
+    def exit(self):
+        self.title_font = None
+        self.hovered = False
+    
+    def resize(self):
+        super().resize()
+        self.layout()
+    
+    def handle_click(self, pos):
+        if self.game.loading_error and self.retry_button.collidepoint(pos):
+            self.game.retry_connection()
+            return True
+        return False
+    
+    def handle_key(self, event):
+        if not self.game.loading_error:
+            return
+        if event.key == pygame.K_ESCAPE:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        elif event.key == pygame.K_r:
+            self.game.retry_connection()
+    
+    def update_hover(self, pos):
+        self.hovered = bool(self.game.loading_error) and self.retry_button.collidepoint(pos)
+    
+    def hover_state(self):
+        return (self.hovered,)
+    
+    def draw(self):
+        draw_loading(self.game, self)
+
+
+def _fill_background(game):
+    """Fill the window with the slowly pulsing loading background."""
     base_color = game.bg_color
     wave = int(15 * math.sin(game.background_time * 2))
     bg_color = (
@@ -17,24 +68,35 @@ def draw_loading(game):
         max(0, min(255, base_color[2] + wave))
     )
     game.screen.fill(bg_color)
+
+
+def _draw_progress_bar(game, color):
+    """Draw the animated progress bar below the status line."""
+    bar_width = 400
+    bar_height = 20
+    bar_x = (game.width - bar_width) // 2
+    bar_y = game.height // 2 + 70
+    
+    pygame.draw.rect(game.screen, game.gray_color,
+                   (bar_x, bar_y, bar_width, bar_height),
+                   border_radius=10)
+    
+    progress_width = 100
+    progress_x = bar_x + int((bar_width - progress_width) * (0.5 + 0.5 * math.sin(game.background_time * 3)))
+    pygame.draw.rect(game.screen, color,
+                   (progress_x, bar_y, progress_width, bar_height),
+                   border_radius=10)
+
+
+def draw_loading(game, screen):
+    """Draw the loading screen."""
+    _fill_background(game)
     
     # Draw animated particles
-    for i in range(15):
-        base_x = (game.background_time * 45 + i * 119) % (game.width + 50)
-        base_y = (i * 71) % game.height
-        offset_x = 35 * math.sin(i * 2.97)
-        offset_y = 30 * math.cos(i * 3.33)
-        x = base_x + offset_x
-        y = base_y + offset_y
-        alpha = int(100 + 50 * math.sin(game.background_time * 2 + i))
-        size = 3 + int(2 * math.sin(game.background_time * 3 + i * 0.5))
-        s = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*game.button_color[:3], alpha), (int(size), int(size)), int(size))
-        game.screen.blit(s, (int(x), int(y)))
+    game.ambient.draw(game.screen, LOADING_FIELD, game.background_time, game.button_color)
     
     # Title
-    title_font = pygame.font.Font(None, 64)
-    title = title_font.render("Loading...", True, game.text_color)
+    title = game.text_cache.render(screen.title_font, "Loading...", game.text_color)
     title_rect = title.get_rect(center=(game.width // 2, game.height // 2 - 50))
     game.screen.blit(title, title_rect)
     
@@ -42,138 +104,76 @@ def draw_loading(game):
     if game.loading_error:
         status_color = game.incorrect_color
         status = game.loading_error
-        status_font = pygame.font.Font(None, 24)
+        status_font = game.fonts.get(24)
         game.draw_text_wrapped(status, status_font, status_color, game.height // 2 + 20, max_width=700)
         
         # Show retry button
-        button_color = game.button_hover_color if game.retry_button_hover else game.button_color
-        pygame.draw.rect(game.screen, button_color, game.retry_button, border_radius=8)
+        button_color = game.button_hover_color if screen.hovered else game.button_color
+        pygame.draw.rect(game.screen, button_color, screen.retry_button, border_radius=8)
         
         retry_text = "Retry"
-        retry_font = pygame.font.Font(None, 32)
-        retry_surface = retry_font.render(retry_text, True, game.text_color)
-        retry_rect = retry_surface.get_rect(center=game.retry_button.center)
+        retry_font = game.fonts.get(32)
+        retry_surface = game.text_cache.render(retry_font, retry_text, game.text_color)
+        retry_rect = retry_surface.get_rect(center=screen.retry_button.center)
         game.screen.blit(retry_surface, retry_rect)
         
         hint_text = "Press ESC to quit or R to retry"
-        hint_surface = game.meaning_font.render(hint_text, True, game.gray_color)
+        hint_surface = game.text_cache.render(game.meaning_font, hint_text, game.gray_color)
         hint_rect = hint_surface.get_rect(center=(game.width // 2, game.height // 2 + 150))
         game.screen.blit(hint_surface, hint_rect)
     else:
         status_color = game.button_color
         status = game.loading_status
-        status_font = pygame.font.Font(None, 28)
-        status_surface = status_font.render(status, True, status_color)
+        status_font = game.fonts.get(28)
+        status_surface = game.text_cache.render(status_font, status, status_color)
         status_rect = status_surface.get_rect(center=(game.width // 2, game.height // 2 + 20))
         game.screen.blit(status_surface, status_rect)
         
-        # Animated loading bar
-        bar_width = 400
-        bar_height = 20
-        bar_x = (game.width - bar_width) // 2
-        bar_y = game.height // 2 + 70
-        
-        pygame.draw.rect(game.screen, game.gray_color, 
-                       (bar_x, bar_y, bar_width, bar_height), 
-                       border_radius=10)
-        
-        progress_width = 100
-        progress_x = bar_x + int((bar_width - progress_width) * (0.5 + 0.5 * math.sin(game.background_time * 3)))
-        pygame.draw.rect(game.screen, game.button_color,
-                       (progress_x, bar_y, progress_width, bar_height),
-                       border_radius=10)
+        _draw_progress_bar(game, game.button_color)
 
 
-def draw_loading_save(game):
-    """Draw the loading save screen."""
-    base_color = game.bg_color
-    wave = int(15 * math.sin(game.background_time * 2))
-    bg_color = (
-        max(0, min(255, base_color[0] + wave)),
-        max(0, min(255, base_color[1] + wave)),
-        max(0, min(255, base_color[2] + wave))
-    )
-    game.screen.fill(bg_color)
+class SaveProgressScreen(Screen):
+    """Shown while a saved game is read or written; subclasses set TITLE."""
     
-    # Draw animated particles
-    for i in range(15):
-        base_x = (game.background_time * 45 + i * 119) % (game.width + 50)
-        base_y = (i * 71) % game.height
-        offset_x = 35 * math.sin(i * 2.97)
-        offset_y = 30 * math.cos(i * 3.33)
-        x = base_x + offset_x
-        y = base_y + offset_y
-        alpha = int(100 + 50 * math.sin(game.background_time * 2 + i))
-        size = 3 + int(2 * math.sin(game.background_time * 3 + i * 0.5))
-        s = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*game.correct_color[:3], alpha), (int(size), int(size)), int(size))
-        game.screen.blit(s, (int(x), int(y)))
+    TITLE = ""
     
-    # Title
-    title_font = pygame.font.Font(None, 64)
-    title = title_font.render("Loading Game...", True, game.text_color)
-    title_rect = title.get_rect(center=(game.width // 2, game.height // 2 - 50))
-    game.screen.blit(title, title_rect)
+    def __init__(self, game):
+        super().__init__(game)
+        self.title_font = None
+        self.status_font = None
     
-    # Status
-    if game.save_load_error:
-        status_color = game.incorrect_color
-        status = game.save_load_error
-    else:
-        status_color = game.correct_color
-        status = game.save_load_status
+    def enter(self):
+        self.title_font = self.game.fonts.get(64)
+        self.status_font = self.game.fonts.get(28)
     
-    status_font = pygame.font.Font(None, 28)
-    status_surface = status_font.render(status, True, status_color)
-    status_rect = status_surface.get_rect(center=(game.width // 2, game.height // 2 + 20))
-    game.screen.blit(status_surface, status_rect)
+    def exit(self):
+        self.title_font = self.status_font = None
     
-    # Animated loading bar
-    if not game.save_load_error:
-        bar_width = 400
-        bar_height = 20
-        bar_x = (game.width - bar_width) // 2
-        bar_y = game.height // 2 + 70
-        
-        pygame.draw.rect(game.screen, game.gray_color, 
-                       (bar_x, bar_y, bar_width, bar_height), 
-                       border_radius=10)
-        
-        progress_width = 100
-        progress_x = bar_x + int((bar_width - progress_width) * (0.5 + 0.5 * math.sin(game.background_time * 3)))
-        pygame.draw.rect(game.screen, game.correct_color,
-                       (progress_x, bar_y, progress_width, bar_height),
-                       border_radius=10)
+    def draw(self):
+        draw_save_progress(self.game, self)
 
 
-def draw_saving(game):
-    """Draw the saving screen."""
-    base_color = game.bg_color
-    wave = int(15 * math.sin(game.background_time * 2))
-    bg_color = (
-        max(0, min(255, base_color[0] + wave)),
-        max(0, min(255, base_color[1] + wave)),
-        max(0, min(255, base_color[2] + wave))
-    )
-    game.screen.fill(bg_color)
+class LoadingSaveScreen(SaveProgressScreen):
+    """Reading a save slot."""
+    
+    TITLE = "Loading Game..."
+
+
+class SavingScreen(SaveProgressScreen):
+    """Writing the current game to its save slot."""
+    
+    TITLE = "Saving Game..."
+
+
+def draw_save_progress(game, screen):
+    """Draw the loading save or saving screen."""
+    _fill_background(game)
     
     # Draw animated particles
-    for i in range(15):
-        base_x = (game.background_time * 45 + i * 119) % (game.width + 50)
-        base_y = (i * 71) % game.height
-        offset_x = 35 * math.sin(i * 2.97)
-        offset_y = 30 * math.cos(i * 3.33)
-        x = base_x + offset_x
-        y = base_y + offset_y
-        alpha = int(100 + 50 * math.sin(game.background_time * 2 + i))
-        size = 3 + int(2 * math.sin(game.background_time * 3 + i * 0.5))
-        s = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*game.correct_color[:3], alpha), (int(size), int(size)), int(size))
-        game.screen.blit(s, (int(x), int(y)))
+    game.ambient.draw(game.screen, LOADING_FIELD, game.background_time, game.correct_color)
     
     # Title
-    title_font = pygame.font.Font(None, 64)
-    title = title_font.render("Saving Game...", True, game.text_color)
+    title = game.text_cache.render(screen.title_font, screen.TITLE, game.text_color)
     title_rect = title.get_rect(center=(game.width // 2, game.height // 2 - 50))
     game.screen.blit(title, title_rect)
     
@@ -185,24 +185,10 @@ def draw_saving(game):
         status_color = game.correct_color
         status = game.save_load_status
     
-    status_font = pygame.font.Font(None, 28)
-    status_surface = status_font.render(status, True, status_color)
+    status_surface = game.text_cache.render(screen.status_font, status, status_color)
     status_rect = status_surface.get_rect(center=(game.width // 2, game.height // 2 + 20))
     game.screen.blit(status_surface, status_rect)
     
     # Animated loading bar
     if not game.save_load_error:
-        bar_width = 400
-        bar_height = 20
-        bar_x = (game.width - bar_width) // 2
-        bar_y = game.height // 2 + 70
-        
-        pygame.draw.rect(game.screen, game.gray_color, 
-                       (bar_x, bar_y, bar_width, bar_height), 
-                       border_radius=10)
-        
-        progress_width = 100
-        progress_x = bar_x + int((bar_width - progress_width) * (0.5 + 0.5 * math.sin(game.background_time * 3)))
-        pygame.draw.rect(game.screen, game.correct_color,
-                       (progress_x, bar_y, progress_width, bar_height),
-                       border_radius=10)
+        _draw_progress_bar(game, game.correct_color)
@@ -1,13 +1,96 @@
 """
-Menu screen renderers.
+Menu and mode selection screens.
 """
 
 import math
 import pygame
 from config import *
+from ui.background import MENU_FIELD
+from ui.layers import LayerCache
+from ui.screens.base import Screen
 
 
-def draw_menu(game):
+class MenuScreen(Screen):
+    """Main menu: Play, Leaderboard and one Resume button per saved game."""
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.layers = LayerCache()
+        self.title_font = None
+        self.layout()
+    
+    def layout(self):
+        """Place the buttons for the current canvas size."""
+        game = self.game
+        self.play_button = pygame.Rect(game.width // 2 - 100, 210, 200, 60)
+        self.leaderboard_button = pygame.Rect(game.width // 2 - 100, 285, 200, 60)
+        
+        # Resume buttons, one per save slot, each with a delete button
+        self.resume_slot_buttons = []
+        self.delete_slot_buttons = []
+        for i in range(SAVE_SLOT_COUNT):
+            slot_rect = pygame.Rect(game.width // 2 - 180, 395 + i * 58, 360, 50)
+            self.resume_slot_buttons.append(slot_rect)
+            self.delete_slot_buttons.append(pygame.Rect(slot_rect.right - 38, slot_rect.y + 10, 30, 30))
+        self.hovered = None  # 'play', 'leaderboard' or None
+        self.resume_slot_hover = -1
+        self.delete_slot_hover = -1
+    
+    def enter(self):
+        self.title_font = self.game.fonts.get(64)
+        # Back at the menu, so the game's screens can drop what they kept
+        for screen in self.game.screens.loaded():
+            if screen is not self:
+                screen.release()
+    
+    def exit(self):
+        self.title_font = None
+        self.hovered = None
+        self.resume_slot_hover = self.delete_slot_hover = -1
+        self.layers.clear()
+    
+    def resize(self):
+        super().resize()
+        self.layout()
+    
+    def handle_click(self, pos):
+        game = self.game
+        if self.play_button.collidepoint(pos):
+            game.start_game()
+            return True
+        if self.leaderboard_button.collidepoint(pos):
+            game.show_leaderboard()
+            return True
+        for i, (slot_name, _) in enumerate(game.save_slots.list_slots()):
+            # The delete button sits inside the resume button, so it goes first
+            if self.delete_slot_buttons[i].collidepoint(pos):
+                game.delete_save_slot(slot_name)
+                return True
+            if self.resume_slot_buttons[i].collidepoint(pos):
+                game.load_game(slot_name)
+                return True
+        return False
+    
+    def update_hover(self, pos):
+        if self.play_button.collidepoint(pos):
+            self.hovered = 'play'
+        elif self.leaderboard_button.collidepoint(pos):
+            self.hovered = 'leaderboard'
+        else:
+            self.hovered = None
+        self.resume_slot_hover = next(
+            (i for i, rect in enumerate(self.resume_slot_buttons) if rect.collidepoint(pos)), -1)
+        self.delete_slot_hover = next(
+            (i for i, rect in enumerate(self.delete_slot_buttons) if rect.collidepoint(pos)), -1)
+    
+    def hover_state(self):
+        return (self.hovered, self.resume_slot_hover, self.delete_slot_hover)
+    
+    def draw(self):
+        draw_menu(self.game, self)
+
+
+def draw_menu(game, screen):
     """Draw the main menu."""
     base_color = game.bg_color
     wave = int(10 * math.sin(game.background_time * 0.5))
@@ -19,54 +102,124 @@ def draw_menu(game):
     game.screen.fill(bg_color)
     
     # Draw background particles
-    for i in range(12):
-        base_x = (game.background_time * 25 + i * 137) % (game.width + 50)
-        base_y = (i * 83) % game.height
-        offset_x = 40 * math.sin(i * 3.14)
-        offset_y = 35 * math.cos(i * 2.71)
-        x = base_x + offset_x
-        y = base_y + offset_y
-        alpha = int(50 + 30 * math.sin(game.background_time + i))
-        s = pygame.Surface((4, 4), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*game.text_color[:3], alpha), (2, 2), 2)
-        game.screen.blit(s, (int(x), int(y)))
+    game.ambient.draw(game.screen, MENU_FIELD, game.background_time, game.text_color)
     
+    # Titles and buttons only change with hover and the save slot list
+    slots = game.save_slots.list_slots()  # Cached index, no file access
+    key = (screen.hover_state(), tuple((name, tuple(sorted(meta.items()))) for name, meta in slots))
+    layer = screen.layers.get(key, game.screen.get_size(), lambda surface: _build_menu_layer(game, screen, surface, slots))
+    game.screen.blit(layer, (0, 0))
+
+
+def _build_menu_layer(game, screen, surface, slots):
+    """Draw the main menu's titles and buttons onto a layer."""
     # Title
-    title_font = pygame.font.Font(None, 64)
-    title = title_font.render("Japanese Vocab Quiz", True, game.text_color)
+    title = game.text_cache.render(screen.title_font, "Japanese Vocab Quiz", game.text_color)
     title_rect = title.get_rect(center=(game.width // 2, 100))
-    game.screen.blit(title, title_rect)
+    surface.blit(title, title_rect)
     
     # Subtitle (using Japanese-capable font)
-    subtitle_font = pygame.font.SysFont(game.reading_font.get_name() if hasattr(game.reading_font, 'get_name') else 'msgothic', 20)
-    subtitle = subtitle_font.render("日本語語彙クイズ", True, game.gray_color)
+    subtitle = game.glyphs.render("日本語語彙クイズ", 20, game.gray_color)
     subtitle_rect = subtitle.get_rect(center=(game.width // 2, 140))
-    game.screen.blit(subtitle, subtitle_rect)
+    surface.blit(subtitle, subtitle_rect)
     
     # Play button
-    play_color = game.button_hover_color if game.play_button_hover else game.button_color
-    pygame.draw.rect(game.screen, play_color, game.play_button, border_radius=10)
-    play_text = game.meaning_font.render("Play", True, (255, 255, 255))
-    play_text_rect = play_text.get_rect(center=game.play_button.center)
-    game.screen.blit(play_text, play_text_rect)
-    
-    # Resume Game button (only if save file exists)
-    if game.has_save_file():
-        resume_color = game.button_hover_color if game.resume_game_button_hover else game.correct_color
-        pygame.draw.rect(game.screen, resume_color, game.resume_game_button, border_radius=10)
-        resume_text = game.meaning_font.render("▶ Resume Game", True, (255, 255, 255))
-        resume_text_rect = resume_text.get_rect(center=game.resume_game_button.center)
-        game.screen.blit(resume_text, resume_text_rect)
+    play_color = game.button_hover_color if screen.hovered == 'play' else game.button_color
+    pygame.draw.rect(surface, play_color, screen.play_button, border_radius=10)
+    play_text = game.text_cache.render(game.meaning_font, "Play", (255, 255, 255))
+    play_text_rect = play_text.get_rect(center=screen.play_button.center)
+    surface.blit(play_text, play_text_rect)
+    
+    # Resume buttons, one per occupied save slot
+    if slots:
+        resume_label = game.text_cache.render(game.score_font, "Resume a saved game", game.gray_color)
+        resume_label_rect = resume_label.get_rect(center=(game.width // 2, screen.resume_slot_buttons[0].top - 14))
+        surface.blit(resume_label, resume_label_rect)
+    
+    for i, (slot_name, meta) in enumerate(slots):
+        slot_rect = screen.resume_slot_buttons[i]
+        resume_color = game.button_hover_color if screen.resume_slot_hover == i else game.correct_color
+        pygame.draw.rect(surface, resume_color, slot_rect, border_radius=10)
+        
+        mode_name = meta['game_mode'].replace('_', ' ').title()
+        title_text = f"▶ {meta['deck_name']} · {mode_name}"
+        title_surface = game.text_cache.render(game.meaning_font, title_text, (255, 255, 255))
+        surface.blit(title_surface, (slot_rect.x + 12, slot_rect.y + 8))
+        
+        detail_text = f"{meta['score']}/{meta['total']} · {meta['points']} pts · {meta['timestamp'][:16].replace('T', ' ')}"
+        detail_surface = game.text_cache.render(game.score_font, detail_text, (255, 255, 255))
+        surface.blit(detail_surface, (slot_rect.x + 12, slot_rect.y + 29))
+        
+        delete_rect = screen.delete_slot_buttons[i]
+        delete_color = game.incorrect_color if screen.delete_slot_hover == i else game.button_hover_color
+        pygame.draw.rect(surface, delete_color, delete_rect, border_radius=6)
+        delete_text = game.text_cache.render(game.meaning_font, "✕", (255, 255, 255))
+        surface.blit(delete_text, delete_text.get_rect(center=delete_rect.center))
     
     # Leaderboard button
-    lb_color = game.button_hover_color if game.leaderboard_button_hover else game.button_color
-    pygame.draw.rect(game.screen, lb_color, game.leaderboard_button, border_radius=10)
-    lb_text = game.meaning_font.render("🏆 Leaderboard", True, (255, 255, 255))
-    lb_text_rect = lb_text.get_rect(center=game.leaderboard_button.center)
-    game.screen.blit(lb_text, lb_text_rect)
+    lb_color = game.button_hover_color if screen.hovered == 'leaderboard' else game.button_color
+    pygame.draw.rect(surface, lb_color, screen.leaderboard_button, border_radius=10)
+    lb_text = game.text_cache.render(game.meaning_font, "🏆 Leaderboard", (255, 255, 255))
+    lb_text_rect = lb_text.get_rect(center=screen.leaderboard_button.center)
+    surface.blit(lb_text, lb_text_rect)
 
 
-def draw_mode_select(game):
+class ModeSelectScreen(Screen):
+    """Normal, Fast and Time Attack mode buttons."""
+    
+    def __init__(self, game):
+        super().__init__(game)
+        self.layers = LayerCache()
+        self.title_font = None
+        self.mode_font = None
+        self.layout()
+    
+    def layout(self):
+        """Place the buttons for the current canvas size."""
+        game = self.game
+        self.buttons = {
+            'normal': pygame.Rect(game.width // 2 - 220, 250, 200, 80),
+            'fast': pygame.Rect(game.width // 2 + 20, 250, 200, 80),
+            'time_attack': pygame.Rect(game.width // 2 - 100, 360, 200, 80),
+            'back': pygame.Rect(game.width // 2 - 100, 500, 200, 50),
+        }
+        self.hovered = None
+    
+    def enter(self):
+        self.title_font = self.game.fonts.get(56)
+        self.mode_font = self.game.fonts.get(36)
+    
+    def exit(self):
+        self.title_font = self.mode_font = None
+        self.hovered = None
+        self.layers.clear()
+    
+    def resize(self):
+        super().resize()
+        self.layout()
+    
+    def handle_click(self, pos):
+        game = self.game
+        name = next((name for name, rect in self.buttons.items() if rect.collidepoint(pos)), None)
+        if name is None:
+            return False
+        if name == 'back':
+            game.state = STATE_FILTER_SELECT
+        else:
+            game.start_game_with_mode(name)
+        return True
+    
+    def update_hover(self, pos):
+        self.hovered = next((name for name, rect in self.buttons.items() if rect.collidepoint(pos)), None)
+    
+    def hover_state(self):
+        return (self.hovered,)
+    
+    def draw(self):
+        draw_mode_select(self.game, self)
+
+
+def draw_mode_select(game, screen):
     """Draw the mode selection screen."""
     base_color = game.bg_color
     wave = int(10 * math.sin(game.background_time * 0.5))
@@ -78,66 +231,48 @@ def draw_mode_select(game):
     game.screen.fill(bg_color)
     
     # Draw background particles
-    for i in range(12):
-        base_x = (game.background_time * 25 + i * 137) % (game.width + 50)
-        base_y = (i * 83) % game.height
-        offset_x = 40 * math.sin(i * 3.14)
-        offset_y = 35 * math.cos(i * 2.71)
-        x = base_x + offset_x
-        y = base_y + offset_y
-        alpha = int(50 + 30 * math.sin(game.background_time + i))
-        s = pygame.Surface((4, 4), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*game.text_color[:3], alpha), (2, 2), 2)
-        game.screen.blit(s, (int(x), int(y)))
+    game.ambient.draw(game.screen, MENU_FIELD, game.background_time, game.text_color)
     
+    key = (screen.hovered, game.save_slots.is_full())
+    layer = screen.layers.get(key, game.screen.get_size(), lambda surface: _build_mode_select_layer(game, screen, surface))
+    game.screen.blit(layer, (0, 0))
+
+
+def _build_mode_select_layer(game, screen, surface):
+    """Draw the mode selection titles and buttons onto a layer."""
     # Title
-    title_font = pygame.font.Font(None, 56)
-    title = title_font.render("Select Game Mode", True, game.text_color)
+    title = game.text_cache.render(screen.title_font, "Select Game Mode", game.text_color)
     title_rect = title.get_rect(center=(game.width // 2, 120))
-    game.screen.blit(title, title_rect)
-    
-    # Normal mode button
-    normal_color = game.button_hover_color if game.normal_mode_hover else game.button_color
-    pygame.draw.rect(game.screen, normal_color, game.normal_mode_button, border_radius=10)
-    normal_title = pygame.font.Font(None, 36).render("Normal", True, (255, 255, 255))
-    normal_title_rect = normal_title.get_rect(center=(game.normal_mode_button.centerx, game.normal_mode_button.centery - 15))
-    game.screen.blit(normal_title, normal_title_rect)
-    normal_desc = game.score_font.render("Full animations", True, (255, 255, 255))
-    normal_desc_rect = normal_desc.get_rect(center=(game.normal_mode_button.centerx, game.normal_mode_button.centery + 10))
-    game.screen.blit(normal_desc, normal_desc_rect)
-    normal_desc2 = game.score_font.render("& feedback", True, (255, 255, 255))
-    normal_desc2_rect = normal_desc2.get_rect(center=(game.normal_mode_button.centerx, game.normal_mode_button.centery + 28))
-    game.screen.blit(normal_desc2, normal_desc2_rect)
-    
-    # Fast mode button
-    fast_color = game.button_hover_color if game.fast_mode_hover else game.correct_color
-    pygame.draw.rect(game.screen, fast_color, game.fast_mode_button, border_radius=10)
-    fast_title = pygame.font.Font(None, 36).render("Fast", True, (255, 255, 255))
-    fast_title_rect = fast_title.get_rect(center=(game.fast_mode_button.centerx, game.fast_mode_button.centery - 15))
-    game.screen.blit(fast_title, fast_title_rect)
-    fast_desc = game.score_font.render("No animations", True, (255, 255, 255))
-    fast_desc_rect = fast_desc.get_rect(center=(game.fast_mode_button.centerx, game.fast_mode_button.centery + 10))
-    game.screen.blit(fast_desc, fast_desc_rect)
-    fast_desc2 = game.score_font.render("Instant next word", True, (255, 255, 255))
-    fast_desc2_rect = fast_desc2.get_rect(center=(game.fast_mode_button.centerx, game.fast_mode_button.centery + 28))
-    game.screen.blit(fast_desc2, fast_desc2_rect)
-    
-    # Time Attack mode button
-    time_attack_color = game.button_hover_color if game.time_attack_hover else COLOR_ORANGE
-    pygame.draw.rect(game.screen, time_attack_color, game.time_attack_button, border_radius=10)
-    ta_title = pygame.font.Font(None, 36).render("⏱ Time Attack", True, (255, 255, 255))
-    ta_title_rect = ta_title.get_rect(center=(game.time_attack_button.centerx, game.time_attack_button.centery - 15))
-    game.screen.blit(ta_title, ta_title_rect)
-    ta_desc = game.score_font.render("60 seconds", True, (255, 255, 255))
-    ta_desc_rect = ta_desc.get_rect(center=(game.time_attack_button.centerx, game.time_attack_button.centery + 10))
-    game.screen.blit(ta_desc, ta_desc_rect)
-    ta_desc2 = game.score_font.render("Get as many as you can!", True, (255, 255, 255))
-    ta_desc2_rect = ta_desc2.get_rect(center=(game.time_attack_button.centerx, game.time_attack_button.centery + 28))
-    game.screen.blit(ta_desc2, ta_desc2_rect)
+    surface.blit(title, title_rect)
+    
+    # Mode buttons: title and two lines of description
+    modes = (
+        ('normal', "Normal", "Full animations", "& feedback", game.button_color),
+        ('fast', "Fast", "No animations", "Instant next word", game.correct_color),
+        ('time_attack', "⏱ Time Attack", "60 seconds", "Get as many as you can!", COLOR_ORANGE),
+    )
+    for name, title_text, desc_text, desc2_text, color in modes:
+        rect = screen.buttons[name]
+        button_color = game.button_hover_color if screen.hovered == name else color
+        pygame.draw.rect(surface, button_color, rect, border_radius=10)
+        mode_title = game.text_cache.render(screen.mode_font, title_text, (255, 255, 255))
+        surface.blit(mode_title, mode_title.get_rect(center=(rect.centerx, rect.centery - 15)))
+        desc = game.text_cache.render(game.score_font, desc_text, (255, 255, 255))
+        surface.blit(desc, desc.get_rect(center=(rect.centerx, rect.centery + 10)))
+        desc2 = game.text_cache.render(game.score_font, desc2_text, (255, 255, 255))
+        surface.blit(desc2, desc2.get_rect(center=(rect.centerx, rect.centery + 28)))
     
     # Back button
-    back_color = game.button_hover_color if game.back_button_hover else game.status_color
-    pygame.draw.rect(game.screen, back_color, game.back_button, border_radius=10)
-    back_text = game.meaning_font.render("← Back", True, (255, 255, 255))
-    back_text_rect = back_text.get_rect(center=game.back_button.center)
-    game.screen.blit(back_text, back_text_rect)
+    back_button = screen.buttons['back']
+    back_color = game.button_hover_color if screen.hovered == 'back' else game.status_color
+    pygame.draw.rect(surface, back_color, back_button, border_radius=10)
+    back_text = game.text_cache.render(game.meaning_font, "← Back", (255, 255, 255))
+    back_text_rect = back_text.get_rect(center=back_button.center)
+    surface.blit(back_text, back_text_rect)
+    
+    # New games never overwrite a save; warn that this one can't be saved
+    if game.save_slots.is_full():
+        warning_text = (f"All {game.save_slots.slot_count} save slots are full: this game won't be saved. "
+                        "Delete a slot from the menu first.")
+        warning = game.text_cache.render(game.score_font, warning_text, COLOR_ORANGE)
+        surface.blit(warning, warning.get_rect(center=(game.width // 2, back_button.bottom + 35)))
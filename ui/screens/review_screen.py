@@ -2,105 +2,140 @@
 Review incorrect answers screen renderer.
 """
 
+from collections import OrderedDict
+
 import pygame
 from config import *
+from ui.screens.game_screen import ResultsScreen
+
 
+SCROLL_AREA_TOP = 120
+SCROLL_AREA_BOTTOM = 560
+ITEM_HEIGHT = 60
 
-def draw_review_incorrect(game):
+
+class ReviewScreen(ResultsScreen):
+    """Scrollable list of the answers missed in the last game.
+    
+    The list is virtualized: each row is rendered once into its own surface
+    and kept in a bounded LRU cache, and scrolling only changes where the
+    visible rows are blitted.
+    """
+    
+    BUTTON_Y = 580
+    
+    def __init__(self, game, max_rows=REVIEW_ROW_CACHE_SIZE):
+        super().__init__(game)
+        self.max_rows = max_rows
+        self.rows = OrderedDict()  # (index, width) -> row surface
+    
+    def enter(self):
+        super().enter()
+        self.game.review_scroll = 0
+    
+    def exit(self):
+        super().exit()
+        self.rows.clear()
+    
+    def scroll(self, amount):
+        self.game.review_scroll += amount
+    
+    def update(self, dt):
+        # Keep the scroll position inside the list
+        game = self.game
+        max_scroll = max(0, len(game.incorrect_answers) * ITEM_HEIGHT - (SCROLL_AREA_BOTTOM - SCROLL_AREA_TOP))
+        game.review_scroll = max(0, min(game.review_scroll, max_scroll))
+    
+    def draw(self):
+        draw_review_incorrect(self.game, self)
+    
+    def row_surface(self, index):
+        """
+        Get the rendered row for an incorrect answer.
+        
+        Args:
+            index: Index into game.incorrect_answers
+        
+        Returns:
+            pygame.Surface the width of the window and ITEM_HEIGHT tall
+        """
+        game = self.game
+        key = (index, game.width)
+        row = self.rows.get(key)
+        if row is not None:
+            self.rows.move_to_end(key)
+            return row
+        
+        ans = game.incorrect_answers[index]
+        row = pygame.Surface((game.width, ITEM_HEIGHT), pygame.SRCALPHA)
+        
+        # Word
+        word_surface = game.glyphs.render(ans['word'], 36, game.text_color)
+        row.blit(word_surface, word_surface.get_rect(center=(game.width // 2, 20)))
+        
+        # Correct reading
+        correct_surface = game.glyphs.render(f"✓ {ans['correct_reading']}", 24, game.correct_color)
+        row.blit(correct_surface, correct_surface.get_rect(center=(game.width // 2, 45)))
+        
+        # Your answer
+        if ans['your_answer']:
+            your_surface = game.glyphs.render(f"✗ {ans['your_answer']}", 24, game.incorrect_color)
+            row.blit(your_surface, your_surface.get_rect(center=(game.width // 2 + 150, 45)))
+        
+        self.rows[key] = row
+        if len(self.rows) > self.max_rows:
+            self.rows.popitem(last=False)
+        return row
+
+
+def draw_review_incorrect(game, screen):
     """Draw the review incorrect answers screen."""
     game.screen.fill(game.bg_color)
     
     # Title
-    title_font = pygame.font.Font(None, 48)
-    title = title_font.render("Review Incorrect Answers", True, game.incorrect_color)
+    title_font = game.fonts.get(48)
+    title = game.text_cache.render(title_font, "Review Incorrect Answers", game.incorrect_color)
     title_rect = title.get_rect(center=(game.width // 2, 40))
     game.screen.blit(title, title_rect)
     
     # Count
     count_text = f"{len(game.incorrect_answers)} incorrect answer(s)"
-    count_surface = game.meaning_font.render(count_text, True, game.gray_color)
+    count_surface = game.text_cache.render(game.meaning_font, count_text, game.gray_color)
     count_rect = count_surface.get_rect(center=(game.width // 2, 80))
     game.screen.blit(count_surface, count_rect)
     
     # Scrolling hint if there are many items
     if len(game.incorrect_answers) > 7:
         hint_text = "(Scroll to see all)"
-        hint_surface = game.score_font.render(hint_text, True, game.gray_color)
+        hint_surface = game.text_cache.render(game.score_font, hint_text, game.gray_color)
         hint_rect = hint_surface.get_rect(center=(game.width // 2, 100))
         game.screen.blit(hint_surface, hint_rect)
     
-    # Create a scrollable area
-    scroll_area_top = 120
-    scroll_area_bottom = 560
-    scroll_area_height = scroll_area_bottom - scroll_area_top
-    
-    # Calculate total content height
-    item_height = 60
-    total_content_height = len(game.incorrect_answers) * item_height
-    
-    # Clamp scroll position
+    scroll_area_height = SCROLL_AREA_BOTTOM - SCROLL_AREA_TOP
+    total_content_height = len(game.incorrect_answers) * ITEM_HEIGHT
     max_scroll = max(0, total_content_height - scroll_area_height)
-    game.review_scroll = max(0, min(game.review_scroll, max_scroll))
-    
-    # Cache rendered content
-    if (game.review_cache is None or 
-        abs(game.review_cache_scroll - game.review_scroll) > 1):
-        
-        game.review_cache_scroll = game.review_scroll
-        
-        # Create a clipping surface for the scrollable area
-        scroll_surface = pygame.Surface((game.width, scroll_area_height))
-        scroll_surface.fill(game.bg_color)
-        
-        # Pre-render fonts
-        if not hasattr(game, '_review_fonts_cached'):
-            game._review_word_font = pygame.font.SysFont(
-                game.reading_font.get_name() if hasattr(game.reading_font, 'get_name') else 'msgothic', 36)
-            game._review_reading_font = pygame.font.SysFont(
-                game.reading_font.get_name() if hasattr(game.reading_font, 'get_name') else 'msgothic', 24)
-            game._review_fonts_cached = True
-        
-        # Draw items onto the scroll surface
-        for i, ans in enumerate(game.incorrect_answers):
-            y_pos = i * item_height - game.review_scroll
-            
-            # Only draw if visible
-            if -item_height < y_pos < scroll_area_height + item_height:
-                # Word
-                word_surface = game._review_word_font.render(ans['word'], True, game.text_color)
-                word_rect = word_surface.get_rect(center=(game.width // 2, y_pos + 20))
-                scroll_surface.blit(word_surface, word_rect)
-                
-                # Correct reading
-                correct_surface = game._review_reading_font.render(f"✓ {ans['correct_reading']}", True, game.correct_color)
-                correct_rect = correct_surface.get_rect(center=(game.width // 2, y_pos + 45))
-                scroll_surface.blit(correct_surface, correct_rect)
-                
-                # Your answer
-                if ans['your_answer']:
-                    your_surface = game._review_reading_font.render(f"✗ {ans['your_answer']}", True, game.incorrect_color)
-                    your_rect = your_surface.get_rect(center=(game.width // 2 + 150, y_pos + 45))
-                    scroll_surface.blit(your_surface, your_rect)
-        
-        game.review_cache = scroll_surface
     
-    # Blit the cached scroll surface
-    game.screen.blit(game.review_cache, (0, scroll_area_top))
+    # Blit only the rows that intersect the scroll area
+    first = game.review_scroll // ITEM_HEIGHT
+    last = min(len(game.incorrect_answers), (game.review_scroll + scroll_area_height) // ITEM_HEIGHT + 1)
+    previous_clip = game.screen.get_clip()
+    game.screen.set_clip(pygame.Rect(0, SCROLL_AREA_TOP, game.width, scroll_area_height))
+    game.screen.blits(
+        [(screen.row_surface(i), (0, SCROLL_AREA_TOP + i * ITEM_HEIGHT - game.review_scroll))
+         for i in range(first, last)],
+        doreturn=False
+    )
+    game.screen.set_clip(previous_clip)
     
     # Draw scrollbar if needed
     if total_content_height > scroll_area_height:
         scrollbar_x = game.width - 15
         scrollbar_height = max(30, int((scroll_area_height / total_content_height) * scroll_area_height))
-        scrollbar_y = scroll_area_top + int((game.review_scroll / max_scroll) * (scroll_area_height - scrollbar_height))
+        scrollbar_y = SCROLL_AREA_TOP + int((game.review_scroll / max_scroll) * (scroll_area_height - scrollbar_height))
         
-        pygame.draw.rect(game.screen, game.gray_color, 
-                       (scrollbar_x, scrollbar_y, 10, scrollbar_height), 
+        pygame.draw.rect(game.screen, game.gray_color,
+                       (scrollbar_x, scrollbar_y, 10, scrollbar_height),
                        border_radius=5)
     
-    # Back to menu button
-    game.button_rect = pygame.Rect(game.width // 2 - 100, 580, 200, 50)
-    button_color = game.button_hover_color if game.button_hover else game.button_color
-    pygame.draw.rect(game.screen, button_color, game.button_rect, border_radius=10)
-    button_surface = game.meaning_font.render("← Back to Menu", True, (255, 255, 255))
-    button_text_rect = button_surface.get_rect(center=game.button_rect.center)
-    game.screen.blit(button_surface, button_text_rect)
+    # Back to menu and Retry Missed buttons
+    screen.draw_buttons(game.screen)
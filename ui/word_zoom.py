@@ -0,0 +1,93 @@
+"""
+Pre-rasterized word zoom.
+
+The quiz word is rendered once per card at its full size. The zoom-in
+animation then uses scaled copies, quantized to a few pixel-size buckets
+and cached, instead of building and rasterizing a font every frame.
+"""
+
+import pygame
+
+from config import WORD_ZOOM_QUALITY, WORD_ZOOM_SIZE_STEP
+
+
+class WordZoomRenderer:
+    """Caches the current word at its base size and at zoomed sizes."""
+
+    def __init__(self, font, base_size, quality=WORD_ZOOM_QUALITY, size_step=WORD_ZOOM_SIZE_STEP, glyphs=None):
+        """
+        Args:
+            font: Font to render the word with, at base_size
+            base_size: Point size of font; the size a zoom factor of 1.0 maps to
+            quality: 'smooth' for smoothscale, 'fast' for nearest-neighbour scaling
+            size_step: Size bucket width in points; larger means fewer cached sizes
+            glyphs: GlyphAtlas to compose the word from instead of rendering with font
+        """
+        self.font = font
+        self.base_size = base_size
+        self.quality = quality
+        self.size_step = max(1, size_step)
+        self.glyphs = glyphs
+        self._text = None
+        self._base = {}    # color -> full-size surface
+        self._scaled = {}  # (color, size) -> scaled surface
+
+    def prepare(self, text, colors=()):
+        """
+        Switch to a new word and pre-render it.
+
+        Args:
+            text: Word to display
+            colors: Colors to rasterize up front
+        """
+        if text != self._text:
+            self._text = text
+            self._base.clear()
+            self._scaled.clear()
+        for color in colors:
+            self._get_base(tuple(color))
+
+    def render(self, text, size, color):
+        """
+        Get the word at a point size.
+
+        Args:
+            text: Word to display
+            size: Point size to show it at
+            color: RGB color
+
+        Returns:
+            pygame.Surface, shared and not to be modified
+        """
+        if text != self._text:
+            self.prepare(text)
+        color = tuple(color)
+        base = self._get_base(color)
+
+        size = int(round(size / self.size_step)) * self.size_step
+        if size >= self.base_size:
+            return base
+        size = max(self.size_step, size)
+
+        key = (color, size)
+        surface = self._scaled.get(key)
+        if surface is None:
+            scale = size / self.base_size
+            dims = (max(1, int(base.get_width() * scale)), max(1, int(base.get_height() * scale)))
+            if self.quality == 'smooth':
+                surface = pygame.transform.smoothscale(base, dims)
+            else:
+                surface = pygame.transform.scale(base, dims)
+            self._scaled[key] = surface
+        return surface
+
+    def _get_base(self, color):
+        """Full-size rendering of the current word in a color."""
+        surface = self._base.get(color)
+        if surface is None:
+            if self.glyphs is not None:
+                surface = self.glyphs.render(self._text, self.base_size, color)
+            else:
+                surface = self.font.render(self._text, True, color)
+            self._base[color] = surface
+        return surface
@@ -2,7 +2,6 @@
 AnkiConnect API integration.
 """
 
-import requests
 from config import ANKI_CONNECT_URL
 
 
@@ -17,6 +16,9 @@ def anki_request(action, params=None):
     Returns:
         JSON response from AnkiConnect
     """
+    # requests is slow to import; load it when Anki is first contacted
+    import requests
+    
     return requests.post(ANKI_CONNECT_URL, json={
         "action": action,
         "version": 6,
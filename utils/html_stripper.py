@@ -0,0 +1,35 @@
+"""
+HTML stripping for Anki card fields.
+"""
+
+from html.parser import HTMLParser
+
+
+class HTMLStripper(HTMLParser):
+    """HTML parser that strips all tags and returns plain text."""
+    
+    def __init__(self):
+        super().__init__()
+        self.reset()
+        self.strict = False
+        self.convert_charrefs = True
+        self.text = []
+        self.skip_tags = set()  # Track tags to skip content from
+    
+    def handle_starttag(self, tag, attrs):
+        # Skip content in style and script tags
+        if tag.lower() in ('style', 'script'):
+            self.skip_tags.add(tag.lower())
+    
+    def handle_endtag(self, tag):
+        # Resume processing after style/script tags
+        if tag.lower() in self.skip_tags:
+            self.skip_tags.discard(tag.lower())
+    
+    def handle_data(self, data):
+        # Only add data if we're not inside a skip tag
+        if not self.skip_tags:
+            self.text.append(data)
+    
+    def get_data(self):
+        return ''.join(self.text)
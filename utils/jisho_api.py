@@ -2,8 +2,6 @@
 Jisho.org API integration.
 """
 
-import requests
-
 
 def get_jisho_info(word):
     """
@@ -15,6 +13,8 @@ def get_jisho_info(word):
     Returns:
         Dict with 'word', 'readings' (list), and 'meanings', or None if not found
     """
+    import requests
+    
     url = f"https://jisho.org/api/v1/search/words?keyword={word}"
     try:
         resp = requests.get(url)
@@ -1,30 +1,174 @@
 """
 Sound generation utilities for game audio effects.
+
+Tones are synthesized with NumPy in whatever sample format the mixer was
+opened with, shaped by a short attack/release envelope so they don't click,
+and cached by SoundBank the first time each one is played.
 """
 
-import math
+import numpy as np
 import pygame
 
+from config import SOUND_VOLUME, SOUND_ATTACK, SOUND_RELEASE, STREAK_LADDER_STEPS
+
+
+# Named cues: (frequencies in Hz, duration in seconds)
+CUES = {
+    'correct': ((523,), 0.1),     # C note
+    'incorrect': ((200,), 0.15),  # Low note
+    'streak': ((659,), 0.08),     # E note
+}
+STREAK_LADDER_START = 5  # Streak at which the streak cue starts
+STREAK_CHORD_EVERY = 5  # Streak milestones that play a major chord instead
+SEMITONE = 2 ** (1 / 12)
+
+_INT_TYPES = {8: np.int8, 16: np.int16}
+_UINT_TYPES = {8: np.uint8, 16: np.uint16}
+
+
+def synthesize(frequencies, duration, sample_rate, volume=SOUND_VOLUME,
+               attack=SOUND_ATTACK, release=SOUND_RELEASE):
+    """
+    Synthesize a tone or chord.
+
+    Args:
+        frequencies: Frequencies in Hz, mixed at equal level
+        duration: Duration in seconds
+        sample_rate: Samples per second
+        volume: Peak amplitude, 0.0-1.0
+        attack: Fade-in time in seconds
+        release: Fade-out time in seconds
+
+    Returns:
+        float32 numpy array of mono samples in -1.0..1.0
+    """
+    n_samples = int(round(duration * sample_rate))
+    t = np.arange(n_samples, dtype=np.float32) / sample_rate
+    wave = np.zeros(n_samples, dtype=np.float32)
+    for frequency in frequencies:
+        wave += np.sin(2.0 * np.pi * frequency * t)
+    wave *= volume / max(1, len(frequencies))
+
+    n_attack = min(n_samples, int(attack * sample_rate))
+    if n_attack:
+        wave[:n_attack] *= np.linspace(0.0, 1.0, n_attack, endpoint=False, dtype=np.float32)
+    n_release = min(n_samples - n_attack, int(release * sample_rate))
+    if n_release:
+        wave[n_samples - n_release:] *= np.linspace(1.0, 0.0, n_release, dtype=np.float32)
+    return wave
+
+
+def to_mixer_samples(wave, mixer_format):
+    """
+    Convert mono samples to the mixer's sample format and channel count.
+
+    Args:
+        wave: float numpy array in -1.0..1.0
+        mixer_format: (frequency, size, channels) from pygame.mixer.get_init()
+
+    Returns:
+        numpy array accepted by pygame.sndarray.make_sound
+    """
+    _, size, channels = mixer_format
+    if abs(size) == 32:
+        # pygame reports SDL's float32 format as -32
+        samples = wave.astype(np.float32)
+    elif size < 0:
+        peak = 2 ** (-size - 1) - 1
+        samples = (wave * peak).astype(_INT_TYPES[-size])
+    else:
+        peak = 2 ** (size - 1) - 1
+        samples = (wave * peak + peak + 1).astype(_UINT_TYPES[size])
+
+    if channels > 1:
+        samples = np.repeat(samples[:, np.newaxis], channels, axis=1)
+    return np.ascontiguousarray(samples)
+
+
+def make_sound(frequencies, duration):
+    """
+    Synthesize a tone for the current mixer.
+
+    Args:
+        frequencies: Frequencies in Hz
+        duration: Duration in seconds
+
+    Returns:
+        pygame.Sound object, or None if the mixer isn't available
+    """
+    mixer_format = pygame.mixer.get_init()
+    if mixer_format is None:
+        return None
+    try:
+        wave = synthesize(frequencies, duration, mixer_format[0])
+        return pygame.sndarray.make_sound(to_mixer_samples(wave, mixer_format))
+    except (pygame.error, KeyError, ValueError):
+        return None
+
 
 def generate_sound(frequency, duration=0.1):
     """
     Generate a simple beep sound.
-    
+
     Args:
         frequency: Frequency of the sound in Hz
         duration: Duration of the sound in seconds
-        
+
     Returns:
         pygame.Sound object or None if generation fails
     """
-    try:
-        sample_rate = 22050
-        n_samples = int(round(duration * sample_rate))
-        buf = []
-        for i in range(n_samples):
-            value = int(32767.0 * math.sin(2.0 * math.pi * frequency * i / sample_rate))
-            buf.append([value, value])
-        sound = pygame.sndarray.make_sound(buf)
-        return sound
-    except:
-        return None
+    return make_sound((frequency,), duration)
+
+
+class SoundBank:
+    """Game sound cues, synthesized on first use and kept in memory."""
+
+    def __init__(self):
+        self._sounds = {}  # (frequencies, duration, mixer format) -> Sound or None
+
+    def tone(self, frequencies, duration):
+        """
+        Get a cached tone or chord.
+
+        Args:
+            frequencies: Frequencies in Hz
+            duration: Duration in seconds
+
+        Returns:
+            pygame.Sound, or None without a mixer
+        """
+        key = (tuple(frequencies), duration, pygame.mixer.get_init())
+        if key not in self._sounds:
+            self._sounds[key] = make_sound(frequencies, duration)
+        return self._sounds[key]
+
+    def play(self, cue):
+        """
+        Play a named cue from CUES.
+
+        Args:
+            cue: Cue name
+        """
+        sound = self.tone(*CUES[cue])
+        if sound:
+            sound.play()
+
+    def play_streak(self, streak):
+        """
+        Play the streak cue. It climbs a semitone per streak, up to
+        STREAK_LADDER_STEPS, and every STREAK_CHORD_EVERY streaks it is a
+        major chord.
+
+        Args:
+            streak: Current answer streak
+        """
+        (root,), duration = CUES['streak']
+        step = min(max(0, streak - STREAK_LADDER_START), STREAK_LADDER_STEPS)
+        frequency = round(root * SEMITONE ** step, 2)
+        if streak % STREAK_CHORD_EVERY == 0:
+            frequencies = (frequency, round(frequency * SEMITONE ** 4, 2), round(frequency * SEMITONE ** 7, 2))
+            sound = self.tone(frequencies, duration * 2)
+        else:
+            sound = self.tone((frequency,), duration)
+        if sound:
+            sound.play()
@@ -3,40 +3,9 @@ Text processing utilities for Japanese text.
 """
 
 import re
-from html.parser import HTMLParser
 from config import ROMAJI_TO_HIRAGANA
 
 
-class HTMLStripper(HTMLParser):
-    """HTML parser that strips all tags and returns plain text."""
-    
-    def __init__(self):
-        super().__init__()
-        self.reset()
-        self.strict = False
-        self.convert_charrefs = True
-        self.text = []
-        self.skip_tags = set()  # Track tags to skip content from
-    
-    def handle_starttag(self, tag, attrs):
-        # Skip content in style and script tags
-        if tag.lower() in ('style', 'script'):
-            self.skip_tags.add(tag.lower())
-    
-    def handle_endtag(self, tag):
-        # Resume processing after style/script tags
-        if tag.lower() in self.skip_tags:
-            self.skip_tags.discard(tag.lower())
-    
-    def handle_data(self, data):
-        # Only add data if we're not inside a skip tag
-        if not self.skip_tags:
-            self.text.append(data)
-    
-    def get_data(self):
-        return ''.join(self.text)
-
-
 def strip_html(html):
     """
     Remove HTML tags and return plain text.
@@ -47,6 +16,9 @@ def strip_html(html):
     Returns:
         Plain text string
     """
+    # html.parser is only loaded once cards need cleaning
+    from utils.html_stripper import HTMLStripper
+    
     s = HTMLStripper()
     s.feed(html)
     return s.get_data().strip()